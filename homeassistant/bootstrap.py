@@ -87,7 +87,7 @@ from .helpers import (
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
-from .helpers.storage import get_internal_store_manager
+from .helpers.storage import Store, get_internal_store_manager
 from .helpers.system_info import async_get_system_info, is_official_image
 from .helpers.typing import ConfigType
 from .setup import (
@@ -132,6 +132,12 @@ STAGE_2_TIMEOUT = 300
 WRAP_UP_TIMEOUT = 300
 COOLDOWN_TIME = 60
 
+# The setup times of the last start are stored so the integrations
+# that took the longest can be imported ahead of their stage
+SETUP_PROFILE_STORAGE_KEY = "core.setup_profile"
+SETUP_PROFILE_STORAGE_VERSION = 1
+SETUP_PROFILE_SAVE_DELAY = 60
+PREIMPORT_SLOWEST_INTEGRATIONS = 20
 
 DEBUGGER_INTEGRATIONS = {"debugpy"}
 
@@ -251,6 +257,7 @@ PRELOAD_STORAGE = [
     "assist_pipeline.pipelines",
     "core.analytics",
     "auth_module.totp",
+    SETUP_PROFILE_STORAGE_KEY,
 ]
 
 
@@ -434,6 +441,7 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
         create_eager_task(label_registry.async_load(hass)),
         hass.async_add_executor_job(_init_blocking_io_modules_in_executor),
         create_eager_task(template.async_load_custom_templates(hass)),
+        create_eager_task(template.async_load_bytecode_cache(hass)),
         create_eager_task(restore_state.async_load(hass)),
         create_eager_task(hass.config_entries.async_initialize()),
         create_eager_task(async_get_system_info(hass)),
@@ -1008,6 +1016,17 @@ async def _async_set_up_integrations(
 
     stage_2_domains = domains_to_setup - stage_1_domains
 
+    setup_profile_store = Store[dict[str, float]](
+        hass, SETUP_PROFILE_STORAGE_VERSION, SETUP_PROFILE_STORAGE_KEY
+    )
+    if setup_profile := await setup_profile_store.async_load():
+        _async_preimport_slowest_integrations(
+            hass,
+            setup_profile,
+            stage_2_domains.difference(*(group for _, group in pre_stage_domains)),
+            integration_cache,
+        )
+
     for name, domain_group in pre_stage_domains:
         if domain_group:
             stage_2_domains -= domain_group
@@ -1068,9 +1087,66 @@ async def _async_set_up_integrations(
 
     watcher.async_stop()
 
+    setup_profile_store.async_delay_save(
+        partial(_setup_profile_to_save, hass), SETUP_PROFILE_SAVE_DELAY
+    )
+
     if _LOGGER.isEnabledFor(logging.DEBUG):
         setup_time = async_get_setup_timings(hass)
         _LOGGER.debug(
             "Integration setup times: %s",
             dict(sorted(setup_time.items(), key=itemgetter(1), reverse=True)),
         )
+
+
+@core.callback
+def _async_preimport_slowest_integrations(
+    hass: core.HomeAssistant,
+    setup_profile: dict[str, float],
+    domains: set[str],
+    integration_cache: dict[str, loader.Integration],
+) -> None:
+    """Start importing the integrations that were slowest to set up last time.
+
+    The import executor only runs one import at a time to avoid import
+    deadlocks, so the imports are queued one after another in the background
+    while the earlier stages are set up instead of all at once, which would
+    delay the imports those stages are waiting for.
+    """
+    slowest_domains = sorted(
+        (domain for domain in domains if domain in setup_profile),
+        key=setup_profile.__getitem__,
+        reverse=True,
+    )[:PREIMPORT_SLOWEST_INTEGRATIONS]
+    integrations = [
+        integration
+        for domain in slowest_domains
+        if (integration := integration_cache.get(domain)) is not None
+        and integration.import_executor
+    ]
+    if integrations:
+        hass.async_create_background_task(
+            _async_preimport_integrations(integrations),
+            "preimport slowest integrations",
+            eager_start=True,
+        )
+
+
+async def _async_preimport_integrations(
+    integrations: list[loader.Integration],
+) -> None:
+    """Import integrations one at a time."""
+    for integration in integrations:
+        try:
+            await integration.async_get_component()
+        except ImportError:
+            # The error will be reported when the integration is set up
+            _LOGGER.debug("Failed to preimport %s", integration.domain, exc_info=True)
+
+
+def _setup_profile_to_save(hass: core.HomeAssistant) -> dict[str, float]:
+    """Return the setup times of this start to save."""
+    return {
+        domain: round(setup_time, 3)
+        for domain, setup_time in async_get_setup_timings(hass).items()
+    }
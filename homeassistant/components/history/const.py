@@ -1,7 +1,15 @@
 """History integration constants."""
 
+from datetime import timedelta
+
 DOMAIN = "history"
 
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# The maximum number of buckets a downsampled history request can ask for
+MAX_HISTORY_BUCKETS = 10000
+
+# The size of the time window of each historical chunk sent by history/stream
+HISTORY_STREAM_CHUNK_TIME = timedelta(days=1)
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from datetime import datetime as dt
+import math
+from typing import Any
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant
 
 
@@ -31,3 +34,49 @@ def has_recorder_run_after(hass: HomeAssistant, run_time: dt) -> bool:
     return run_time >= process_timestamp(
         get_instance(hass).recorder_runs_manager.first.start
     )
+
+
+def reduce_compressed_states_to_buckets(
+    states: Iterable[dict[str, Any]], start_time_ts: float, bucket_width: float
+) -> list[dict[str, Any]]:
+    """Reduce compressed states to one entry per time bucket.
+
+    States must be sorted by last_updated. Each bucket contains the
+    timestamp the bucket starts at and the last state in the bucket.
+    If any state in the bucket is numeric, the min, max and mean of
+    the numeric states are included as well. Buckets without any
+    states are omitted.
+    """
+    buckets: list[dict[str, Any]] = []
+    bucket: dict[str, Any] = {}
+    bucket_index = -1
+    total = 0.0
+    count = 0
+    for state in states:
+        last_updated_ts = state[COMPRESSED_STATE_LAST_UPDATED]
+        index = max(0, int((last_updated_ts - start_time_ts) // bucket_width))
+        if index != bucket_index:
+            if count:
+                bucket["mean"] = total / count
+            bucket_index = index
+            bucket = {"start": start_time_ts + index * bucket_width}
+            buckets.append(bucket)
+            total = 0.0
+            count = 0
+        bucket["last"] = value = state[COMPRESSED_STATE_STATE]
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            continue
+        if not math.isfinite(number):
+            continue
+        if count:
+            bucket["min"] = min(bucket["min"], number)
+            bucket["max"] = max(bucket["max"], number)
+        else:
+            bucket["min"] = bucket["max"] = number
+        total += number
+        count += 1
+    if count:
+        bucket["mean"] = total / count
+    return buckets
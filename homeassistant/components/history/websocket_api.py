@@ -38,8 +38,17 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
-from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
+from .const import (
+    EVENT_COALESCE_TIME,
+    HISTORY_STREAM_CHUNK_TIME,
+    MAX_HISTORY_BUCKETS,
+    MAX_PENDING_HISTORY_STATES,
+)
+from .helpers import (
+    entities_may_have_state_changes_after,
+    has_recorder_run_after,
+    reduce_compressed_states_to_buckets,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -72,25 +81,30 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    bucket_width: float | None,
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
-    return json_bytes(
-        messages.result_message(
-            msg_id,
-            history.get_significant_states(
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                None,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-                True,
-            ),
-        )
+    states = history.get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response or bucket_width is not None,
+        no_attributes or bucket_width is not None,
+        True,
     )
+    if bucket_width is not None:
+        start_time_ts = start_time.timestamp()
+        states = {
+            entity_id: reduce_compressed_states_to_buckets(
+                cast(list[dict[str, Any]], entity_states), start_time_ts, bucket_width
+            )
+            for entity_id, entity_states in states.items()
+        }
+    return json_bytes(messages.result_message(msg_id, states))
 
 
 @websocket_api.websocket_command(
@@ -103,6 +117,12 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Exclusive("buckets", "bucketing"): vol.All(
+            int, vol.Range(min=1, max=MAX_HISTORY_BUCKETS)
+        ),
+        vol.Exclusive("bucket_width", "bucketing"): vol.All(
+            vol.Coerce(float), vol.Range(min=1)
+        ),
     }
 )
 @websocket_api.async_response
@@ -155,6 +175,15 @@ async def ws_get_history_during_period(
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    bucket_width: float | None = msg.get("bucket_width")
+    if buckets := msg.get("buckets"):
+        bucket_width = (
+            (end_time or dt_util.utcnow()) - start_time
+        ).total_seconds() / buckets
+        if bucket_width <= 0:
+            connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+            return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_get_significant_states,
@@ -167,6 +196,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            bucket_width,
         )
     )
 
@@ -277,24 +307,42 @@ async def _async_send_historical_states(
     no_attributes: bool,
     send_empty: bool,
 ) -> dt | None:
-    """Fetch history significant_states and send them to the client."""
+    """Fetch history significant_states and send them to the client.
+
+    Long windows are fetched and sent in time-ordered chunks of
+    HISTORY_STREAM_CHUNK_TIME so the client can start rendering
+    right away and we never hold the whole result set in memory.
+    """
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
-        _generate_historical_response,
-        hass,
-        msg_id,
-        start_time,
-        end_time,
-        entity_ids,
-        include_start_time_state,
-        significant_changes_only,
-        minimal_response,
-        no_attributes,
-        send_empty,
-    )
-    if payload:
-        connection.send_message(payload)
-    return last_time_dt if last_time_ts != 0 else None
+    last_sent_time: dt | None = None
+    chunk_start = start_time
+    while True:
+        chunk_end = min(chunk_start + HISTORY_STREAM_CHUNK_TIME, end_time)
+        is_last_chunk = chunk_end == end_time
+        last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+            _generate_historical_response,
+            hass,
+            msg_id,
+            chunk_start,
+            # The query excludes both ends of the window, so extend
+            # all but the last chunk by one microsecond to include
+            # states that happened exactly on the chunk boundary
+            end_time if is_last_chunk else chunk_end + timedelta(microseconds=1),
+            entity_ids,
+            # Only the first chunk needs the state at the start time
+            include_start_time_state and chunk_start == start_time,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            send_empty and is_last_chunk and last_sent_time is None,
+        )
+        if payload:
+            connection.send_message(payload)
+        if last_time_ts != 0:
+            last_sent_time = last_time_dt
+        if is_last_chunk or msg_id not in connection.subscriptions:
+            return last_sent_time
+        chunk_start = chunk_end
 
 
 def _history_compressed_state(state: State, no_attributes: bool) -> dict[str, Any]:
@@ -26,6 +26,7 @@ ABBREVIATIONS = {
     "clr_temp_stat_t": "color_temp_state_topic",
     "clr_temp_tpl": "color_temp_template",
     "clr_temp_val_tpl": "color_temp_value_template",
+    "cls_tm": "coalesce_time",
     "cmd_off_tpl": "command_off_template",
     "cmd_on_tpl": "command_on_template",
     "cmd_t": "command_topic",
@@ -207,6 +207,7 @@ def async_subscribe_internal(
     qos: int = DEFAULT_QOS,
     encoding: str | None = DEFAULT_ENCODING,
     job_type: HassJobType | None = None,
+    coalesce_time: float | None = None,
 ) -> CALLBACK_TYPE:
     """Subscribe to an MQTT topic.
 
@@ -214,6 +215,9 @@ def async_subscribe_internal(
     and may change at any time. It should not be considered
     a stable API.
 
+    If coalesce_time is set, only the latest message received on each
+    topic within coalesce_time seconds is delivered to msg_callback.
+
     Call the return value to unsubscribe.
     """
     try:
@@ -234,6 +238,10 @@ def async_subscribe_internal(
             translation_domain=DOMAIN,
             translation_placeholders={"topic": topic},
         )
+    if coalesce_time:
+        return client.async_subscribe(
+            topic, msg_callback, qos, encoding, job_type, coalesce_time=coalesce_time
+        )
     return client.async_subscribe(topic, msg_callback, qos, encoding, job_type)
 
 
@@ -267,10 +275,10 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
+    coalesce_time: float | None = None
 
 
 class MqttClientSetup:
@@ -377,11 +385,16 @@ class MQTT:
             set
         )
         self._wildcard_subscriptions: set[Subscription] = set()
+        self._wildcard_subscriptions_trie = _WildcardSubscriptionTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
         # which has subscribed messages.
         self._retained_topics: defaultdict[Subscription, set[str]] = defaultdict(set)
+        # The latest message per subscription and topic of subscriptions with a
+        # coalesce_time, and the timers that deliver them
+        self._coalesced_messages: dict[tuple[Subscription, str], ReceiveMessage] = {}
+        self._coalesce_timers: dict[tuple[Subscription, str], asyncio.TimerHandle] = {}
         self.connected = False
         self._ha_started = asyncio.Event()
         self._cleanup_on_unload: list[Callable[[], None]] = []
@@ -755,6 +768,7 @@ class MQTT:
             self._simple_subscriptions[subscription.topic].add(subscription)
         else:
             self._wildcard_subscriptions.add(subscription)
+            self._wildcard_subscriptions_trie.add(subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
@@ -773,6 +787,7 @@ class MQTT:
                     del simple_subscriptions[topic]
             else:
                 self._wildcard_subscriptions.remove(subscription)
+                self._wildcard_subscriptions_trie.remove(subscription)
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError("Can't remove subscription twice") from exc
 
@@ -817,6 +832,7 @@ class MQTT:
         qos: int,
         encoding: str | None = None,
         job_type: HassJobType | None = None,
+        coalesce_time: float | None = None,
     ) -> Callable[[], None]:
         """Set up a subscription to a topic with the provided qos."""
         if not isinstance(topic, str):
@@ -835,9 +851,9 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
-
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(
+            topic, is_simple_match, job, qos, encoding, coalesce_time
+        )
         self._async_track_subscription(subscription)
         self._matching_subscriptions.cache_clear()
 
@@ -854,6 +870,10 @@ class MQTT:
         self._matching_subscriptions.cache_clear()
         if subscription in self._retained_topics:
             del self._retained_topics[subscription]
+        if subscription.coalesce_time:
+            for key in [key for key in self._coalesce_timers if key[0] is subscription]:
+                self._coalesce_timers.pop(key).cancel()
+                del self._coalesced_messages[key]
         # Only unsubscribe if currently connected
         if self.connected:
             self._async_unsubscribe(subscription.topic)
@@ -1049,13 +1069,8 @@ class MQTT:
         subscriptions: list[Subscription] = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        if self._wildcard_subscriptions:
+            subscriptions.extend(self._wildcard_subscriptions_trie.match(topic))
         return subscriptions
 
     @callback
@@ -1126,20 +1141,55 @@ class MQTT:
                 msg_cache_by_subscription_topic[subscription_topic] = receive_msg
             else:
                 receive_msg = msg_cache_by_subscription_topic[subscription_topic]
-            job = subscription.job
-            if job.job_type is HassJobType.Callback:
-                # We do not wrap Callback jobs in catch_log_exception since
-                # its expensive and we have to do it 2x for every entity
-                try:
-                    job.target(receive_msg)
-                except Exception:  # noqa: BLE001
-                    log_exception(
-                        partial(self._exception_message, job.target, receive_msg)
-                    )
-            else:
-                self.hass.async_run_hass_job(job, receive_msg)
+            if subscription.coalesce_time:
+                self._async_coalesce_message(subscription, receive_msg)
+                continue
+            self._async_run_subscription_job(subscription.job, receive_msg)
         self._mqtt_data.state_write_requests.process_write_state_requests(msg)
 
+    @callback
+    def _async_run_subscription_job(
+        self,
+        job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None],
+        receive_msg: ReceiveMessage,
+    ) -> None:
+        """Run the job of a subscription for a received message."""
+        if job.job_type is HassJobType.Callback:
+            # We do not wrap Callback jobs in catch_log_exception since
+            # its expensive and we have to do it 2x for every entity
+            try:
+                job.target(receive_msg)
+            except Exception:  # noqa: BLE001
+                log_exception(partial(self._exception_message, job.target, receive_msg))
+        else:
+            self.hass.async_run_hass_job(job, receive_msg)
+
+    @callback
+    def _async_coalesce_message(
+        self, subscription: Subscription, receive_msg: ReceiveMessage
+    ) -> None:
+        """Hold a message until the coalesce window of its topic ends.
+
+        Messages received on the same topic while the window is open
+        replace the held message, so only the latest one is delivered.
+        """
+        key = (subscription, receive_msg.topic)
+        self._coalesced_messages[key] = receive_msg
+        if key not in self._coalesce_timers:
+            if TYPE_CHECKING:
+                assert subscription.coalesce_time
+            self._coalesce_timers[key] = self.loop.call_later(
+                subscription.coalesce_time, self._async_deliver_coalesced_message, key
+            )
+
+    @callback
+    def _async_deliver_coalesced_message(self, key: tuple[Subscription, str]) -> None:
+        """Deliver the latest message held for a subscription and topic."""
+        del self._coalesce_timers[key]
+        receive_msg = self._coalesced_messages.pop(key)
+        self._async_run_subscription_job(key[0].job, receive_msg)
+        self._mqtt_data.state_write_requests.process_write_state_requests(receive_msg)
+
     @callback
     def _async_mqtt_on_callback(
         self,
@@ -1249,11 +1299,78 @@ class MQTT:
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
 
 
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
+class _TopicTrieNode:
+    """A topic level in the wildcard subscription trie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode] = {}
+        self.subscriptions: set[Subscription] = set()
+
 
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
+class _WildcardSubscriptionTrie:
+    """Index wildcard subscriptions by topic level.
 
-    return lambda topic: next(matcher.iter_match(topic), False)
+    Each level of a subscription topic, including the `+` and `#`
+    wildcards, is a node in the trie. Matching a topic walks its levels
+    and only follows the literal and `+` children of each node, so the
+    cost scales with the depth of the topic instead of the number of
+    wildcard subscriptions.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _TopicTrieNode()
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        node.subscriptions.add(subscription)
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription, raises KeyError if it was not added."""
+        path: list[tuple[_TopicTrieNode, str]] = []
+        node = self._root
+        for level in subscription.topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.subscriptions.remove(subscription)
+        # Prune the nodes that no longer lead to a subscription
+        for parent, level in reversed(path):
+            if node.subscriptions or node.children:
+                break
+            del parent.children[level]
+            node = parent
+
+    def match(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions matching a topic."""
+        levels = topic.split("/")
+        num_levels = len(levels)
+        # Topics starting with $ are not matched by
+        # wildcards on the first level (MQTT-4.7.2-1)
+        sys_topic = topic.startswith("$")
+        matches: list[Subscription] = []
+        stack = [(self._root, 0)]
+        while stack:
+            node, idx = stack.pop()
+            children = node.children
+            wildcards_allowed = idx or not sys_topic
+            # A multi level wildcard also matches its parent level
+            if wildcards_allowed and (multi_level := children.get("#")):
+                matches.extend(multi_level.subscriptions)
+            if idx == num_levels:
+                matches.extend(node.subscriptions)
+                continue
+            if child := children.get(levels[idx]):
+                stack.append((child, idx + 1))
+            if wildcards_allowed and (single_level := children.get("+")):
+                stack.append((single_level, idx + 1))
+        return matches
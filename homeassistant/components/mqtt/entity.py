@@ -1273,6 +1273,7 @@ class MqttEntity(
         msg_callback: Callable[[ReceiveMessage], None],
         tracked_attributes: set[str] | None,
         disable_encoding: bool = False,
+        coalesce_time: float | None = None,
     ) -> bool:
         """Add a subscription."""
         qos: int = self._config[CONF_QOS]
@@ -1292,6 +1293,7 @@ class MqttEntity(
                 "qos": qos,
                 "encoding": encoding,
                 "job_type": HassJobType.Callback,
+                "coalesce_time": coalesce_time,
             }
             return True
         return False
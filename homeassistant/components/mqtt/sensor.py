@@ -47,6 +47,7 @@ from .util import check_state_too_long
 
 _LOGGER = logging.getLogger(__name__)
 
+CONF_COALESCE_TIME = "coalesce_time"
 CONF_EXPIRE_AFTER = "expire_after"
 CONF_LAST_RESET_VALUE_TEMPLATE = "last_reset_value_template"
 CONF_SUGGESTED_DISPLAY_PRECISION = "suggested_display_precision"
@@ -63,6 +64,7 @@ DEFAULT_FORCE_UPDATE = False
 
 _PLATFORM_SCHEMA_BASE = MQTT_RO_SCHEMA.extend(
     {
+        vol.Optional(CONF_COALESCE_TIME): cv.positive_float,
         vol.Optional(CONF_DEVICE_CLASS): vol.Any(DEVICE_CLASSES_SCHEMA, None),
         vol.Optional(CONF_EXPIRE_AFTER): cv.positive_int,
         vol.Optional(CONF_FORCE_UPDATE, default=DEFAULT_FORCE_UPDATE): cv.boolean,
@@ -330,6 +332,7 @@ class MqttSensor(MqttEntity, RestoreSensor):
             CONF_STATE_TOPIC,
             self._state_message_received,
             {"_attr_native_value", "_attr_last_reset", "_expired"},
+            coalesce_time=self._config.get(CONF_COALESCE_TIME),
         )
 
     async def _subscribe_topics(self) -> None:
@@ -28,6 +28,7 @@ class EntitySubscription:
     encoding: str = "utf-8"
     entity_id: str | None
     job_type: HassJobType | None
+    coalesce_time: float | None = None
 
     def resubscribe_if_necessary(
         self, hass: HomeAssistant, other: EntitySubscription | None
@@ -65,6 +66,7 @@ class EntitySubscription:
             self.qos,
             self.encoding,
             self.job_type,
+            self.coalesce_time,
         )
 
     def _should_resubscribe(self, other: EntitySubscription | None) -> bool:
@@ -76,10 +78,12 @@ class EntitySubscription:
             self.topic,
             self.qos,
             self.encoding,
+            self.coalesce_time,
         ) != (
             other.topic,
             other.qos,
             other.encoding,
+            other.coalesce_time,
         )
 
 
@@ -115,6 +119,7 @@ def async_prepare_subscribe_topics(
             should_subscribe=None,
             entity_id=value.get("entity_id"),
             job_type=value.get("job_type"),
+            coalesce_time=value.get("coalesce_time"),
         )
         # Get the current subscription state
         current = current_subscriptions.pop(key, None)
@@ -17,16 +17,30 @@ from typing import Any, cast
 from lru import LRU
 import voluptuous as vol
 
-from homeassistant.components import persistent_notification
+from homeassistant.components import persistent_notification, websocket_api
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.const import (
+    CONF_SCAN_INTERVAL,
+    CONF_TYPE,
+    EVENT_HOMEASSISTANT_STOP,
+    Platform,
+)
+from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.helpers.template import (
+    TemplateRenderStats,
+    async_get_render_profile,
+    async_start_render_profiling,
+    async_stop_render_profiling,
+)
+
+from .const import DOMAIN, LOOP_MONITOR
+from .loop_monitor import COROUTINE_JOB_NOTE, LoopMonitor
 
-from .const import DOMAIN
+PLATFORMS = [Platform.SENSOR]
 
 SERVICE_START = "start"
 SERVICE_MEMORY = "memory"
@@ -40,6 +54,10 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_START_TEMPLATE_PROFILING = "start_template_profiling"
+SERVICE_STOP_TEMPLATE_PROFILING = "stop_template_profiling"
+SERVICE_START_JOB_TIMING = "start_job_timing"
+SERVICE_STOP_JOB_TIMING = "stop_job_timing"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -63,12 +81,18 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_START_TEMPLATE_PROFILING,
+    SERVICE_STOP_TEMPLATE_PROFILING,
+    SERVICE_START_JOB_TIMING,
+    SERVICE_STOP_JOB_TIMING,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
 
 DEFAULT_MAX_OBJECTS = 5
 
+MAX_LOGGED_TEMPLATES = 25
+
 CONF_ENABLED = "enabled"
 CONF_SECONDS = "seconds"
 CONF_MAX_OBJECTS = "max_objects"
@@ -85,6 +109,7 @@ async def async_setup_entry(  # noqa: C901
     """Set up Profiler from a config entry."""
     lock = asyncio.Lock()
     domain_data = hass.data[DOMAIN] = {}
+    monitor = domain_data[LOOP_MONITOR] = LoopMonitor(hass)
 
     async def _async_run_profile(call: ServiceCall) -> None:
         async with lock:
@@ -260,6 +285,67 @@ async def async_setup_entry(  # noqa: C901
                 if not handle.cancelled():
                     _LOGGER.critical("Scheduled: %s", handle)
 
+    @callback
+    def _async_start_template_profiling(call: ServiceCall) -> None:
+        if async_get_render_profile(hass) is not None:
+            raise HomeAssistantError("Template profiling already started")
+
+        async_start_render_profiling(hass)
+
+    @callback
+    def _async_stop_template_profiling(call: ServiceCall) -> None:
+        if async_get_render_profile(hass) is None:
+            raise HomeAssistantError("Template profiling not running")
+
+        profile = _sorted_render_profile(async_stop_render_profiling(hass))
+        for template, stats in profile[:MAX_LOGGED_TEMPLATES]:
+            _LOGGER.critical(
+                "Template render stats for %s: %s", template, stats.as_dict()
+            )
+
+        persistent_notification.async_create(
+            hass,
+            (
+                f"The render stats of the {min(len(profile), MAX_LOGGED_TEMPLATES)}"
+                " most expensive templates have been dumped to the log. See [the"
+                " logs](/config/logs) to review the stats."
+            ),
+            title="Template profiling completed",
+            notification_id="profile_template_renders",
+        )
+
+    @callback
+    def _async_start_job_timing(call: ServiceCall) -> None:
+        if monitor.timing_jobs:
+            raise HomeAssistantError("Job timing already started")
+
+        monitor.async_start_job_timing()
+
+    @callback
+    def _async_stop_job_timing(call: ServiceCall) -> None:
+        if not monitor.timing_jobs:
+            raise HomeAssistantError("Job timing not running")
+
+        monitor.async_stop_job_timing()
+        slowest_jobs = monitor.async_stats()["slowest_jobs"]
+        for job in slowest_jobs:
+            stats = dict(job)
+            _LOGGER.critical(
+                "Job run time stats for %s: %s", stats.pop("target"), stats
+            )
+        _LOGGER.critical(COROUTINE_JOB_NOTE)
+
+        persistent_notification.async_create(
+            hass,
+            (
+                f"The run time stats of the {len(slowest_jobs)} slowest jobs have"
+                " been dumped to the log. See [the logs](/config/logs) to review"
+                " the stats."
+            ),
+            title="Job timing completed",
+            notification_id="profile_job_timing",
+        )
+
     async def _async_asyncio_debug(call: ServiceCall) -> None:
         """Enable or disable asyncio debug."""
         enabled = call.data[CONF_ENABLED]
@@ -382,19 +468,117 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_START_TEMPLATE_PROFILING,
+        _async_start_template_profiling,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_STOP_TEMPLATE_PROFILING,
+        _async_stop_template_profiling,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_START_JOB_TIMING,
+        _async_start_job_timing,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_STOP_JOB_TIMING,
+        _async_stop_job_timing,
+    )
+
+    websocket_api.async_register_command(hass, websocket_template_render_stats)
+    websocket_api.async_register_command(hass, websocket_loop_stats)
+
+    monitor.async_start()
+
+    @callback
+    def _async_stop_loop_monitor(_: Event) -> None:
+        monitor.async_stop()
+
+    entry.async_on_unload(monitor.async_stop)
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop_loop_monitor)
+    )
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
     for service in SERVICES:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
     hass.data.pop(DOMAIN)
+    async_stop_render_profiling(hass)
     return True
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {vol.Required("type"): "profiler/template_render_stats"}
+)
+@callback
+def websocket_template_render_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the render stats of templates, most expensive first."""
+    if (profile := async_get_render_profile(hass)) is None:
+        connection.send_result(msg["id"], {"running": False, "templates": []})
+        return
+
+    connection.send_result(
+        msg["id"],
+        {
+            "running": True,
+            "templates": [
+                {"template": template, **stats.as_dict()}
+                for template, stats in _sorted_render_profile(profile)
+            ],
+        },
+    )
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "profiler/loop_stats"})
+@callback
+def websocket_loop_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the event loop lag, the slowest jobs and the time per integration."""
+    if (monitor := hass.data.get(DOMAIN, {}).get(LOOP_MONITOR)) is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Profiler is not set up"
+        )
+        return
+
+    connection.send_result(msg["id"], monitor.async_stats())
+
+
+def _sorted_render_profile(
+    profile: dict[str, TemplateRenderStats],
+) -> list[tuple[str, TemplateRenderStats]]:
+    """Return the render profile sorted by total render time."""
+    return sorted(profile.items(), key=lambda item: item[1].total_time, reverse=True)
+
+
 async def _async_generate_profile(hass: HomeAssistant, call: ServiceCall):
     # Imports deferred to avoid loading modules
     # in memory since usually only one part of this
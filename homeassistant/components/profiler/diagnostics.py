@@ -0,0 +1,23 @@
+"""Diagnostics support for the profiler."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, LOOP_MONITOR
+from .loop_monitor import LoopMonitor
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return the event loop time budget per integration and event type."""
+    monitor: LoopMonitor = hass.data[DOMAIN][LOOP_MONITOR]
+
+    return {
+        "loop": monitor.async_stats(),
+        "histograms": monitor.async_histograms(),
+    }
@@ -0,0 +1,286 @@
+"""Measure event loop lag and the time spent running jobs in the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+from homeassistant.core import Event, HassJob, HomeAssistant, callback
+
+# Sample the loop lag twice a second and keep the last 10 minutes of samples
+LAG_SAMPLE_INTERVAL = 0.5
+LAG_SAMPLES = 1200
+
+LAG_PERCENTILES = (50, 95, 99)
+
+MAX_REPORTED_JOBS = 25
+
+COROUTINE_JOB_NOTE = (
+    "Coroutine jobs are only timed up to their first await, the time their"
+    " tasks spend in the event loop afterwards is not attributed to the jobs"
+)
+
+# Upper bounds in seconds of the buckets of the job run time histograms,
+# the histograms cover the current and the previous window
+HISTOGRAM_BUCKETS = (0.0001, 0.001, 0.01, 0.1, 1.0)
+HISTOGRAM_LABELS = ("<0.1ms", "<1ms", "<10ms", "<100ms", "<1s", ">=1s")
+HISTOGRAM_WINDOW = 600
+
+_CORE = "homeassistant"
+
+
+class JobStats:
+    """Holds the time spent running a job target in the event loop."""
+
+    __slots__ = ("calls", "total_time", "max_time")
+
+    def __init__(self) -> None:
+        """Initialise."""
+        self.calls = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the stats."""
+        return {
+            "calls": self.calls,
+            "total_time": self.total_time,
+            "max_time": self.max_time,
+        }
+
+
+class RollingHistogram:
+    """Histogram of job run times over the current and the previous window."""
+
+    __slots__ = ("_current", "_previous", "_current_time", "_previous_time")
+
+    def __init__(self) -> None:
+        """Initialise."""
+        self._current = [0] * len(HISTOGRAM_LABELS)
+        self._previous = [0] * len(HISTOGRAM_LABELS)
+        self._current_time = 0.0
+        self._previous_time = 0.0
+
+    def add(self, run_time: float) -> None:
+        """Add the run time of a job."""
+        self._current[bisect_right(HISTOGRAM_BUCKETS, run_time)] += 1
+        self._current_time += run_time
+
+    def rotate(self) -> None:
+        """Start a new window, dropping the previous one."""
+        self._previous = self._current
+        self._previous_time = self._current_time
+        self._current = [0] * len(HISTOGRAM_LABELS)
+        self._current_time = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the histogram."""
+        return {
+            "total_time": self._current_time + self._previous_time,
+            "histogram": {
+                label: current + previous
+                for label, current, previous in zip(
+                    HISTOGRAM_LABELS, self._current, self._previous, strict=True
+                )
+            },
+        }
+
+
+class LoopMonitor:
+    """Sample the event loop lag and time the jobs run by hass.
+
+    The lag is the delay between the time a sample was scheduled to run
+    and the time the loop got around to running it. It is sampled for as
+    long as the monitor is running.
+
+    Timing jobs adds overhead to every job, so it is only done between
+    async_start_job_timing and async_stop_job_timing, using the job timer
+    hook of hass. The time of a job excludes the time of the jobs it ran
+    itself, so nested jobs are not counted twice. For coroutine jobs only
+    the time to create the task and run it up to its first await is
+    measured, the time the task spends in the loop afterwards is not
+    attributed to the job. The run times are also collected in rolling
+    histograms per integration and per event type for jobs that are run
+    with an event, such as event listeners.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialise."""
+        self._hass = hass
+        self._loop = hass.loop
+        self._lag_samples: deque[float] = deque(maxlen=LAG_SAMPLES)
+        self._jobs: dict[str, JobStats] = {}
+        # The job key and integration per code object, or per type for
+        # callable objects, so they are not rebuilt for every run
+        self._job_keys: dict[Any, tuple[str, str]] = {}
+        self._integrations: dict[str, float] = {}
+        self._integration_histograms: dict[str, RollingHistogram] = {}
+        self._event_type_histograms: dict[str, RollingHistogram] = {}
+        self._timing_jobs = False
+        self._expected = 0.0
+        self._window_end = 0.0
+        self._handle: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start monitoring the event loop."""
+        self._window_end = self._loop.time() + HISTOGRAM_WINDOW
+        self._async_schedule_sample()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop monitoring the event loop."""
+        self.async_stop_job_timing()
+        if self._handle is None:
+            return
+        self._handle.cancel()
+        self._handle = None
+
+    @property
+    def timing_jobs(self) -> bool:
+        """Return if jobs are being timed."""
+        return self._timing_jobs
+
+    @callback
+    def async_start_job_timing(self) -> None:
+        """Start timing jobs, dropping the job stats collected before."""
+        self._jobs.clear()
+        self._integrations.clear()
+        self._integration_histograms.clear()
+        self._event_type_histograms.clear()
+        self._timing_jobs = True
+        self._hass.async_set_job_timer(self._async_record)
+
+    @callback
+    def async_stop_job_timing(self) -> None:
+        """Stop timing jobs, keeping the job stats collected so far."""
+        if not self._timing_jobs:
+            return
+        self._timing_jobs = False
+        self._hass.async_set_job_timer(None)
+
+    @callback
+    def _async_schedule_sample(self) -> None:
+        self._expected = self._loop.time() + LAG_SAMPLE_INTERVAL
+        self._handle = self._loop.call_at(self._expected, self._async_sample)
+
+    @callback
+    def _async_sample(self) -> None:
+        now = self._loop.time()
+        self._lag_samples.append(max(now - self._expected, 0.0))
+        if now >= self._window_end:
+            self._window_end = now + HISTOGRAM_WINDOW
+            for histogram in self._integration_histograms.values():
+                histogram.rotate()
+            for histogram in self._event_type_histograms.values():
+                histogram.rotate()
+        self._async_schedule_sample()
+
+    @callback
+    def _async_record(
+        self, hassjob: HassJob[..., Any], args: tuple[Any, ...], run_time: float
+    ) -> None:
+        """Record the run time of a job."""
+        target: Callable[..., Any] = hassjob.target
+        while isinstance(target, partial):
+            target = target.func
+        code = getattr(target, "__code__", None) or type(target)
+        if (job_key := self._job_keys.get(code)) is None:
+            job_key = self._job_keys[code] = _job_key(target)
+        key, integration = job_key
+        if (stats := self._jobs.get(key)) is None:
+            stats = self._jobs[key] = JobStats()
+        stats.calls += 1
+        stats.total_time += run_time
+        stats.max_time = max(stats.max_time, run_time)
+        self._integrations[integration] = (
+            self._integrations.get(integration, 0.0) + run_time
+        )
+        if (histogram := self._integration_histograms.get(integration)) is None:
+            histogram = self._integration_histograms[integration] = RollingHistogram()
+        histogram.add(run_time)
+        if args and isinstance(event := args[0], Event):
+            event_type = str(event.event_type)
+            if (histogram := self._event_type_histograms.get(event_type)) is None:
+                histogram = self._event_type_histograms[event_type] = RollingHistogram()
+            histogram.add(run_time)
+
+    @callback
+    def async_lag_percentiles(self) -> dict[str, float | None]:
+        """Return the loop lag percentiles and maximum in seconds."""
+        samples = sorted(self._lag_samples)
+        if not samples:
+            return {
+                **{f"p{percentile}": None for percentile in LAG_PERCENTILES},
+                "max": None,
+            }
+        return {
+            **{
+                f"p{percentile}": samples[
+                    min(len(samples) - 1, len(samples) * percentile // 100)
+                ]
+                for percentile in LAG_PERCENTILES
+            },
+            "max": samples[-1],
+        }
+
+    @callback
+    def async_stats(self) -> dict[str, Any]:
+        """Return the loop lag, the slowest jobs and the time per integration."""
+        slowest = sorted(
+            self._jobs.items(), key=lambda item: item[1].max_time, reverse=True
+        )
+        return {
+            "lag": self.async_lag_percentiles(),
+            "samples": len(self._lag_samples),
+            "job_timing": {"running": self._timing_jobs, "note": COROUTINE_JOB_NOTE},
+            "slowest_jobs": [
+                {"target": target, **stats.as_dict()}
+                for target, stats in slowest[:MAX_REPORTED_JOBS]
+            ],
+            "integrations": dict(
+                sorted(
+                    self._integrations.items(), key=lambda item: item[1], reverse=True
+                )
+            ),
+        }
+
+    @callback
+    def async_histograms(self) -> dict[str, Any]:
+        """Return the job run time histograms per integration and event type."""
+        return {
+            "window": HISTOGRAM_WINDOW,
+            "integrations": _sorted_histograms(self._integration_histograms),
+            "event_types": _sorted_histograms(self._event_type_histograms),
+        }
+
+
+def _sorted_histograms(
+    histograms: dict[str, RollingHistogram],
+) -> dict[str, dict[str, Any]]:
+    """Return the histograms as dicts, the most time consuming first."""
+    as_dicts = {key: histogram.as_dict() for key, histogram in histograms.items()}
+    return dict(
+        sorted(as_dicts.items(), key=lambda item: item[1]["total_time"], reverse=True)
+    )
+
+
+def _job_key(target: Callable[..., Any]) -> tuple[str, str]:
+    """Return the key of a job target and the integration it belongs to."""
+    module: str = getattr(target, "__module__", None) or _CORE
+    key = f"{module}.{getattr(target, '__qualname__', type(target).__name__)}"
+    return key, _integration_for_module(module)
+
+
+def _integration_for_module(module: str) -> str:
+    """Return the integration a module belongs to, or homeassistant for core."""
+    parts = module.split(".", 3)
+    if parts[0] == "homeassistant" and len(parts) > 2 and parts[1] == "components":
+        return parts[2]
+    if parts[0] == "custom_components" and len(parts) > 1:
+        return parts[1]
+    return _CORE
@@ -0,0 +1,74 @@
+"""Sensors for the event loop lag measured by the profiler."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, LOOP_MONITOR
+from .loop_monitor import LoopMonitor
+
+SCAN_INTERVAL = timedelta(seconds=30)
+
+SENSOR_TYPES: tuple[SensorEntityDescription, ...] = tuple(
+    SensorEntityDescription(
+        key=key,
+        translation_key=f"loop_lag_{key}",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    )
+    for key in ("p50", "p95", "p99", "max")
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the event loop lag sensors."""
+    monitor: LoopMonitor = hass.data[DOMAIN][LOOP_MONITOR]
+    async_add_entities(
+        LoopLagSensor(monitor, entry, description) for description in SENSOR_TYPES
+    )
+
+
+class LoopLagSensor(SensorEntity):
+    """Sensor for a percentile of the event loop lag.
+
+    The lag is always sampled, unlike the run time of jobs which is only
+    measured while job timing is started. It covers all the work done in
+    the event loop, including the time coroutine jobs spend in the loop
+    after their first await which job timing does not attribute to them.
+    """
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        monitor: LoopMonitor,
+        entry: ConfigEntry,
+        description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._monitor = monitor
+        self._attr_unique_id = f"{entry.entry_id}_loop_lag_{description.key}"
+
+    async def async_update(self) -> None:
+        """Update the loop lag from the monitor."""
+        lag = self._monitor.async_lag_percentiles()[self.entity_description.key]
+        self._attr_native_value = None if lag is None else lag * 1000
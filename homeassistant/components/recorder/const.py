@@ -30,6 +30,10 @@ CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
 MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG = 256 * 1024**2
 
+# The maximum number of events to drain from the queue at once
+# when a backlog builds up so their ids can be resolved together
+MAX_EVENT_BATCH_SIZE = 1000
+
 # The maximum number of rows (events) we purge in one delete statement
 
 # sqlite3 has a limit of 999 until version 3.32.0
@@ -57,6 +57,7 @@ from .const import (
     LAST_REPORTED_SCHEMA_VERSION,
     MARIADB_PYMYSQL_URL_PREFIX,
     MARIADB_URL_PREFIX,
+    MAX_EVENT_BATCH_SIZE,
     MAX_QUEUE_BACKLOG_MIN_VALUE,
     MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG,
     MYSQLDB_PYMYSQL_URL_PREFIX,
@@ -832,9 +833,10 @@ class Recorder(threading.Thread):
         startup_task_or_events: list[RecorderTask | Event] = []
         while not queue_.empty() and (task_or_event := queue_.get_nowait()):
             startup_task_or_events.append(task_or_event)
-        self._pre_process_startup_events(startup_task_or_events)
+        self._pre_process_events(startup_task_or_events)
         for task in startup_task_or_events:
             self._guarded_process_one_task_or_event_or_recover(task)
+        self._clear_pre_processed_events()
 
         # Clear startup tasks since this thread runs forever
         # and we don't want to hold them in memory
@@ -842,18 +844,58 @@ class Recorder(threading.Thread):
 
         self.stop_requested = False
         while not self.stop_requested:
-            self._guarded_process_one_task_or_event_or_recover(queue_.get())
+            task_or_event = queue_.get()
+            if queue_.empty() or not self.enabled:
+                self._guarded_process_one_task_or_event_or_recover(task_or_event)
+                continue
+            # A backlog has built up, drain it in a batch so the ids
+            # for all the events in it can be resolved together instead
+            # of one query per cache miss. This is skipped while recording
+            # is disabled since the events are dropped and the queries
+            # would keep the event session open without a commit.
+            batch = [task_or_event]
+            while (
+                type(task_or_event) is Event
+                and len(batch) < MAX_EVENT_BATCH_SIZE
+                and not queue_.empty()
+            ):
+                task_or_event = queue_.get_nowait()
+                batch.append(task_or_event)
+            self._guarded_pre_process_events(batch)
+            for task_or_event in batch:
+                self._guarded_process_one_task_or_event_or_recover(task_or_event)
+                if self.stop_requested:
+                    break
+            self._clear_pre_processed_events()
+
+    def _guarded_pre_process_events(
+        self, task_or_events: list[RecorderTask | Event[Any]]
+    ) -> None:
+        """Pre process a batch of events, guarding against exceptions.
+
+        If pre processing fails, the ids are resolved one event
+        at a time when the events are processed.
+        """
+        try:
+            self._pre_process_events(task_or_events)
+        except SQLAlchemyError:
+            _LOGGER.exception("Error while pre processing a batch of events")
+            self._clear_pre_processed_events()
+            self._reopen_event_session()
+        except Exception:
+            _LOGGER.exception("Error while pre processing a batch of events")
+            self._clear_pre_processed_events()
 
-    def _pre_process_startup_events(
-        self, startup_task_or_events: list[RecorderTask | Event[Any]]
+    def _pre_process_events(
+        self, task_or_events: list[RecorderTask | Event[Any]]
     ) -> None:
-        """Pre process startup events."""
+        """Pre process a batch of events."""
         # Prime all the state_attributes and event_data caches
         # before we start processing events
         state_change_events: list[Event[EventStateChangedData]] = []
         non_state_change_events: list[Event] = []
 
-        for task_or_event in startup_task_or_events:
+        for task_or_event in task_or_events:
             # Event is never subclassed so we can
             # use a fast type check
             if type(task_or_event) is Event:
@@ -870,6 +912,15 @@ class Recorder(threading.Thread):
         self.states_meta_manager.load(state_change_events, session)
         self.state_attributes_manager.load(state_change_events, session)
 
+    def _clear_pre_processed_events(self) -> None:
+        """Drop the data serialized for pre processed events that were not processed.
+
+        The data serialized while pre processing a batch is reused when
+        each event is processed, so it is only encoded once.
+        """
+        self.event_data_manager.clear_serialized()
+        self.state_attributes_manager.clear_serialized()
+
     def _guarded_process_one_task_or_event_or_recover(
         self, task: RecorderTask | Event
     ) -> None:
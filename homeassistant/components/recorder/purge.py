@@ -53,6 +53,13 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# The maximum time a single purge cycle should keep the database busy.
+# Once it is exceeded, the cycle stops after the current batch and a new
+# purge task is queued so the recorder can write the events that queued up
+# in the meantime. This keeps transactions short on large databases and
+# avoids purge holding locks or growing the WAL/undo log for minutes.
+PURGE_CYCLE_TIME_BUDGET = 10
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -71,6 +78,7 @@ def purge_old_data(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
+    deadline = time.monotonic() + PURGE_CYCLE_TIME_BUDGET
     with session_scope(session=instance.get_session()) as session:
         # Purge a max of max_bind_vars, based on the oldest states or events record
         has_more_to_purge = False
@@ -87,10 +95,10 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+                instance, session, states_batch_size, purge_before, deadline
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance, session, events_batch_size, purge_before, deadline
             )
 
         statistics_runs = _select_statistics_runs_to_purge(
@@ -178,9 +186,12 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    deadline: float,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
+    Stops early once the deadline has passed.
+
     Returns true if there are more states to purge.
     """
     database_engine = instance.database_engine
@@ -201,6 +212,9 @@ def _purge_states_and_attributes_ids(
             break
         _purge_state_ids(instance, session, state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
+        if time.monotonic() > deadline:
+            _LOGGER.debug("Purge cycle time budget exhausted while purging states")
+            break
 
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
     _LOGGER.debug(
@@ -215,10 +229,13 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    deadline: float,
 ) -> bool:
-    """Purge states and linked attributes id in a batch.
+    """Purge events and linked data ids in a batch.
 
-    Returns true if there are more states to purge.
+    Stops early once the deadline has passed.
+
+    Returns true if there are more events to purge.
     """
     has_remaining_event_ids_to_purge = True
     # There are more events relative to data_ids so
@@ -236,6 +253,9 @@ def _purge_events_and_data_ids(
             break
         _purge_event_ids(session, event_ids)
         data_ids_batch = data_ids_batch | data_ids
+        if time.monotonic() > deadline:
+            _LOGGER.debug("Purge cycle time budget exhausted while purging events")
+            break
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
     _LOGGER.debug(
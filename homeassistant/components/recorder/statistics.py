@@ -13,7 +13,7 @@ from operator import itemgetter
 import re
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
-from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
+from sqlalchemy import Select, and_, bindparam, case, func, lambda_stmt, select, text
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.session import Session
@@ -157,6 +157,10 @@ UNIT_CLASSES = {
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
 
+# The maximum number of day, week or month periods we let the database reduce
+# in a single query, longer ranges are reduced from the hourly rows in Python
+MAX_DATABASE_REDUCED_PERIODS = 100
+
 
 def mean(values: list[float]) -> float | None:
     """Return the mean of the values.
@@ -1113,6 +1117,13 @@ def _reduce_statistics_per_month(
     )
 
 
+_REDUCE_TS_FACTORIES = {
+    "day": reduce_day_ts_factory,
+    "week": reduce_week_ts_factory,
+    "month": reduce_month_ts_factory,
+}
+
+
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1136,6 +1147,93 @@ def _generate_statistics_during_period_stmt(
     return stmt
 
 
+def _period_end_timestamps(
+    start_time: datetime,
+    end_time: datetime,
+    period: str,
+) -> list[float] | None:
+    """Return the end timestamps of the periods between start_time and end_time.
+
+    Returns None if there are more than MAX_DATABASE_REDUCED_PERIODS periods.
+    """
+    _, period_start_end = _REDUCE_TS_FACTORIES[period]()
+    end_time_ts = end_time.timestamp()
+    period_end_ts = start_time.timestamp()
+    period_ends: list[float] = []
+    while period_end_ts < end_time_ts:
+        if len(period_ends) == MAX_DATABASE_REDUCED_PERIODS:
+            return None
+        period_end_ts = period_start_end(period_end_ts)[1]
+        period_ends.append(period_end_ts)
+    return period_ends
+
+
+def _generate_reduced_statistics_during_period_stmt(
+    start_time: datetime,
+    end_time: datetime,
+    metadata_ids: list[int] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+    period_ends: list[float],
+) -> Select:
+    """Prepare a query which reduces hourly statistics to one row per period.
+
+    Each row has the start_ts, last_reset, state and sum of the last hourly
+    statistic in the period and the max, mean and min of the whole period,
+    which is exactly what _reduce_statistics keeps from the period. This
+    avoids loading every hourly row when asking for days, weeks or months.
+
+    The periods depend on the local time zone and the number of periods
+    changes the shape of the query so this is not a lambda_stmt.
+    """
+    table = Statistics
+    group_by: list[Any] = [table.metadata_id]
+    if len(period_ends) > 1:
+        group_by.append(
+            case(
+                *(
+                    (table.start_ts < period_end_ts, idx)
+                    for idx, period_end_ts in enumerate(period_ends[:-1])
+                ),
+                else_=len(period_ends) - 1,
+            )
+        )
+    periods = select(table.metadata_id, func.max(table.start_ts).label("start_ts"))
+    if "max" in types:
+        periods = periods.add_columns(func.max(table.max).label("max"))
+    if "mean" in types:
+        periods = periods.add_columns(func.avg(table.mean).label("mean"))
+    if "min" in types:
+        periods = periods.add_columns(func.min(table.min).label("min"))
+    periods = periods.filter(
+        table.start_ts >= start_time.timestamp(),
+        table.start_ts < end_time.timestamp(),
+    )
+    if metadata_ids:
+        periods = periods.filter(table.metadata_id.in_(metadata_ids))
+    periods = periods.group_by(*group_by)
+    last_columns = [
+        getattr(table, _type_column_mapping[key])
+        for key in ("last_reset", "state", "sum")
+        if key in types
+    ]
+    if not last_columns:
+        return periods.order_by(table.metadata_id, func.max(table.start_ts))
+    periods_subquery = periods.subquery()
+    return (
+        select(periods_subquery, *last_columns)
+        .select_from(
+            periods_subquery.join(
+                table,
+                and_(
+                    table.metadata_id == periods_subquery.c.metadata_id,
+                    table.start_ts == periods_subquery.c.start_ts,
+                ),
+            )
+        )
+        .order_by(periods_subquery.c.metadata_id, periods_subquery.c.start_ts)
+    )
+
+
 def _generate_max_mean_min_statistic_in_sub_period_stmt(
     columns: Select,
     start_time: datetime | None,
@@ -1768,12 +1866,24 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
+    if (
+        period in _REDUCE_TS_FACTORIES
+        and end_time is not None
+        and (period_ends := _period_end_timestamps(start_time, end_time, period))
+    ):
+        # Let the database reduce the hourly rows to one row per period,
+        # the reduction below then only has to set the period start and end
+        reduced_stmt = _generate_reduced_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, types, period_ends
+        )
+        stats: Sequence[Row] = session.connection().execute(reduced_stmt).all()
+    else:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
 
     if not stats:
         return {}
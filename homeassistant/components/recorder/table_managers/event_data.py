@@ -32,9 +32,12 @@ class EventDataManager(BaseLRUTableManager[EventData]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
+        self._serialized: dict[Event, bytes | None] = {}
 
     def serialize_from_event(self, event: Event) -> bytes | None:
         """Serialize event data."""
+        if event in self._serialized:
+            return self._serialized.pop(event)
         try:
             return EventData.shared_data_bytes_from_event(
                 event, self.recorder.dialect_name
@@ -46,16 +49,38 @@ class EventDataManager(BaseLRUTableManager[EventData]):
     def load(self, events: list[Event], session: Session) -> None:
         """Load the shared_datas to data_ids mapping into memory from events.
 
+        Data that is already cached or pending is skipped. The serialized
+        data is kept until the events are processed or clear_serialized
+        is called.
+
         This call is not thread-safe and must be called from the
         recorder thread.
         """
-        if hashes := {
-            EventData.hash_shared_data_bytes(shared_event_bytes)
-            for event in events
-            if (shared_event_bytes := self.serialize_from_event(event))
-        }:
+        id_map = self._id_map
+        pending = self._pending
+        serialized = self._serialized
+        hashes: set[int] = set()
+        for event in events:
+            if not event.data:
+                continue
+            serialized[event] = shared_event_bytes = self.serialize_from_event(event)
+            if (
+                shared_event_bytes
+                and (shared_data := shared_event_bytes.decode("utf-8")) not in id_map
+                and shared_data not in pending
+            ):
+                hashes.add(EventData.hash_shared_data_bytes(shared_event_bytes))
+        if hashes:
             self._load_from_hashes(hashes, session)
 
+    def clear_serialized(self) -> None:
+        """Drop the data serialized for events that were not processed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._serialized.clear()
+
     def get(self, shared_data: str, data_hash: int, session: Session) -> int | None:
         """Resolve shared_datas to the data_id.
 
@@ -37,9 +37,12 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
+        self._serialized: dict[Event[EventStateChangedData], bytes | None] = {}
 
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
         """Serialize event data."""
+        if event in self._serialized:
+            return self._serialized.pop(event)
         try:
             return StateAttributes.shared_attrs_bytes_from_event(
                 event, self.recorder.dialect_name
@@ -57,16 +60,36 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     ) -> None:
         """Load the shared_attrs to attributes_ids mapping into memory from events.
 
+        Attributes that are already cached or pending are skipped. The
+        serialized attributes are kept until the events are processed
+        or clear_serialized is called.
+
         This call is not thread-safe and must be called from the
         recorder thread.
         """
-        if hashes := {
-            StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes)
-            for event in events
-            if (shared_attrs_bytes := self.serialize_from_event(event))
-        }:
+        id_map = self._id_map
+        pending = self._pending
+        serialized = self._serialized
+        hashes: set[int] = set()
+        for event in events:
+            serialized[event] = shared_attrs_bytes = self.serialize_from_event(event)
+            if (
+                shared_attrs_bytes
+                and (shared_attrs := shared_attrs_bytes.decode("utf-8")) not in id_map
+                and shared_attrs not in pending
+            ):
+                hashes.add(StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes))
+        if hashes:
             self._load_from_hashes(hashes, session)
 
+    def clear_serialized(self) -> None:
+        """Drop the data serialized for events that were not processed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._serialized.clear()
+
     def get(self, shared_attr: str, data_hash: int, session: Session) -> int | None:
         """Resolve shared_attrs to the attributes_id.
 
@@ -19,6 +19,7 @@ from homeassistant.const import (
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Context,
     Event,
     EventStateChangedData,
@@ -67,6 +68,7 @@ from .connection import ActiveConnection
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+ENTITY_CHANGES_FANOUT = "websocket_api_entity_changes_fanout"
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -367,31 +369,112 @@ def _send_handle_get_states_response(
     )
 
 
+class _EntitySubscription:
+    """A subscribe_entities subscription of a single connection."""
+
+    __slots__ = ("entity_filter", "message_id_as_bytes", "send_message", "user")
+
+    def __init__(
+        self,
+        send_message: Callable[[str | bytes | dict[str, Any]], None],
+        entity_filter: Callable[[str], bool] | None,
+        user: User,
+        message_id_as_bytes: bytes,
+    ) -> None:
+        """Initialize the subscription."""
+        self.send_message = send_message
+        self.entity_filter = entity_filter
+        self.user = user
+        self.message_id_as_bytes = message_id_as_bytes
+
+
+class _EntityChangesFanout:
+    """Forward entity state changed events to all subscribe_entities subscriptions.
+
+    A single state_changed listener serves every connection so each event is
+    matched once against subscriptions indexed by entity_id, the permissions
+    are checked once per user and the event is serialized once.
+    """
+
+    __slots__ = ("_by_entity_id", "_hass", "_unfiltered", "_unsub")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the fanout."""
+        self._hass = hass
+        self._unfiltered: dict[_EntitySubscription, None] = {}
+        self._by_entity_id: dict[str, dict[_EntitySubscription, None]] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add(
+        self, subscription: _EntitySubscription, entity_ids: set[str] | None
+    ) -> CALLBACK_TYPE:
+        """Add a subscription and return a callback to remove it."""
+        if self._unsub is None:
+            self._unsub = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_forward
+            )
+        if entity_ids is None:
+            self._unfiltered[subscription] = None
+        else:
+            for entity_id in entity_ids:
+                self._by_entity_id.setdefault(entity_id, {})[subscription] = None
+
+        @callback
+        def _async_remove() -> None:
+            """Remove the subscription."""
+            if entity_ids is None:
+                del self._unfiltered[subscription]
+            else:
+                for entity_id in entity_ids:
+                    subscriptions = self._by_entity_id[entity_id]
+                    del subscriptions[subscription]
+                    if not subscriptions:
+                        del self._by_entity_id[entity_id]
+            if not self._unfiltered and not self._by_entity_id and self._unsub:
+                self._unsub()
+                self._unsub = None
+
+        return _async_remove
+
+    @callback
+    def _async_forward(self, event: Event[EventStateChangedData]) -> None:
+        """Forward entity state changed events to websocket."""
+        entity_id = event.data["entity_id"]
+        if entity_subscriptions := self._by_entity_id.get(entity_id):
+            subscriptions = [*self._unfiltered, *entity_subscriptions]
+        elif self._unfiltered:
+            subscriptions = list(self._unfiltered)
+        else:
+            return
+        allowed_by_user: dict[str, bool] = {}
+        for subscription in subscriptions:
+            if subscription.entity_filter and not subscription.entity_filter(entity_id):
+                continue
+            # We have to lookup the permissions again because the user might
+            # have changed since the subscription was created.
+            user = subscription.user
+            if (allowed := allowed_by_user.get(user.id)) is None:
+                permissions = user.permissions
+                allowed = allowed_by_user[user.id] = (
+                    user.is_admin
+                    or permissions.access_all_entities(POLICY_READ)
+                    or permissions.check_entity(entity_id, POLICY_READ)
+                )
+            if allowed:
+                subscription.send_message(
+                    messages.cached_state_diff_message(
+                        subscription.message_id_as_bytes, event
+                    )
+                )
+
+
 @callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str] | None,
-    entity_filter: Callable[[str], bool] | None,
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(entity_id, POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+def _async_get_entity_changes_fanout(hass: HomeAssistant) -> _EntityChangesFanout:
+    """Return the shared fanout for subscribe_entities."""
+    if (fanout := hass.data.get(ENTITY_CHANGES_FANOUT)) is None:
+        fanout = hass.data[ENTITY_CHANGES_FANOUT] = _EntityChangesFanout(hass)
+    return cast(_EntityChangesFanout, fanout)
 
 
 @callback
@@ -415,16 +498,15 @@ def handle_subscribe_entities(
     states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
+    fanout = _async_get_entity_changes_fanout(hass)
+    connection.subscriptions[msg_id] = fanout.async_add(
+        _EntitySubscription(
             connection.send_message,
-            entity_ids,
             entity_filter,
             connection.user,
             message_id_as_bytes,
         ),
+        entity_ids,
     )
     connection.send_result(msg_id)
 
@@ -319,6 +319,8 @@ class ConfigEntry(Generic[_DataT]):
     _background_tasks: set[asyncio.Future[Any]]
     _integration_for_domain: loader.Integration | None
     _tries: int
+    _forwarded_platforms: set[str]
+    _forward_platforms_lock: asyncio.Lock
     created_at: datetime
     modified_at: datetime
     discovery_keys: MappingProxyType[str, tuple[DiscoveryKey, ...]]
@@ -426,6 +428,10 @@ class ConfigEntry(Generic[_DataT]):
 
         _setter(self, "_integration_for_domain", None)
         _setter(self, "_tries", 0)
+        # Platforms the entry is currently forwarded to
+        _setter(self, "_forwarded_platforms", set())
+        # Lock to prevent forwarding a platform on demand more than once
+        _setter(self, "_forward_platforms_lock", asyncio.Lock())
         _setter(self, "created_at", created_at or utcnow())
         _setter(self, "modified_at", modified_at or utcnow())
         _setter(self, "discovery_keys", discovery_keys)
@@ -450,6 +456,11 @@ class ConfigEntry(Generic[_DataT]):
         self.clear_state_cache()
         self.clear_storage_cache()
 
+    @property
+    def forwarded_platforms(self) -> set[str]:
+        """Return the platforms the entry is forwarded to."""
+        return set(self._forwarded_platforms)
+
     @property
     def supports_options(self) -> bool:
         """Return if entry supports config options."""
@@ -2210,6 +2221,26 @@ class ConfigEntries:
                     entry, "async_forward_entry_setups"
                 )
 
+    async def async_forward_entry_setups_on_demand(
+        self, entry: ConfigEntry, platforms: Iterable[Platform | str]
+    ) -> None:
+        """Forward the setup of an entry to platforms it is not forwarded to yet.
+
+        Integrations that support many platforms can call this when the first
+        entity for a platform is discovered instead of forwarding every platform
+        in async_setup_entry. Platform modules are then only imported when they
+        are needed. Platforms that have already been forwarded are skipped, so
+        it is safe to call this for every discovered entity.
+
+        The config entry must be loaded, or this must be awaited from
+        async_setup_entry. Use forwarded_platforms to unload the platforms.
+        """
+        if not (missing := set(platforms) - entry._forwarded_platforms):  # noqa: SLF001
+            return
+        async with entry._forward_platforms_lock:  # noqa: SLF001
+            if missing := set(platforms) - entry._forwarded_platforms:  # noqa: SLF001
+                await self.async_forward_entry_setups(entry, missing)
+
     async def _async_forward_entry_setups_locked(
         self, entry: ConfigEntry, platforms: Iterable[Platform | str]
     ) -> None:
@@ -2296,6 +2327,7 @@ class ConfigEntries:
 
         integration = loader.async_get_loaded_integration(self.hass, domain)
         await entry.async_setup(self.hass, integration=integration)
+        entry._forwarded_platforms.add(domain)  # noqa: SLF001
         return True
 
     async def async_unload_platforms(
@@ -2332,7 +2364,9 @@ class ConfigEntries:
 
         integration = loader.async_get_loaded_integration(self.hass, domain)
 
-        return await entry.async_unload(self.hass, integration=integration)
+        if result := await entry.async_unload(self.hass, integration=integration):
+            entry._forwarded_platforms.discard(domain)  # noqa: SLF001
+        return result
 
     @callback
     def _async_schedule_save(self) -> None:
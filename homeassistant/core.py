@@ -213,6 +213,59 @@ def split_entity_id(entity_id: str) -> tuple[str, str]:
     return domain, object_id
 
 
+# Capability attributes that hold the same list of strings for many entities
+# and rarely change; the state machine shares one copy of each distinct value
+_SHARED_LIST_ATTRIBUTES: Final = frozenset(
+    {
+        "activity_list",
+        "available_modes",
+        "effect_list",
+        "event_types",
+        "fan_modes",
+        "fan_speed_list",
+        "operation_list",
+        "options",
+        "preset_modes",
+        "sound_mode_list",
+        "source_list",
+        "swing_modes",
+    }
+)
+_MAX_SHARED_ATTRIBUTE_LISTS: Final = 1024
+
+
+@functools.lru_cache(_MAX_SHARED_ATTRIBUTE_LISTS)
+def _shared_str_list(values: tuple[str, ...]) -> list[str]:
+    """Return a shared list for a sequence of strings."""
+    return list(values)
+
+
+def _share_attribute_lists(attributes: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Replace capability attribute lists of strings with shared lists.
+
+    Attributes like options, effect_list or source_list are identical
+    across many entities and are rebuilt every time the entity writes
+    its state. Sharing a single list for each distinct value avoids
+    keeping thousands of copies of the same list in memory.
+    """
+    shared: dict[str, Any] | None = None
+    for key in _SHARED_LIST_ATTRIBUTES.intersection(attributes):
+        value = attributes[key]
+        if type(value) is not list or not value:
+            continue
+        if not all(type(item) is str for item in value):
+            continue
+        shared_value = _shared_str_list(tuple(value))
+        # A consumer may have modified a shared list in place, only share it
+        # while it still holds the value it was created for
+        if shared_value is value or shared_value != value:
+            continue
+        if shared is None:
+            shared = dict(attributes)
+        shared[key] = shared_value
+    return attributes if shared is None else shared
+
+
 _OBJECT_ID = r"(?!_)[\da-z_]+(?<!_)"
 _DOMAIN = r"(?!.+__)" + _OBJECT_ID
 VALID_DOMAIN = re.compile(r"^" + _DOMAIN + r"$")
@@ -455,6 +508,12 @@ class HomeAssistant:
             max_workers=1, thread_name_prefix="ImportExecutor"
         )
         self.loop_thread_id = getattr(self.loop, "_thread_id")
+        # Called with the job, its arguments and its run time for every
+        # job run with async_run_hass_job while job timing is enabled
+        self._job_timer: (
+            Callable[[HassJob[..., Any], tuple[Any, ...], float], None] | None
+        ) = None
+        self._nested_job_time = 0.0
 
     def verify_event_loop_thread(self, what: str) -> None:
         """Report and raise if we are not running in the event loop thread."""
@@ -930,6 +989,9 @@ class HomeAssistant:
         hassjob: HassJob
         args: parameters for method to call.
         """
+        if self._job_timer is not None:
+            return self._async_run_timed_hass_job(hassjob, args, background)
+
         # This code path is performance sensitive and uses
         # if TYPE_CHECKING to avoid the overhead of constructing
         # the type used for the cast. For history see:
@@ -942,6 +1004,47 @@ class HomeAssistant:
 
         return self._async_add_hass_job(hassjob, *args, background=background)
 
+    @callback
+    def async_set_job_timer(
+        self,
+        job_timer: Callable[[HassJob[..., Any], tuple[Any, ...], float], None] | None,
+    ) -> None:
+        """Set the callback the run time of jobs is reported to, or None to stop.
+
+        While a job timer is set, the time every job run with
+        async_run_hass_job takes is measured and passed to the job timer
+        with the job and its arguments. The run time of a job excludes the
+        time of the jobs it ran itself. For coroutine jobs only the time to
+        create the task and run it up to its first await is measured.
+
+        This method must be run in the event loop.
+        """
+        self._job_timer = job_timer
+
+    @callback
+    def _async_run_timed_hass_job(
+        self,
+        hassjob: HassJob[..., Any],
+        args: tuple[Any, ...],
+        background: bool,
+    ) -> asyncio.Future[Any] | None:
+        """Run a HassJob and report its run time to the job timer."""
+        job_timer = self._job_timer
+        if TYPE_CHECKING:
+            assert job_timer is not None
+        parent_nested_job_time = self._nested_job_time
+        self._nested_job_time = 0.0
+        start = time.perf_counter()
+        try:
+            if hassjob.job_type is HassJobType.Callback:
+                hassjob.target(*args)
+                return None
+            return self._async_add_hass_job(hassjob, *args, background=background)
+        finally:
+            run_time = time.perf_counter() - start
+            job_timer(hassjob, args, run_time - self._nested_job_time)
+            self._nested_job_time = parent_nested_job_time + run_time
+
     @overload
     @callback
     def async_run_job[_R, *_Ts](
@@ -1421,6 +1524,11 @@ _FilterableJobType = tuple[
     Callable[[_DataT], bool] | None,  # event_filter
 ]
 
+_FilterableBatchJobType = tuple[
+    HassJob[[list[Event[_DataT]]], Coroutine[Any, Any, None] | None],  # job
+    Callable[[_DataT], bool] | None,  # event_filter
+]
+
 
 @dataclass(slots=True)
 class _OneTimeListener(Generic[_DataT]):
@@ -1460,13 +1568,22 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_batch_listeners",
+        "_debug",
+        "_hass",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: defaultdict[
             EventType[Any] | str, list[_FilterableJobType[Any]]
         ] = defaultdict(list)
+        self._batch_listeners: dict[
+            EventType[Any] | str, list[_FilterableBatchJobType[Any]]
+        ] = {}
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
@@ -1484,7 +1601,10 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for key, batch_listeners in self._batch_listeners.items():
+            listeners[key] = listeners.get(key, 0) + len(batch_listeners)
+        return listeners
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1579,6 +1699,102 @@ class EventBus:
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
 
+        if self._batch_listeners and (
+            batch_listeners := self._batch_listeners.get(event_type)
+        ):
+            if not event:
+                event = Event(event_type, event_data, origin, time_fired, context)
+            self._async_dispatch_batch(batch_listeners, [event])
+
+    @callback
+    def async_fire_batch_internal(
+        self,
+        event_type: EventType[_DataT] | str,
+        events: Iterable[tuple[_DataT | None, Context | None, float | None]],
+        origin: EventOrigin = EventOrigin.local,
+    ) -> None:
+        """Fire many events of the same type at once, for internal use only.
+
+        Each item in events is a tuple of (event_data, context, time_fired).
+
+        Listeners registered with async_listen and async_listen_once are
+        called once per event exactly as if the events had been fired
+        one at a time with async_fire_internal. Listeners registered with
+        async_listen_batch are called once with the list of all matching
+        events.
+
+        This method is intended to only be used by core internally
+        and should not be considered a stable API. We will make
+        breaking changes to this function in the future and it
+        should not be used in integrations.
+
+        This method must be run in the event loop.
+        """
+        batch_listeners = self._batch_listeners.get(event_type)
+        if not batch_listeners:
+            for event_data, context, time_fired in events:
+                self.async_fire_internal(
+                    event_type, event_data, origin, context, time_fired
+                )
+            return
+
+        if self._debug:
+            _LOGGER.debug("Bus:Handling batch of %s", event_type)
+
+        if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
+            match_all_listeners = self._match_all_listeners
+        else:
+            match_all_listeners = EMPTY_LIST
+
+        fired: list[Event[_DataT]] = []
+        for event_data, context, time_fired in events:
+            event = Event(event_type, event_data, origin, time_fired, context)
+            fired.append(event)
+            for job, event_filter in (
+                self._listeners.get(event_type, EMPTY_LIST) + match_all_listeners
+            ):
+                if event_filter is not None:
+                    try:
+                        if event_data is None or not event_filter(event_data):
+                            continue
+                    except Exception:
+                        _LOGGER.exception("Error in event filter")
+                        continue
+                try:
+                    self._hass.async_run_hass_job(job, event)
+                except Exception:
+                    _LOGGER.exception("Error running job: %s", job)
+
+        if fired:
+            self._async_dispatch_batch(batch_listeners, fired)
+
+    @callback
+    def _async_dispatch_batch(
+        self,
+        batch_listeners: list[_FilterableBatchJobType[_DataT]],
+        events: list[Event[_DataT]],
+    ) -> None:
+        """Dispatch a batch of events to the batch listeners."""
+        # Copy the listeners since a listener may unsubscribe
+        # while the batch is being dispatched
+        for job, event_filter in list(batch_listeners):
+            if event_filter is None:
+                matching = events
+            else:
+                matching = []
+                for event in events:
+                    try:
+                        if event.data is not None and event_filter(event.data):
+                            matching.append(event)
+                    except Exception:
+                        _LOGGER.exception("Error in event filter")
+                if not matching:
+                    continue
+            try:
+                self._hass.async_run_hass_job(job, matching)
+            except Exception:
+                _LOGGER.exception("Error running job: %s", job)
+
     def listen(
         self,
         event_type: EventType[_DataT] | str,
@@ -1642,6 +1858,63 @@ class EventBus:
                 )
         return self._async_listen_filterable_job(event_type, filterable_job)
 
+    @callback
+    def async_listen_batch(
+        self,
+        event_type: EventType[_DataT] | str,
+        listener: Callable[[list[Event[_DataT]]], Coroutine[Any, Any, None] | None],
+        event_filter: Callable[[_DataT], bool] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for batches of events of a specific type.
+
+        The listener is called with a list of events. When events are
+        fired with async_fire_batch_internal, the listener is called
+        once for the whole batch; when they are fired one at a time the
+        listener is called with a list containing a single event.
+
+        An optional event_filter, which must be a callable decorated with
+        @callback that returns a boolean value, determines which events
+        are included in the batch. The listener is not called if no
+        events in the batch match the filter.
+
+        Listening to MATCH_ALL is not supported for batch listeners.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError("Batch listeners cannot listen to MATCH_ALL")
+        if event_filter is not None and not is_callback_check_partial(event_filter):
+            raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
+        filterable_job: _FilterableBatchJobType[_DataT] = (
+            HassJob(listener, f"listen batch {event_type}"),
+            event_filter,
+        )
+        self._batch_listeners.setdefault(event_type, []).append(filterable_job)
+        return functools.partial(
+            self._async_remove_batch_listener, event_type, filterable_job
+        )
+
+    @callback
+    def _async_remove_batch_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        filterable_job: _FilterableBatchJobType[_DataT],
+    ) -> None:
+        """Remove a batch listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            self._batch_listeners[event_type].remove(filterable_job)
+
+            # delete event_type list if empty
+            if not self._batch_listeners[event_type]:
+                self._batch_listeners.pop(event_type)
+        except (KeyError, ValueError):
+            _LOGGER.exception(
+                "Unable to remove unknown batch job listener %s", filterable_job
+            )
+
     @callback
     def _async_listen_filterable_job(
         self,
@@ -2303,6 +2576,102 @@ class StateMachine:
 
         This method must be run in the event loop.
         """
+        if (
+            changed := self._async_update_state(
+                entity_id,
+                new_state,
+                attributes,
+                force_update,
+                context,
+                state_info,
+                timestamp,
+            )
+        ) is not None:
+            self._bus.async_fire_internal(
+                EVENT_STATE_CHANGED,
+                changed[0],
+                context=changed[1],
+                time_fired=timestamp,
+            )
+
+    @callback
+    def async_set_many_internal(
+        self,
+        states: Iterable[
+            tuple[
+                str,
+                str,
+                Mapping[str, Any] | None,
+                bool,
+                Context | None,
+                StateInfo | None,
+                float,
+            ]
+        ],
+    ) -> None:
+        """Set the state of many entities and fire state_changed as a batch.
+
+        Each item in states is a tuple of the arguments accepted by
+        async_set_internal. All states are written to the state machine
+        before any state_changed listener is called, and listeners
+        registered with EventBus.async_listen_batch receive all changes
+        in a single call. If setting a state raises, the states set before
+        it are still fired before the exception is raised.
+
+        This method is intended to only be used by core internally
+        and should not be considered a stable API. We will make
+        breaking changes to this function in the future and it
+        should not be used in integrations.
+
+        This method must be run in the event loop.
+        """
+        batch: list[tuple[EventStateChangedData, Context, float]] = []
+        try:
+            for (
+                entity_id,
+                new_state,
+                attributes,
+                force_update,
+                context,
+                state_info,
+                timestamp,
+            ) in states:
+                if (
+                    changed := self._async_update_state(
+                        entity_id,
+                        new_state,
+                        attributes,
+                        force_update,
+                        context,
+                        state_info,
+                        timestamp,
+                    )
+                ) is not None:
+                    batch.append((changed[0], changed[1], timestamp))
+        finally:
+            # States set before an error must still fire state_changed
+            if batch:
+                self._bus.async_fire_batch_internal(EVENT_STATE_CHANGED, batch)
+
+    @callback
+    def _async_update_state(
+        self,
+        entity_id: str,
+        new_state: str,
+        attributes: Mapping[str, Any] | None,
+        force_update: bool,
+        context: Context | None,
+        state_info: StateInfo | None,
+        timestamp: float,
+    ) -> tuple[EventStateChangedData, Context] | None:
+        """Update the state of an entity in the state machine.
+
+        Returns the state_changed event data and context if the state
+        changed, the caller is responsible for firing the event.
+
+        If only last_reported changed, the state_reported event is
+        fired and None is returned.
+        """
         # Most cases the key will be in the dict
         # so we optimize for the happy path as
         # python 3.11+ has near zero overhead for
@@ -2352,12 +2721,14 @@ class StateMachine:
                 context=context,
                 time_fired=timestamp,
             )
-            return
+            return None
 
         if same_attr:
             if TYPE_CHECKING:
                 assert old_state is not None
             attributes = old_state.attributes
+        elif attributes and not _SHARED_LIST_ATTRIBUTES.isdisjoint(attributes):
+            attributes = _share_attribute_lists(attributes)
 
         # This is intentionally called with positional only arguments for performance
         # reasons
@@ -2381,12 +2752,7 @@ class StateMachine:
             "old_state": old_state,
             "new_state": state,
         }
-        self._bus.async_fire_internal(
-            EVENT_STATE_CHANGED,
-            state_changed_data,
-            context=context,
-            time_fired=timestamp,
-        )
+        return state_changed_data, context
 
 
 class SupportsResponse(enum.StrEnum):
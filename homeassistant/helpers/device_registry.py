@@ -464,7 +464,7 @@ def format_mac(mac: str) -> str:
     return mac
 
 
-class DeviceRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
+class DeviceRegistryStore(storage.AppendLogStore[dict[str, list[dict[str, Any]]]]):
     """Store entity registry data."""
 
     async def _async_migrate_func(
@@ -621,22 +621,19 @@ class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
 
     def get_devices_for_area_id(self, area_id: str) -> list[DeviceEntry]:
         """Get devices for area."""
-        data = self.data
-        return [data[key] for key in self._area_id_index.get(area_id, ())]
+        return self._get_entries_for_index_value(area_id, self._area_id_index)
 
     def get_devices_for_label(self, label: str) -> list[DeviceEntry]:
         """Get devices for label."""
-        data = self.data
-        return [data[key] for key in self._labels_index.get(label, ())]
+        return self._get_entries_for_index_value(label, self._labels_index)
 
     def get_devices_for_config_entry_id(
         self, config_entry_id: str
     ) -> list[DeviceEntry]:
         """Get devices for config entry."""
-        data = self.data
-        return [
-            data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
-        ]
+        return self._get_entries_for_index_value(
+            config_entry_id, self._config_entry_id_index
+        )
 
 
 class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
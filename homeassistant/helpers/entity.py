@@ -5,7 +5,9 @@ from __future__ import annotations
 from abc import ABCMeta
 import asyncio
 from collections import deque
-from collections.abc import Callable, Coroutine, Iterable, Mapping
+from collections.abc import Callable, Coroutine, Generator, Iterable, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
 import dataclasses
 from enum import Enum, IntFlag, auto
 import functools as ft
@@ -32,6 +34,7 @@ from homeassistant.const import (
     ATTR_SUPPORTED_FEATURES,
     ATTR_UNIT_OF_MEASUREMENT,
     DEVICE_DEFAULT_NAME,
+    MAX_LENGTH_STATE_STATE,
     STATE_OFF,
     STATE_ON,
     STATE_UNAVAILABLE,
@@ -86,6 +89,21 @@ CAPABILITIES_UPDATE_LIMIT = 100
 CONTEXT_RECENT_TIME_SECONDS = 5  # Time that a context is considered recent
 
 
+class _DeferredStateWrites:
+    """State writes collected by async_defer_state_writes."""
+
+    __slots__ = ("writes",)
+
+    def __init__(self) -> None:
+        """Initialize the deferred state writes."""
+        self.writes: list[Entity] | None = []
+
+
+_deferred_state_writes: ContextVar[_DeferredStateWrites | None] = ContextVar(
+    "deferred_state_writes", default=None
+)
+
+
 @callback
 def async_setup(hass: HomeAssistant) -> None:
     """Set up entity sources."""
@@ -100,6 +118,58 @@ def entity_sources(hass: HomeAssistant) -> dict[str, EntityInfo]:
     return {}
 
 
+@contextmanager
+def async_defer_state_writes(hass: HomeAssistant) -> Generator[None]:
+    """Defer the initial state writes of entities added in the block.
+
+    The first state write of each entity that finishes being added to a
+    platform in the block is deferred, and all of them are written with a
+    single call to StateMachine.async_set_many_internal when the block
+    exits, so state_changed batch listeners are called once. Any other
+    state write is written right away, after the deferred state of the
+    entity if it has one. A deferred state is dropped if the entity was
+    removed in the meantime. If the batch write fails, the remaining
+    entities write their states one by one.
+
+    This is intended to be used by EntityPlatform when adding entities
+    and must be run in the event loop.
+    """
+    deferred = _DeferredStateWrites()
+    token = _deferred_state_writes.set(deferred)
+    try:
+        yield
+    finally:
+        _deferred_state_writes.reset(token)
+        writes = deferred.writes
+        # Tasks created in the block share the context, write directly from now
+        deferred.writes = None
+        if writes:
+            _async_write_deferred_states(hass, writes)
+
+
+@callback
+def _async_write_deferred_states(hass: HomeAssistant, writes: list[Entity]) -> None:
+    """Write the deferred initial states of entities in one batch."""
+    pending: list[Entity] = []
+    states: list[tuple[Any, ...]] = []
+    for entity in writes:
+        if (args := entity._deferred_state_write) is not None:  # noqa: SLF001
+            entity._deferred_state_write = None  # noqa: SLF001
+            if entity._platform_state is not EntityPlatformState.REMOVED:  # noqa: SLF001
+                pending.append(entity)
+                states.append(args)
+    try:
+        hass.states.async_set_many_internal(states)
+    except Exception:
+        _LOGGER.exception("Error writing the initial states of added entities")
+        # States that were written before the error are only reported again
+        for entity in pending:
+            try:
+                entity.async_write_ha_state()
+            except Exception:
+                _LOGGER.exception("Error writing the state of %s", entity.entity_id)
+
+
 def generate_entity_id(
     entity_id_format: str,
     name: str | None,
@@ -521,6 +591,11 @@ class Entity(
     __capabilities_updated_at_reported: bool = False
     __remove_future: asyncio.Future[None] | None = None
 
+    # Set while the initial state write may be deferred, and while the
+    # deferred initial state is waiting to be written
+    __initial_state_writes: _DeferredStateWrites | None = None
+    _deferred_state_write: tuple[Any, ...] | None = None
+
     # Entity Properties
     _attr_assumed_state: bool = False
     _attr_attribution: str | None = None
@@ -1205,6 +1280,25 @@ class Entity(
             self._context = None
             self._context_set = None
 
+        if (deferred := self.__initial_state_writes) is not None:
+            writes = deferred.writes
+            if writes is not None and len(state) <= MAX_LENGTH_STATE_STATE:
+                self._deferred_state_write = (
+                    entity_id,
+                    state,
+                    attr,
+                    self.force_update,
+                    self._context,
+                    self._state_info,
+                    time_now,
+                )
+                writes.append(self)
+                return
+        elif (deferred_write := self._deferred_state_write) is not None:
+            # Write the deferred initial state first so no state change is lost
+            self._deferred_state_write = None
+            hass.states.async_set_internal(*deferred_write)
+
         try:
             hass.states.async_set_internal(
                 entity_id,
@@ -1363,7 +1457,16 @@ class Entity(
         """Finish adding an entity to a platform."""
         await self.async_internal_added_to_hass()
         await self.async_added_to_hass()
-        self.async_write_ha_state()
+        deferred = _deferred_state_writes.get()
+        if deferred is None or deferred.writes is None:
+            self.async_write_ha_state()
+            return
+        # Only the initial state write is deferred by async_defer_state_writes
+        self.__initial_state_writes = deferred
+        try:
+            self.async_write_ha_state()
+        finally:
+            self.__initial_state_writes = None
 
     @final
     async def async_remove(self, *, force_remove: bool = False) -> None:
@@ -44,6 +44,7 @@ from . import (
     service,
     translation,
 )
+from .entity import async_defer_state_writes
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
 from .event import async_call_later
 from .issue_registry import IssueSeverity, async_create_issue
@@ -587,21 +588,25 @@ class EntityPlatform:
         which means it is likely that we will not have to yield control
         to the event loop so we can await the coros directly without
         scheduling them as tasks.
+
+        The initial states are written to the state machine in one batch
+        once all entities are added.
         """
         try:
             async with self.hass.timeout.async_timeout(timeout, self.domain):
-                for idx, coro in enumerate(coros):
-                    try:
-                        await coro
-                    except Exception as ex:
-                        entity = entities[idx]
-                        self.logger.exception(
-                            "Error adding entity %s for domain %s with platform %s",
-                            entity.entity_id,
-                            self.domain,
-                            self.platform_name,
-                            exc_info=ex,
-                        )
+                with async_defer_state_writes(self.hass):
+                    for idx, coro in enumerate(coros):
+                        try:
+                            await coro
+                        except Exception as ex:
+                            entity = entities[idx]
+                            self.logger.exception(
+                                "Error adding entity %s for domain %s with platform %s",
+                                entity.entity_id,
+                                self.domain,
+                                self.platform_name,
+                                exc_info=ex,
+                            )
         except TimeoutError:
             self.logger.warning(
                 "Timed out adding entities for domain %s with platform %s after %ds",
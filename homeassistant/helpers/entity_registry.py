@@ -438,7 +438,7 @@ class DeletedRegistryEntry:
         )
 
 
-class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
+class EntityRegistryStore(storage.AppendLogStore[dict[str, list[dict[str, Any]]]]):
     """Store entity registry data."""
 
     async def _async_migrate_func(  # noqa: C901
@@ -549,13 +549,14 @@ class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
 class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
     """Container for entity registry items, maps entity_id -> entry.
 
-    Maintains six additional indexes:
+    Maintains seven additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entity_id
     - config_entry_id -> dict[key, True]
     - device_id -> dict[key, True]
     - area_id -> dict[key, True]
     - label -> dict[key, True]
+    - platform -> dict[key, True]
     """
 
     def __init__(self) -> None:
@@ -567,6 +568,7 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         self._device_id_index: RegistryIndexType = defaultdict(dict)
         self._area_id_index: RegistryIndexType = defaultdict(dict)
         self._labels_index: RegistryIndexType = defaultdict(dict)
+        self._platform_index: RegistryIndexType = defaultdict(dict)
 
     def _index_entry(self, key: str, entry: RegistryEntry) -> None:
         """Index an entry."""
@@ -582,6 +584,7 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
             self._area_id_index[area_id][key] = True
         for label in entry.labels:
             self._labels_index[label][key] = True
+        self._platform_index[entry.platform][key] = True
 
     def _unindex_entry(
         self, key: str, replacement_entry: RegistryEntry | None = None
@@ -599,6 +602,7 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         if labels := entry.labels:
             for label in labels:
                 self._unindex_entry_value(key, label, self._labels_index)
+        self._unindex_entry_value(key, entry.platform, self._platform_index)
 
     def get_device_ids(self) -> KeysView[str]:
         """Return device ids."""
@@ -627,20 +631,21 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         self, config_entry_id: str
     ) -> list[RegistryEntry]:
         """Get entries for config entry."""
-        data = self.data
-        return [
-            data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
-        ]
+        return self._get_entries_for_index_value(
+            config_entry_id, self._config_entry_id_index
+        )
 
     def get_entries_for_area_id(self, area_id: str) -> list[RegistryEntry]:
         """Get entries for area."""
-        data = self.data
-        return [data[key] for key in self._area_id_index.get(area_id, ())]
+        return self._get_entries_for_index_value(area_id, self._area_id_index)
 
     def get_entries_for_label(self, label: str) -> list[RegistryEntry]:
         """Get entries for label."""
-        data = self.data
-        return [data[key] for key in self._labels_index.get(label, ())]
+        return self._get_entries_for_index_value(label, self._labels_index)
+
+    def get_entries_for_platform(self, platform: str) -> list[RegistryEntry]:
+        """Get entries for platform."""
+        return self._get_entries_for_index_value(platform, self._platform_index)
 
 
 def _validate_item(
@@ -1464,6 +1469,14 @@ def async_entries_for_label(
     return registry.entities.get_entries_for_label(label_id)
 
 
+@callback
+def async_entries_for_platform(
+    registry: EntityRegistry, platform: str
+) -> list[RegistryEntry]:
+    """Return entries that match a platform."""
+    return registry.entities.get_entries_for_platform(platform)
+
+
 @callback
 def async_entries_for_category(
     registry: EntityRegistry, scope: str, category_id: str
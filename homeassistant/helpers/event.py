@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
 from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
 import copy
 from dataclasses import dataclass
@@ -54,7 +53,13 @@ from .entity_registry import (
 )
 from .ratelimit import KeyedRateLimit
 from .sun import get_astral_event_next
-from .template import RenderInfo, Template, result_as_boolean
+from .template import (
+    RenderInfo,
+    StatesSnapshot,
+    Template,
+    async_record_render_trigger,
+    result_as_boolean,
+)
 from .typing import TemplateVarsType
 
 _TRACK_STATE_CHANGE_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = HassKey(
@@ -89,6 +94,12 @@ _LOGGER = logging.getLogger(__name__)
 RANDOM_MICROSECOND_MIN = 50000
 RANDOM_MICROSECOND_MAX = 500000
 
+# Tracked templates which only read the state machine and take longer than
+# this (in seconds) to render this many times in a row are rendered in the
+# executor from then on
+TEMPLATE_OFFLOAD_RENDER_TIME = 0.005
+TEMPLATE_OFFLOAD_SLOW_RENDERS = 3
+
 _TypedDictT = TypeVar("_TypedDictT", bound=Mapping[str, Any])
 _StateEventDataT = TypeVar("_StateEventDataT", bound=EventStateEventData)
 
@@ -102,7 +113,7 @@ class _KeyedEventTracker(Generic[_TypedDictT]):
     dispatcher_callable: Callable[
         [
             HomeAssistant,
-            dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
+            dict[str, tuple[HassJob[[Event[_TypedDictT]], Any], ...]],
             Event[_TypedDictT],
         ],
         None,
@@ -110,7 +121,7 @@ class _KeyedEventTracker(Generic[_TypedDictT]):
     filter_callable: Callable[
         [
             HomeAssistant,
-            dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
+            dict[str, tuple[HassJob[[Event[_TypedDictT]], Any], ...]],
             _TypedDictT,
         ],
         bool,
@@ -122,7 +133,7 @@ class _KeyedEventData(Generic[_TypedDictT]):
     """Class to track data for events by key."""
 
     listener: CALLBACK_TYPE
-    callbacks: defaultdict[str, list[HassJob[[Event[_TypedDictT]], Any]]]
+    callbacks: dict[str, tuple[HassJob[[Event[_TypedDictT]], Any], ...]]
 
 
 @dataclass(slots=True)
@@ -331,7 +342,7 @@ def async_track_state_change_event(
 @callback
 def _async_dispatch_entity_id_event_soon(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
+    callbacks: dict[str, tuple[HassJob[[Event[_StateEventDataT]], Any], ...]],
     event: Event[_StateEventDataT],
 ) -> None:
     """Dispatch to listeners soon to ensure one event loop runs before dispatch."""
@@ -341,13 +352,13 @@ def _async_dispatch_entity_id_event_soon(
 @callback
 def _async_dispatch_entity_id_event(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
+    callbacks: dict[str, tuple[HassJob[[Event[_StateEventDataT]], Any], ...]],
     event: Event[_StateEventDataT],
 ) -> None:
     """Dispatch to listeners."""
     if not (callbacks_list := callbacks.get(event.data["entity_id"])):
         return
-    for job in callbacks_list.copy():
+    for job in callbacks_list:
         try:
             hass.async_run_hass_job(job, event)
         except Exception:
@@ -361,7 +372,7 @@ def _async_dispatch_entity_id_event(
 @callback
 def _async_state_filter(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
+    callbacks: dict[str, tuple[HassJob[[Event[_StateEventDataT]], Any], ...]],
     event_data: _StateEventDataT,
 ) -> bool:
     """Filter state changes by entity_id."""
@@ -420,12 +431,17 @@ def _remove_listener(
     tracker: _KeyedEventTracker[_TypedDictT],
     keys: Iterable[str],
     job: HassJob[[Event[_TypedDictT]], Any],
-    callbacks: dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
+    callbacks: dict[str, tuple[HassJob[[Event[_TypedDictT]], Any], ...]],
 ) -> None:
     """Remove listener."""
     for key in keys:
-        callbacks[key].remove(job)
-        if not callbacks[key]:
+        # The jobs are replaced instead of mutated so a dispatch in
+        # progress keeps iterating the jobs it started with
+        jobs = list(callbacks[key])
+        jobs.remove(job)
+        if jobs:
+            callbacks[key] = tuple(jobs)
+        else:
             del callbacks[key]
 
     if not callbacks:
@@ -454,7 +470,7 @@ def _async_track_event(
         event_data = hass_data[tracker_key]
         callbacks = event_data.callbacks
     else:
-        callbacks = defaultdict(list)
+        callbacks = {}
         listener = hass.bus.async_listen(
             tracker.event_type,
             partial(tracker.dispatcher_callable, hass, callbacks),
@@ -465,17 +481,17 @@ def _async_track_event(
 
     job = HassJob(action, f"track {tracker.event_type} event {keys}", job_type=job_type)
 
+    # The jobs for each key are kept in a tuple that is only rebuilt when
+    # listeners are added or removed so dispatching, which happens far
+    # more often, can iterate them directly without copying them first.
     if isinstance(keys, str):
         # Almost all calls to this function use a single key
-        # so we optimize for that case. We don't use setdefault
-        # here because this function gets called ~20000 times
-        # during startup, and we want to avoid the overhead of
-        # creating empty lists and throwing them away.
-        callbacks[keys].append(job)
+        # so we optimize for that case.
+        callbacks[keys] = (*callbacks.get(keys, ()), job)
         keys = (keys,)
     else:
         for key in keys:
-            callbacks[key].append(job)
+            callbacks[key] = (*callbacks.get(key, ()), job)
 
     return partial(_remove_listener, hass, tracker, keys, job, callbacks)
 
@@ -483,7 +499,9 @@ def _async_track_event(
 @callback
 def _async_dispatch_old_entity_id_or_entity_id_event(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventEntityRegistryUpdatedData]], Any]]],
+    callbacks: dict[
+        str, tuple[HassJob[[Event[EventEntityRegistryUpdatedData]], Any], ...]
+    ],
     event: Event[EventEntityRegistryUpdatedData],
 ) -> None:
     """Dispatch to listeners."""
@@ -493,7 +511,7 @@ def _async_dispatch_old_entity_id_or_entity_id_event(
         )
     ):
         return
-    for job in callbacks_list.copy():
+    for job in callbacks_list:
         try:
             hass.async_run_hass_job(job, event)
         except Exception:
@@ -507,7 +525,9 @@ def _async_dispatch_old_entity_id_or_entity_id_event(
 @callback
 def _async_entity_registry_updated_filter(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventEntityRegistryUpdatedData]], Any]]],
+    callbacks: dict[
+        str, tuple[HassJob[[Event[EventEntityRegistryUpdatedData]], Any], ...]
+    ],
     event_data: EventEntityRegistryUpdatedData,
 ) -> bool:
     """Filter entity registry updates by entity_id."""
@@ -544,7 +564,9 @@ def async_track_entity_registry_updated_event(
 @callback
 def _async_device_registry_updated_filter(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventDeviceRegistryUpdatedData]], Any]]],
+    callbacks: dict[
+        str, tuple[HassJob[[Event[EventDeviceRegistryUpdatedData]], Any], ...]
+    ],
     event_data: EventDeviceRegistryUpdatedData,
 ) -> bool:
     """Filter device registry updates by device_id."""
@@ -554,13 +576,15 @@ def _async_device_registry_updated_filter(
 @callback
 def _async_dispatch_device_id_event(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventDeviceRegistryUpdatedData]], Any]]],
+    callbacks: dict[
+        str, tuple[HassJob[[Event[EventDeviceRegistryUpdatedData]], Any], ...]
+    ],
     event: Event[EventDeviceRegistryUpdatedData],
 ) -> None:
     """Dispatch to listeners."""
     if not (callbacks_list := callbacks.get(event.data["device_id"])):
         return
-    for job in callbacks_list.copy():
+    for job in callbacks_list:
         try:
             hass.async_run_hass_job(job, event)
         except Exception:
@@ -598,12 +622,12 @@ def async_track_device_registry_updated_event(
 @callback
 def _async_dispatch_domain_event(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
+    callbacks: dict[str, tuple[HassJob[[Event[EventStateChangedData]], Any], ...]],
     event: Event[EventStateChangedData],
 ) -> None:
     """Dispatch domain event listeners."""
     domain = split_entity_id(event.data["entity_id"])[0]
-    for job in callbacks.get(domain, []) + callbacks.get(MATCH_ALL, []):
+    for job in callbacks.get(domain, ()) + callbacks.get(MATCH_ALL, ()):
         try:
             hass.async_run_hass_job(job, event)
         except Exception:
@@ -615,7 +639,7 @@ def _async_dispatch_domain_event(
 @callback
 def _async_domain_added_filter(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
+    callbacks: dict[str, tuple[HassJob[[Event[EventStateChangedData]], Any], ...]],
     event_data: EventStateChangedData,
 ) -> bool:
     """Filter state changes by entity_id."""
@@ -665,7 +689,7 @@ def _async_track_state_added_domain(
 @callback
 def _async_domain_removed_filter(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
+    callbacks: dict[str, tuple[HassJob[[Event[EventStateChangedData]], Any], ...]],
     event_data: EventStateChangedData,
 ) -> bool:
     """Filter state changes by entity_id."""
@@ -1001,6 +1025,10 @@ class TrackTemplateResultInfo:
         self._info: dict[Template, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
+        self._offloaded: set[Template] = set()
+        self._slow_renders: dict[Template, int] = {}
+        self._offload_tasks: dict[Template, asyncio.Task[None]] = {}
+        self._offload_pending: dict[Template, Event[EventStateChangedData] | None] = {}
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -1096,7 +1124,7 @@ class TrackTemplateResultInfo:
 
         @callback
         def _refresh_from_time(now: datetime) -> None:
-            self._refresh(None, track_templates=track_templates)
+            self._refresh(None, track_templates=track_templates, source="time")
 
         self._time_listeners[template] = async_track_utc_time_change(
             self.hass, _refresh_from_time, second=0
@@ -1115,6 +1143,9 @@ class TrackTemplateResultInfo:
         self._rate_limit.async_remove()
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
+        self._offload_pending.clear()
+        for task in self._offload_tasks.values():
+            task.cancel()
 
     @callback
     def async_refresh(self) -> None:
@@ -1126,6 +1157,7 @@ class TrackTemplateResultInfo:
         track_template_: TrackTemplate,
         now: float,
         event: Event[EventStateChangedData] | None,
+        source: str,
     ) -> bool | TrackTemplateResult:
         """Re-render the template if conditions match.
 
@@ -1165,10 +1197,36 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
+        async_record_render_trigger(template, source)
+
+        if template in self._offloaded:
+            self._async_render_offloaded(track_template_, event)
+            return False
+
+        start = time.perf_counter()
         self._info[template] = info = template.async_render_to_info(
             track_template_.variables
         )
+        if time.perf_counter() - start <= TEMPLATE_OFFLOAD_RENDER_TIME:
+            if self._slow_renders:
+                self._slow_renders.pop(template, None)
+        elif not self._is_super_template(track_template_) and template.offload_safe:
+            slow_renders = self._slow_renders.get(template, 0) + 1
+            if slow_renders < TEMPLATE_OFFLOAD_SLOW_RENDERS:
+                self._slow_renders[template] = slow_renders
+            else:
+                _LOGGER.debug(
+                    "Rendering template %s in the executor", template.template
+                )
+                del self._slow_renders[template]
+                self._offloaded.add(template)
 
+        return self._result_update(template, info)
+
+    def _result_update(
+        self, template: Template, info: RenderInfo
+    ) -> bool | TrackTemplateResult:
+        """Return the update for a new render of a template."""
         try:
             result: str | TemplateError = info.result()
         except TemplateError as ex:
@@ -1185,6 +1243,68 @@ class TrackTemplateResultInfo:
 
         return TrackTemplateResult(template, last_result, result)
 
+    def _is_super_template(self, track_template_: TrackTemplate) -> bool:
+        """Return if the tracked template is the super template."""
+        return self._has_super_template and track_template_ is self._track_templates[0]
+
+    @callback
+    def _async_render_offloaded(
+        self,
+        track_template_: TrackTemplate,
+        event: Event[EventStateChangedData] | None,
+    ) -> None:
+        """Render a template in the executor against a snapshot of the states."""
+        template = track_template_.template
+        if template in self._offload_tasks:
+            # Render again with the latest states once the running render is done
+            self._offload_pending[template] = event
+            return
+        self._offload_tasks[template] = self.hass.async_create_task_internal(
+            self._async_render_snapshot(
+                track_template_, event, StatesSnapshot(self.hass)
+            ),
+            f"render template {template.template}",
+            eager_start=False,
+        )
+
+    async def _async_render_snapshot(
+        self,
+        track_template_: TrackTemplate,
+        event: Event[EventStateChangedData] | None,
+        snapshot: StatesSnapshot,
+    ) -> None:
+        """Render a template in the executor and apply the result."""
+        template = track_template_.template
+        try:
+            info = await self.hass.async_add_executor_job(
+                template.render_to_info_with_snapshot,
+                snapshot,
+                track_template_.variables,
+            )
+        finally:
+            del self._offload_tasks[template]
+
+        if self._has_super_template:
+            super_result = self._last_result.get(self._track_templates[0].template)
+            if (
+                super_result is not None
+                and self._super_template_as_boolean(super_result) is not True
+            ):
+                self._offload_pending.pop(template, None)
+                return
+
+        self._info[template] = info
+        updates: list[TrackTemplateResult] = []
+        info_changed = self._apply_update(
+            updates, self._result_update(template, info), template
+        )
+        self._async_finish_refresh(event, updates, info_changed, False)
+
+        if template in self._offload_pending:
+            self._async_render_offloaded(
+                track_template_, self._offload_pending.pop(template)
+            )
+
     @staticmethod
     def _super_template_as_boolean(result: bool | str | TemplateError) -> bool:
         """Return True if the result is truthy or a TemplateError."""
@@ -1217,6 +1337,7 @@ class TrackTemplateResultInfo:
         event: Event[EventStateChangedData] | None,
         track_templates: Iterable[TrackTemplate] | None = None,
         replayed: bool | None = False,
+        source: str = "refresh",
     ) -> None:
         """Refresh the template.
 
@@ -1229,10 +1350,17 @@ class TrackTemplateResultInfo:
 
         replayed is True if the event is being replayed because the
         rate limit was hit.
+
+        source describes what caused the refresh when there is no event,
+        it is recorded when profiling template renders.
         """
         updates: list[TrackTemplateResult] = []
         info_changed = False
         now = event.time_fired_timestamp if not replayed and event else time.time()
+        if replayed:
+            source = "rate_limit"
+        elif event:
+            source = event.data["entity_id"]
 
         block_updates = False
         super_template = self._track_templates[0] if self._has_super_template else None
@@ -1241,7 +1369,7 @@ class TrackTemplateResultInfo:
 
         # Update the super template first
         if super_template is not None:
-            update = self._render_template_if_ready(super_template, now, event)
+            update = self._render_template_if_ready(super_template, now, event, source)
             info_changed |= self._apply_update(updates, update, super_template.template)
 
             if isinstance(update, TrackTemplateResult):
@@ -1272,11 +1400,24 @@ class TrackTemplateResultInfo:
                 if track_template_ == super_template:
                     continue
 
-                update = self._render_template_if_ready(track_template_, now, event)
+                update = self._render_template_if_ready(
+                    track_template_, now, event, source
+                )
                 info_changed |= self._apply_update(
                     updates, update, track_template_.template
                 )
 
+        self._async_finish_refresh(event, updates, info_changed, block_updates)
+
+    @callback
+    def _async_finish_refresh(
+        self,
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+        info_changed: bool,
+        block_updates: bool,
+    ) -> None:
+        """Update the listeners and call the action with the updates."""
         if info_changed:
             assert self._track_state_changes
             self._track_state_changes.async_update_listeners(
@@ -1964,11 +2105,22 @@ def _event_triggers_rerender(
 ) -> bool:
     """Determine if a template should be re-rendered from an event."""
     entity_id = event.data["entity_id"]
+    old_state = event.data["old_state"]
+    new_state = event.data["new_state"]
 
     if info.filter(entity_id):
-        return True
+        # If the template only read state values, a change to the
+        # attributes or last_updated cannot change the result. A forced
+        # update with the same state still moves last_changed.
+        return not (
+            info.state_values_only
+            and old_state is not None
+            and new_state is not None
+            and old_state.state == new_state.state
+            and old_state.last_changed == new_state.last_changed
+        )
 
-    if event.data["new_state"] is not None and event.data["old_state"] is not None:
+    if new_state is not None and old_state is not None:
         return False
 
     return bool(info.filter_lifecycle(entity_id))
@@ -57,6 +57,17 @@ class BaseRegistryItems[_DataT](UserDict[str, _DataT], ABC):
         if not entries:
             del index[value]
 
+    def _get_entries_for_index_value(
+        self, value: str, index: RegistryIndexType
+    ) -> list[_DataT]:
+        """Get the entries indexed under a value.
+
+        value is the indexed value such as config_entry_id or device_id.
+        index is the index to look the value up in.
+        """
+        data = self.data
+        return [data[key] for key in index.get(value, ())]
+
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         self._unindex_entry(key)
@@ -18,9 +18,9 @@ from . import start
 from .entity import Entity
 from .event import async_track_time_interval
 from .frame import report
-from .json import JSONEncoder
+from .json import JSONEncoder, json_bytes, json_fragment
 from .singleton import singleton
-from .storage import Store
+from .storage import AppendLogStore, Store
 
 DATA_RESTORE_STATE: HassKey[RestoreStateData] = HassKey("restore_state")
 
@@ -35,6 +35,9 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How long the last seen time of an unchanged state may lag behind when dumping
+STATE_LAST_SEEN_REFRESH_INTERVAL = timedelta(days=1)
+
 
 class ExtraStoredData(ABC):
     """Object to hold extra stored data."""
@@ -134,11 +137,16 @@ class RestoreStateData:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
-        self.store = Store[list[dict[str, Any]]](
+        self.store: Store[list[dict[str, Any]]] = AppendLogStore(
             hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # The state, encoded extra data, last seen time and encoded stored
+        # state of each entity in the last dump
+        self._dumped_states: dict[
+            str, tuple[State, bytes | None, datetime, json_fragment]
+        ] = {}
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -214,16 +222,57 @@ class RestoreStateData:
 
         return stored_states
 
+    @callback
+    def _async_encode_stored_states(self) -> list[dict[str, Any]]:
+        """Encode the states which should be stored.
+
+        Stored states whose state and extra data did not change since the last
+        dump reuse their encoding, and keep their last seen time until it lags
+        behind by STATE_LAST_SEEN_REFRESH_INTERVAL, so they are not written
+        again by the store.
+        """
+        dumped_states = self._dumped_states
+        new_dumped_states: dict[
+            str, tuple[State, bytes | None, datetime, json_fragment]
+        ] = {}
+        encoded_states: list[Any] = []
+        for stored_state in self.async_get_stored_states():
+            state = stored_state.state
+            extra_data: bytes | None = None
+            if stored_state.extra_data:
+                try:
+                    extra_data = json_bytes(stored_state.extra_data.as_dict())
+                except TypeError:
+                    # Let the store report the data that cannot be serialized
+                    encoded_states.append(stored_state.as_dict())
+                    continue
+            last_seen = stored_state.last_seen
+            if (
+                (dumped := dumped_states.get(state.entity_id)) is None
+                or dumped[0] is not state
+                or dumped[1] != extra_data
+                or last_seen - dumped[2] >= STATE_LAST_SEEN_REFRESH_INTERVAL
+            ):
+                encoded = json_fragment(
+                    json_bytes(
+                        {
+                            "state": state.json_fragment,
+                            "extra_data": extra_data and json_fragment(extra_data),
+                            "last_seen": last_seen,
+                        }
+                    )
+                )
+                dumped = (state, extra_data, last_seen, encoded)
+            new_dumped_states[state.entity_id] = dumped
+            encoded_states.append(dumped[3])
+        self._dumped_states = new_dumped_states
+        return encoded_states
+
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
+            await self.store.async_save(self._async_encode_stored_states())
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
 
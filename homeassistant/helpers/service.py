@@ -32,6 +32,7 @@ from homeassistant.const import (
 from homeassistant.core import (
     Context,
     EntityServiceResponse,
+    Event,
     HassJob,
     HassJobType,
     HomeAssistant,
@@ -76,6 +77,14 @@ _LOGGER = logging.getLogger(__name__)
 SERVICE_DESCRIPTION_CACHE: HassKey[dict[tuple[str, str], dict[str, Any] | None]] = (
     HassKey("service_description_cache")
 )
+type _TargetKeyType = tuple[
+    frozenset[str], frozenset[str], frozenset[str], frozenset[str]
+]
+TARGET_RESOLUTION_CACHE: HassKey[dict[_TargetKeyType, SelectedEntities]] = HassKey(
+    "service_target_resolution_cache"
+)
+TARGET_RESOLUTION_CACHE_SIZE = 256
+
 ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[
     tuple[set[tuple[str, str]], dict[str, dict[str, Any]]]
 ] = HassKey("all_service_descriptions_cache")
@@ -502,7 +511,7 @@ def _has_match(ids: str | list[str] | None) -> TypeGuard[str | list[str]]:
 
 
 @bind_hass
-def async_extract_referenced_entity_ids(  # noqa: C901
+def async_extract_referenced_entity_ids(
     hass: HomeAssistant, service_call: ServiceCall, expand_group: bool = True
 ) -> SelectedEntities:
     """Extract referenced entity IDs from a service call."""
@@ -526,6 +535,67 @@ def async_extract_referenced_entity_ids(  # noqa: C901
     ):
         return selected
 
+    cache = _async_get_target_resolution_cache(hass)
+    key = (
+        frozenset(selector.device_ids),
+        frozenset(selector.area_ids),
+        frozenset(selector.floor_ids),
+        frozenset(selector.label_ids),
+    )
+    if (resolved := cache.get(key)) is None:
+        resolved = _async_resolve_registry_targets(hass, selector)
+        if len(cache) >= TARGET_RESOLUTION_CACHE_SIZE:
+            # Evict the oldest resolution
+            del cache[next(iter(cache))]
+        cache[key] = resolved
+
+    # Copy the cached sets since callers may modify the result
+    selected.indirectly_referenced.update(resolved.indirectly_referenced)
+    selected.missing_devices.update(resolved.missing_devices)
+    selected.missing_areas.update(resolved.missing_areas)
+    selected.missing_floors.update(resolved.missing_floors)
+    selected.missing_labels.update(resolved.missing_labels)
+    selected.referenced_devices.update(resolved.referenced_devices)
+    selected.referenced_areas.update(resolved.referenced_areas)
+    return selected
+
+
+@callback
+def _async_get_target_resolution_cache(
+    hass: HomeAssistant,
+) -> dict[_TargetKeyType, SelectedEntities]:
+    """Return the target resolution cache.
+
+    The cache is cleared whenever one of the registries the targets are
+    resolved with is updated.
+    """
+    if (cache := hass.data.get(TARGET_RESOLUTION_CACHE)) is not None:
+        return cache
+
+    cache = hass.data[TARGET_RESOLUTION_CACHE] = {}
+
+    @callback
+    def _async_clear_cache(_event: Event[Any]) -> None:
+        """Clear the target resolution cache."""
+        cache.clear()
+
+    for event_type in (
+        area_registry.EVENT_AREA_REGISTRY_UPDATED,
+        device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+        entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+        floor_registry.EVENT_FLOOR_REGISTRY_UPDATED,
+        label_registry.EVENT_LABEL_REGISTRY_UPDATED,
+    ):
+        hass.bus.async_listen(event_type, _async_clear_cache)
+    return cache
+
+
+@callback
+def _async_resolve_registry_targets(  # noqa: C901
+    hass: HomeAssistant, selector: ServiceTargetSelector
+) -> SelectedEntities:
+    """Resolve the device, area, floor and label targets of a selector."""
+    selected = SelectedEntities()
     entities = entity_registry.async_get(hass).entities
     dev_reg = device_registry.async_get(hass)
     area_reg = area_registry.async_get(hass)
@@ -1153,10 +1223,7 @@ def verify_domain_control(
 
             authorized = False
 
-            for entity in reg.entities.values():
-                if entity.platform != domain:
-                    continue
-
+            for entity in reg.entities.get_entries_for_platform(domain):
                 if user.permissions.check_entity(entity.entity_id, POLICY_CONTROL):
                     authorized = True
                     break
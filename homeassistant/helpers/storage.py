@@ -6,9 +6,11 @@ import asyncio
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
+import hashlib
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
+import mmap
 import os
 from pathlib import Path
 from typing import Any
@@ -49,6 +51,14 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+APPEND_LOG_SUFFIX = ".log"
+# A log that does not belong to the snapshot is moved aside instead of replayed
+APPEND_LOG_ORPHANED_SUFFIX = ".orphaned"
+# The key of the snapshot content id that the log header refers to
+APPEND_LOG_GENERATION = "log_generation"
+# The log is compacted into the snapshot once it outgrows the snapshot
+APPEND_LOG_MIN_COMPACT_SIZE = 64 * 1024
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -573,3 +583,389 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+
+class AppendLogStore[_T: Mapping[str, Any] | Sequence[Any]](Store[_T]):
+    """Store that appends changes to a log instead of rewriting the file.
+
+    The file at path stays a regular store file that is readable by the
+    existing load and migration code; it is a snapshot of the data. When the
+    data is a list, or a dict of lists, a save after the first one appends a
+    record for each changed slice of a list to a log next to the snapshot, so
+    changing a single item appends a single item.
+
+    Changes are found by comparing a digest of each item with the digest it
+    had in the last write. Items that are json fragments are expected to be
+    replaced rather than modified, so the digest of a fragment that was
+    already written is reused without serializing it again.
+
+    The log is compacted into the snapshot when it outgrows the snapshot,
+    when anything besides the lists changes, when Home Assistant shuts down
+    and when the store is loaded with a log left behind. The snapshot and
+    the log header both hold an id derived from the content of the snapshot,
+    so the log still applies after the files are copied or restored from a
+    backup. A log that does not belong to the snapshot is moved aside with a
+    warning.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the append log store."""
+        super().__init__(*args, **kwargs)
+        self._log_items: dict[str | None, _LogItems] | None = None
+        self._log_rest: bytes | None = None
+        self._log_generation: str | None = None
+        self._log_snapshot_id: tuple[int, int, int] | None = None
+        self._log_size = 0
+        self._compact_on_write = False
+        self._unsub_final_compact_listener: CALLBACK_TYPE | None = None
+
+    @cached_property
+    def log_path(self) -> str:
+        """Return the path of the log."""
+        return f"{self.path}{APPEND_LOG_SUFFIX}"
+
+    async def _async_load_data(self):
+        """Load the data."""
+        if self._data is None and await self.hass.async_add_executor_job(
+            self._compact_log
+        ):
+            # The preloaded snapshot, if any, does not include the log
+            self._manager.async_invalidate(self.key)
+        return await super()._async_load_data()
+
+    async def _async_handle_write_data(self, *_args):
+        """Handle writing the config."""
+        if self.hass.state in (CoreState.stopping, CoreState.final_write):
+            # Keep the snapshot up to date for backups and other readers
+            self._compact_on_write = True
+        await super()._async_handle_write_data(*_args)
+        if self._log_size and self._unsub_final_compact_listener is None:
+            self._unsub_final_compact_listener = self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_compact_on_final_write
+            )
+
+    async def _async_compact_on_final_write(self, _event: Event) -> None:
+        """Compact the log because Home Assistant is in final write state."""
+        self._unsub_final_compact_listener = None
+        async with self._write_lock:
+            if not self._log_size:
+                return
+            self._log_items = None
+            self._log_size = 0
+            try:
+                await self.hass.async_add_executor_job(self._compact_log)
+            except (HomeAssistantError, OSError) as err:
+                _LOGGER.error("Error compacting log for %s: %s", self.key, err)
+
+    async def async_remove(self) -> None:
+        """Remove all data."""
+        if self._unsub_final_compact_listener is not None:
+            self._unsub_final_compact_listener()
+            self._unsub_final_compact_listener = None
+        self._log_items = None
+        self._log_size = 0
+        await super().async_remove()
+        with suppress(FileNotFoundError):
+            await self.hass.async_add_executor_job(os.unlink, self.log_path)
+
+    def _compact_log(self) -> bool:
+        """Fold a log left behind into the snapshot and return if it changed."""
+        try:
+            with open(self.log_path, "rb") as log_file:
+                generation, records = self._read_log(log_file.fileno())
+        except FileNotFoundError:
+            return False
+
+        if records:
+            try:
+                data = json_util.load_json(self.path)
+            except HomeAssistantError as err:
+                # Leave it to the regular load to deal with the snapshot
+                _LOGGER.warning("Unable to replay log for %s: %s", self.key, err)
+                return False
+            if (
+                not isinstance(data, dict)
+                or "data" not in data
+                or generation is None
+                or data.get(APPEND_LOG_GENERATION) != generation
+            ):
+                orphaned_path = f"{self.log_path}{APPEND_LOG_ORPHANED_SUFFIX}"
+                _LOGGER.warning(
+                    "The %s log with %s changes does not belong to the stored "
+                    "data and was not replayed, it was moved to %s",
+                    self.key,
+                    len(records),
+                    orphaned_path,
+                )
+                os.replace(self.log_path, orphaned_path)
+                return False
+            _LOGGER.info("Replaying %s changes from the %s log", len(records), self.key)
+            stored = data["data"]
+            for record in records:
+                items = stored if record["c"] is None else stored[record["c"]]
+                items[record["s"] : record["e"]] = record["i"]
+            # The log must not be replayed again if it outlives the rewrite
+            del data[APPEND_LOG_GENERATION]
+            json_helper.save_json(
+                self.path,
+                data,
+                self._private,
+                encoder=self._encoder,
+                atomic_writes=self._atomic_writes,
+            )
+
+        os.unlink(self.log_path)
+        return bool(records)
+
+    def _read_log(self, fileno: int) -> tuple[str | None, list[dict[str, Any]]]:
+        """Read the snapshot generation and the records of the log."""
+        if not os.fstat(fileno).st_size:
+            return None, []
+        records: list[dict[str, Any]] = []
+        with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mapped:
+            try:
+                header = json_util.json_loads(mapped.readline())
+            except JSONDecodeError:
+                header = None
+            generation = header.get("generation") if isinstance(header, dict) else None
+            while line := mapped.readline():
+                try:
+                    records.append(json_util.json_loads(line))  # type: ignore[arg-type]
+                except JSONDecodeError:
+                    # A record that was not fully written before a crash
+                    _LOGGER.warning(
+                        "Ignoring an incomplete record at the end of the %s log",
+                        self.key,
+                    )
+                    break
+        return generation if isinstance(generation, str) else None, records
+
+    def _write_data(self, path: str, data: dict) -> None:
+        """Write the data."""
+        if "data_func" in data:
+            data["data"] = data.pop("data_func")()
+
+        lists: dict[str | None, list[Any]] | None = None
+        collections: dict[str | None, _LogItems] | None = None
+        rest = b""
+        # A custom encoder is only used by the snapshot, and serialization
+        # errors are raised as SerializationError by the snapshot write
+        if self._encoder in (None, json_helper.JSONEncoder):
+            with suppress(TypeError):
+                lists, rest = _split_collections(data)
+                if lists is not None:
+                    old_collections = self._log_items or {}
+                    collections = {
+                        name: _LogItems.from_items(items, old_collections.get(name))
+                        for name, items in lists.items()
+                    }
+
+        if (
+            lists is None
+            or collections is None
+            or self._log_items is None
+            or self._compact_on_write
+            or rest != self._log_rest
+            or not self._can_append(path)
+        ):
+            self._write_snapshot(path, data, collections, rest)
+            return
+
+        log_items = self._log_items
+        log_data = b"".join(
+            _log_records(name, items, collections[name], log_items[name])
+            for name, items in lists.items()
+        )
+        if not log_data:
+            self._log_items = collections
+            return
+        if not self._log_size:
+            log_data = (
+                b'{"generation":'
+                + json_helper.json_bytes(self._log_generation)
+                + b"}\n"
+                + log_data
+            )
+        _LOGGER.debug("Appending data for %s to %s", self.key, self.log_path)
+        try:
+            fd = os.open(
+                self.log_path,
+                os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+                0o600 if self._private else 0o644,
+            )
+            try:
+                os.write(fd, log_data)
+                if self._atomic_writes:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError as error:
+            # The next write will start over from a fresh snapshot
+            self._log_items = None
+            _LOGGER.exception("Appending to log failed: %s", self.log_path)
+            raise WriteError(error) from error
+        self._log_items = collections
+        self._log_size += len(log_data)
+
+    def _can_append(self, path: str) -> bool:
+        """Return if the snapshot is unchanged and the log is small enough."""
+        try:
+            snapshot_stat = os.stat(path)
+        except OSError:
+            return False
+        if _stat_id(snapshot_stat) != self._log_snapshot_id:
+            return False
+        return self._log_size < max(APPEND_LOG_MIN_COMPACT_SIZE, snapshot_stat.st_size)
+
+    def _write_snapshot(
+        self,
+        path: str,
+        data: dict,
+        collections: dict[str | None, _LogItems] | None,
+        rest: bytes,
+    ) -> None:
+        """Write the whole data to the snapshot and start a new log."""
+        self._log_items = None
+        self._compact_on_write = False
+        generation: str | None = None
+        if collections is not None:
+            generation = _log_generation(collections, rest)
+            data[APPEND_LOG_GENERATION] = generation
+        super()._write_data(path, data)
+        with suppress(FileNotFoundError):
+            os.unlink(self.log_path)
+        if collections is None:
+            return
+        self._log_items = collections
+        self._log_rest = rest
+        self._log_generation = generation
+        self._log_snapshot_id = _stat_id(os.stat(path))
+        self._log_size = 0
+
+
+class _LogItems:
+    """Digests of the items of a list as of the last write."""
+
+    __slots__ = ("digests", "fragments")
+
+    def __init__(
+        self,
+        digests: list[bytes],
+        fragments: dict[int, tuple[json_helper.json_fragment, bytes]],
+    ) -> None:
+        """Initialize the digests."""
+        self.digests = digests
+        # The digest of each fragment by id, holding a reference to the
+        # fragment so the id is not reused while it is in the mapping
+        self.fragments = fragments
+
+    @classmethod
+    def from_items(cls, items: list[Any], old: _LogItems | None) -> _LogItems:
+        """Return the digests of items, reusing those of written fragments."""
+        old_fragments = old.fragments if old is not None else {}
+        fragments: dict[int, tuple[json_helper.json_fragment, bytes]] = {}
+        digests: list[bytes] = []
+        for item in items:
+            if type(item) is not json_helper.json_fragment:
+                digests.append(_item_digest(item))
+                continue
+            if (fragment := old_fragments.get(id(item))) is None:
+                fragment = (item, _item_digest(item))
+            fragments[id(item)] = fragment
+            digests.append(fragment[1])
+        return cls(digests, fragments)
+
+
+def _item_digest(item: Any) -> bytes:
+    """Return the digest of the serialized item."""
+    return hashlib.blake2b(json_helper.json_bytes(item), digest_size=16).digest()
+
+
+def _stat_id(stat_result: os.stat_result) -> tuple[int, int, int]:
+    """Return a tuple that changes when a file is replaced."""
+    return (stat_result.st_ino, stat_result.st_size, stat_result.st_mtime_ns)
+
+
+def _log_generation(collections: dict[str | None, _LogItems], rest: bytes) -> str:
+    """Return an id for the content of a snapshot."""
+    digest = hashlib.blake2b(rest, digest_size=16)
+    for name, log_items in collections.items():
+        digest.update(json_helper.json_bytes(name))
+        digest.update(b"".join(log_items.digests))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _split_collections(
+    data: dict[str, Any],
+) -> tuple[dict[str | None, list[Any]] | None, bytes]:
+    """Split the lists in the data from the rest of it.
+
+    Returns the lists, keyed by None when the data itself is a list, and
+    everything else serialized as a single value.
+    """
+    header = {key: value for key, value in data.items() if key != "data"}
+    stored = data["data"]
+    json_bytes = json_helper.json_bytes
+    if isinstance(stored, list):
+        return {None: stored}, json_bytes(header)
+    if not isinstance(stored, dict):
+        return None, b""
+    lists: dict[str | None, list[Any]] = {}
+    values: dict[str, Any] = {}
+    for key, value in stored.items():
+        if isinstance(value, list):
+            lists[key] = value
+        else:
+            values[key] = value
+    return lists, json_bytes([header, list(lists), values])
+
+
+def _log_records(
+    name: str | None, items: list[Any], log_items: _LogItems, old_log_items: _LogItems
+) -> bytes:
+    """Return the log records that turn the old items into items."""
+    digests = log_items.digests
+    old_digests = old_log_items.digests
+    if digests == old_digests:
+        return b""
+    start = 0
+    common = min(len(digests), len(old_digests))
+    while start < common and digests[start] == old_digests[start]:
+        start += 1
+    end = len(digests)
+    old_end = len(old_digests)
+    while (
+        end > start and old_end > start and digests[end - 1] == old_digests[old_end - 1]
+    ):
+        end -= 1
+        old_end -= 1
+
+    # Each hunk replaces old_items[start:old_end] with items[start:end]
+    hunks: list[tuple[int, int, int]] = []
+    if end != old_end:
+        hunks.append((start, old_end, end))
+    else:
+        # Items were only changed in place, write each run of changed items
+        # on its own so scattered changes do not rewrite everything between
+        idx = start
+        while idx < end:
+            run_start = idx
+            while idx < end and digests[idx] != old_digests[idx]:
+                idx += 1
+            hunks.append((run_start, idx, idx))
+            while idx < end and digests[idx] == old_digests[idx]:
+                idx += 1
+
+    json_bytes = json_helper.json_bytes
+    name_json = json_bytes(name)
+    return b"".join(
+        b'{"c":%s,"s":%d,"e":%d,"i":[%s]}\n'
+        % (
+            name_json,
+            hunk_start,
+            hunk_old_end,
+            b",".join(json_bytes(item) for item in items[hunk_start:hunk_end]),
+        )
+        for hunk_start, hunk_old_end, hunk_end in hunks
+    )
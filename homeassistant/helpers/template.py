@@ -6,13 +6,16 @@ from ast import literal_eval
 import asyncio
 import base64
 import collections.abc
-from collections.abc import Callable, Generator, Iterable
+from collections.abc import Callable, Collection, Generator, Iterable
 from contextlib import AbstractContextManager
 from contextvars import ContextVar
 from datetime import date, datetime, time, timedelta
 from functools import cache, lru_cache, partial, wraps
+import hashlib
+import importlib.util
 import json
 import logging
+import marshal
 import math
 from operator import contains
 import pathlib
@@ -21,6 +24,8 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+import threading
+from time import perf_counter
 from types import CodeType, TracebackType
 from typing import Any, Concatenate, Literal, NoReturn, Self, cast, overload
 from urllib.parse import urlencode as urllib_urlencode
@@ -28,7 +33,7 @@ import weakref
 
 from awesomeversion import AwesomeVersion
 import jinja2
-from jinja2 import pass_context, pass_environment, pass_eval_context
+from jinja2 import nodes, pass_context, pass_environment, pass_eval_context
 from jinja2.runtime import AsyncLoopContext, LoopContext
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace
@@ -48,6 +53,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__ as HA_VERSION,
 )
 from homeassistant.core import (
     Context,
@@ -84,6 +90,7 @@ from . import (
 )
 from .deprecation import deprecated_function
 from .singleton import singleton
+from .storage import Store
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -101,6 +108,14 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_RENDER_PROFILE: HassKey[dict[str, TemplateRenderStats]] = HassKey(
+    "template.render_profile"
+)
+_BYTECODE_CACHE: HassKey[TemplateBytecodeCache] = HassKey("template.bytecode_cache")
+
+BYTECODE_CACHE_STORAGE_KEY = "core.template_bytecode"
+BYTECODE_CACHE_STORAGE_VERSION = 1
+BYTECODE_CACHE_SAVE_DELAY = 300
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -123,10 +138,55 @@ _COLLECTABLE_STATE_ATTRIBUTES = {
     "name",
 }
 
+# State attributes that can only change when the state value changes
+_STATE_VALUE_ATTRIBUTES = {
+    "state",
+    "last_changed",
+    "domain",
+    "object_id",
+}
+
 ALL_STATES_RATE_LIMIT = 60  # seconds
 DOMAIN_STATES_RATE_LIMIT = 1  # seconds
 
 _render_info: ContextVar[RenderInfo | None] = ContextVar("_render_info", default=None)
+_states_snapshot: ContextVar[StatesSnapshot | None] = ContextVar(
+    "_states_snapshot", default=None
+)
+
+# Globals, filters and tests that read data other than the state machine
+# (registries, translations, custom templates). Templates using them are
+# always rendered in the event loop.
+_LOOP_ONLY_NAMES = frozenset(
+    {
+        "area_devices",
+        "area_entities",
+        "area_id",
+        "area_name",
+        "areas",
+        "config_entry_attr",
+        "config_entry_id",
+        "device_attr",
+        "device_entities",
+        "device_id",
+        "floor_areas",
+        "floor_id",
+        "floor_name",
+        "floors",
+        "integration_entities",
+        "is_device_attr",
+        "is_hidden_entity",
+        "issue",
+        "issues",
+        "label_areas",
+        "label_devices",
+        "label_entities",
+        "label_id",
+        "label_name",
+        "labels",
+        "state_translated",
+    }
+)
 
 
 template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
@@ -369,6 +429,92 @@ def _cached_parse_result(render_result: str) -> Any:
     return render_result
 
 
+class TemplateRenderStats:
+    """Holds the cost of the renders of a template while profiling."""
+
+    __slots__ = (
+        "renders",
+        "total_time",
+        "max_time",
+        "entities",
+        "domains",
+        "all_states",
+        "triggers",
+    )
+
+    def __init__(self) -> None:
+        """Initialise."""
+        self.renders = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        # What the last render read from the state machine
+        self.entities = 0
+        self.domains = 0
+        self.all_states = False
+        # What caused tracked templates to re-render
+        self.triggers: collections.Counter[str] = collections.Counter()
+
+    def add_render(self, render_time: float, render_info: RenderInfo | None) -> None:
+        """Add a render of the template."""
+        self.renders += 1
+        self.total_time += render_time
+        self.max_time = max(self.max_time, render_time)
+        if render_info is not None:
+            self.entities = len(render_info.entities)
+            self.domains = len(render_info.domains)
+            self.all_states = render_info.all_states
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the stats."""
+        return {
+            "renders": self.renders,
+            "total_time": self.total_time,
+            "max_time": self.max_time,
+            "entities": self.entities,
+            "domains": self.domains,
+            "all_states": self.all_states,
+            "triggers": dict(self.triggers),
+        }
+
+
+@callback
+def async_start_render_profiling(hass: HomeAssistant) -> None:
+    """Start recording the cost of template renders.
+
+    Only renders in the event loop are recorded, templates rendered in the
+    executor against a StatesSnapshot do not cost loop time.
+    """
+    hass.data.setdefault(_RENDER_PROFILE, {})
+
+
+@callback
+def async_stop_render_profiling(hass: HomeAssistant) -> dict[str, TemplateRenderStats]:
+    """Stop recording the cost of template renders and return what was recorded."""
+    return hass.data.pop(_RENDER_PROFILE, {})
+
+
+@callback
+def async_get_render_profile(
+    hass: HomeAssistant,
+) -> dict[str, TemplateRenderStats] | None:
+    """Return the recorded cost of template renders, keyed by template.
+
+    Returns None if render profiling is not running.
+    """
+    return hass.data.get(_RENDER_PROFILE)
+
+
+@callback
+def async_record_render_trigger(template: Template, source: str) -> None:
+    """Record what caused a template to re-render while profiling."""
+    if template.hass is None:
+        return
+    if (profile := template.hass.data.get(_RENDER_PROFILE)) is not None:
+        if (stats := profile.get(template.template)) is None:
+            stats = profile[template.template] = TemplateRenderStats()
+        stats.triggers[source] += 1
+
+
 class RenderInfo:
     """Holds information about a template render."""
 
@@ -386,6 +532,7 @@ class RenderInfo:
         "entities",
         "rate_limit",
         "has_time",
+        "state_values_only",
     )
 
     def __init__(self, template: Template) -> None:
@@ -404,6 +551,9 @@ class RenderInfo:
         self.entities: collections.abc.Set[str] = set()
         self.rate_limit: float | None = None
         self.has_time = False
+        # True as long as the template only read the state value of
+        # entities, and not their attributes, context or last_updated
+        self.state_values_only = True
 
     def __repr__(self) -> str:
         """Representation of RenderInfo."""
@@ -416,6 +566,7 @@ class RenderInfo:
             f" entities={self.entities}"
             f" rate_limit={self.rate_limit}"
             f" has_time={self.has_time}"
+            f" state_values_only={self.state_values_only}"
             f" exception={self.exception}"
             f" is_static={self.is_static}"
             ">"
@@ -470,6 +621,7 @@ class RenderInfo:
                 self.rate_limit = DOMAIN_STATES_RATE_LIMIT
 
         if self.exception:
+            self.state_values_only = False
             return
 
         if not self.all_states_lifecycle:
@@ -505,6 +657,7 @@ class Template:
         "_log_fn",
         "_hash_cache",
         "_renders",
+        "_offload_safe",
     )
 
     def __init__(self, template: str, hass: HomeAssistant | None = None) -> None:
@@ -539,6 +692,7 @@ class Template:
         self._log_fn: Callable[[int, str], None] | None = None
         self._hash_cache: int = hash(self.template)
         self._renders: int = 0
+        self._offload_safe: bool | None = None
 
     @property
     def _env(self) -> TemplateEnvironment:
@@ -629,7 +783,14 @@ class Template:
             kwargs.update(variables)
 
         try:
-            render_result = _render_with_context(self.template, compiled, **kwargs)
+            if (
+                self.hass is not None
+                and (profile := self.hass.data.get(_RENDER_PROFILE)) is not None
+                and _states_snapshot.get() is None
+            ):
+                render_result = self._render_profiled(profile, compiled, kwargs)
+            else:
+                render_result = _render_with_context(self.template, compiled, **kwargs)
         except Exception as err:
             raise TemplateError(err) from err
 
@@ -645,6 +806,21 @@ class Template:
 
         return self._parse_result(render_result)
 
+    def _render_profiled(
+        self,
+        profile: dict[str, TemplateRenderStats],
+        compiled: jinja2.Template,
+        kwargs: dict[str, Any],
+    ) -> str:
+        """Render the template and record the time it took."""
+        if (stats := profile.get(self.template)) is None:
+            stats = profile[self.template] = TemplateRenderStats()
+        start = perf_counter()
+        try:
+            return _render_with_context(self.template, compiled, **kwargs)
+        finally:
+            stats.add_render(perf_counter() - start, _render_info.get())
+
     def _parse_result(self, render_result: str) -> Any:
         """Parse the result."""
         try:
@@ -744,6 +920,60 @@ class Template:
             render_info._freeze_static()  # noqa: SLF001
             return render_info
 
+        return self._render_to_info(render_info, variables, strict, log_fn, **kwargs)
+
+    @property
+    def offload_safe(self) -> bool:
+        """Return if the template can be rendered against a StatesSnapshot.
+
+        This is the case when the template only reads the state machine and
+        does not use registries, translations or custom templates.
+        """
+        if self._offload_safe is None:
+            self._offload_safe = self._is_offload_safe()
+        return self._offload_safe
+
+    def _is_offload_safe(self) -> bool:
+        if self.is_static or self.hass is None or self._limited:
+            return False
+        try:
+            ast = self._env.parse(self.template)
+        except jinja2.TemplateError:
+            return False
+        if any(ast.find_all((nodes.Import, nodes.FromImport, nodes.Include))):
+            return False
+        # Globals are not reported as undeclared variables, so collect every
+        # name the template references
+        names = {
+            node.name for node in ast.find_all((nodes.Name, nodes.Filter, nodes.Test))
+        }
+        return names.isdisjoint(_LOOP_ONLY_NAMES)
+
+    def render_to_info_with_snapshot(
+        self, snapshot: StatesSnapshot, variables: TemplateVarsType = None
+    ) -> RenderInfo:
+        """Render the template against a snapshot of the states.
+
+        The template must be offload safe and compiled by an earlier render
+        in the event loop. This method is intended to run in the executor.
+        """
+        assert self._compiled is not None, "template was not rendered before"
+        self._renders += 1
+        token = _states_snapshot.set(snapshot)
+        try:
+            return self._render_to_info(RenderInfo(self), variables)
+        finally:
+            _states_snapshot.reset(token)
+
+    def _render_to_info(
+        self,
+        render_info: RenderInfo,
+        variables: TemplateVarsType = None,
+        strict: bool = False,
+        log_fn: Callable[[int, str], None] | None = None,
+        **kwargs: Any,
+    ) -> RenderInfo:
+        """Render the template and collect the entities it accessed."""
         token = _render_info.set(render_info)
         try:
             render_info._result = self.async_render(  # noqa: SLF001
@@ -880,6 +1110,41 @@ def _readonly(*args: Any, **kwargs: Any) -> Any:
     raise RuntimeError(f"Cannot modify template States object: {args} {kwargs}")
 
 
+class StatesSnapshot:
+    """Frozen copy of the state machine to render templates outside the loop."""
+
+    __slots__ = ("_states", "_domain_states")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Copy the current states.
+
+        This method must be run in the event loop.
+        """
+        self._states = hass.states._states_data.copy()  # noqa: SLF001
+        self._domain_states: dict[str, list[State]] = {}
+
+    def get(self, entity_id: str) -> State | None:
+        """Return the state of an entity."""
+        return self._states.get(entity_id) or self._states.get(entity_id.lower())
+
+    def states(self, domain: str | None = None) -> Collection[State]:
+        """Return all states, or the states of a domain."""
+        if domain is None:
+            return self._states.values()
+        domain = domain.lower()
+        if (states := self._domain_states.get(domain)) is None:
+            states = self._domain_states[domain] = [
+                state for state in self._states.values() if state.domain == domain
+            ]
+        return states
+
+    def entity_ids_count(self, domain: str | None = None) -> int:
+        """Return the number of entities, or the number of entities of a domain."""
+        if domain is None:
+            return len(self._states)
+        return len(self.states(domain))
+
+
 class AllStates:
     """Class to expose all HA states as attributes."""
 
@@ -924,6 +1189,8 @@ class AllStates:
     def __len__(self) -> int:
         """Return number of states."""
         self._collect_all_lifecycle()
+        if (snapshot := _states_snapshot.get()) is not None:
+            return snapshot.entity_ids_count()
         return self._hass.states.async_entity_ids_count()
 
     def __call__(
@@ -1014,6 +1281,8 @@ class DomainStates:
     def __len__(self) -> int:
         """Return number of states."""
         self._collect_domain_lifecycle()
+        if (snapshot := _states_snapshot.get()) is not None:
+            return snapshot.entity_ids_count(self._domain)
         return self._hass.states.async_entity_ids_count(self._domain)
 
     def __repr__(self) -> str:
@@ -1041,6 +1310,12 @@ class TemplateStateBase(State):
         self._cache: dict[str, Any] = {}
 
     def _collect_state(self) -> None:
+        if render_info := _render_info.get():
+            render_info.state_values_only = False
+            if self._collect:
+                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+
+    def _collect_state_value(self) -> None:
         if self._collect and (render_info := _render_info.get()):
             render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
 
@@ -1052,6 +1327,10 @@ class TemplateStateBase(State):
             # _collect_state inlined here for performance
             if self._collect and (render_info := _render_info.get()):
                 render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            if item not in _STATE_VALUE_ATTRIBUTES and (
+                render_info := _render_info.get()
+            ):
+                render_info.state_values_only = False
             return getattr(self._state, item)
         if item == "entity_id":
             return self._entity_id
@@ -1070,7 +1349,7 @@ class TemplateStateBase(State):
     @property
     def state(self) -> str:  # type: ignore[override]
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_state_value()
         return self._state.state
 
     @property
@@ -1082,7 +1361,7 @@ class TemplateStateBase(State):
     @property
     def last_changed(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_changed."""
-        self._collect_state()
+        self._collect_state_value()
         return self._state.last_changed
 
     @property
@@ -1106,13 +1385,13 @@ class TemplateStateBase(State):
     @property
     def domain(self) -> str:  # type: ignore[override]
         """Wrap State.domain."""
-        self._collect_state()
+        self._collect_state_value()
         return self._state.domain
 
     @property
     def object_id(self) -> str:  # type: ignore[override]
         """Wrap State.object_id."""
-        self._collect_state()
+        self._collect_state_value()
         return self._state.object_id
 
     @property
@@ -1163,6 +1442,8 @@ class TemplateState(TemplateStateBase):
 
     def __repr__(self) -> str:
         """Representation of Template State."""
+        if render_info := _render_info.get():
+            render_info.state_values_only = False
         return f"<template TemplateState({self._state!r})>"
 
 
@@ -1179,7 +1460,7 @@ class TemplateStateFromEntityId(TemplateStateBase):
 
     @property
     def _state(self) -> State:  # type: ignore[override]
-        state = self._hass.states.get(self._entity_id)
+        state = _lookup_state(self._hass, self._entity_id)
         if not state:
             state = State(self._entity_id, STATE_UNKNOWN)
         return state
@@ -1211,7 +1492,9 @@ def _state_generator(
     # ensure it does not get misused.
     #
     container: Iterable[State]
-    if domain is None:
+    if (snapshot := _states_snapshot.get()) is not None:
+        container = snapshot.states(domain)
+    elif domain is None:
         container = states._states.values()  # noqa: SLF001
     else:
         container = states.async_all(domain)
@@ -1219,15 +1502,23 @@ def _state_generator(
         yield _template_state_no_collect(hass, state)
 
 
+def _lookup_state(hass: HomeAssistant, entity_id: str) -> State | None:
+    if (snapshot := _states_snapshot.get()) is not None:
+        return snapshot.get(entity_id)
+    return hass.states.get(entity_id)
+
+
 def _get_state_if_valid(hass: HomeAssistant, entity_id: str) -> TemplateState | None:
-    state = hass.states.get(entity_id)
+    state = _lookup_state(hass, entity_id)
     if state is None and not valid_entity_id(entity_id):
         raise TemplateError(f"Invalid entity ID '{entity_id}'")
     return _get_template_state_from_state(hass, entity_id, state)
 
 
 def _get_state(hass: HomeAssistant, entity_id: str) -> TemplateState | None:
-    return _get_template_state_from_state(hass, entity_id, hass.states.get(entity_id))
+    return _get_template_state_from_state(
+        hass, entity_id, _lookup_state(hass, entity_id)
+    )
 
 
 def _get_template_state_from_state(
@@ -2806,6 +3097,96 @@ def _load_custom_templates(hass: HomeAssistant) -> dict[str, str]:
     return result
 
 
+async def async_load_bytecode_cache(hass: HomeAssistant) -> TemplateBytecodeCache:
+    """Load the persistent cache of compiled templates."""
+    bytecode_cache = TemplateBytecodeCache(hass)
+    await bytecode_cache.async_load()
+    hass.data[_BYTECODE_CACHE] = bytecode_cache
+    return bytecode_cache
+
+
+def _bytecode_environment_version() -> str:
+    """Return the version of everything that affects the compiled code."""
+    return f"{importlib.util.MAGIC_NUMBER.hex()}-{jinja2.__version__}-{HA_VERSION}"
+
+
+class TemplateBytecodeCache:
+    """Persistent cache of compiled template code.
+
+    Compiling a template to Python bytecode is the most expensive step
+    of preparing a template. The compiled code of every template that
+    is used is stored in .storage keyed by the hash of its source, so
+    warm restarts can load it with marshal instead of compiling again.
+
+    The cache is discarded when the Python, Jinja or Home Assistant
+    version changes. Only templates that were used since the cache was
+    loaded are saved so entries for templates that no longer exist are
+    eventually dropped.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the bytecode cache."""
+        self._hass = hass
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            BYTECODE_CACHE_STORAGE_VERSION,
+            BYTECODE_CACHE_STORAGE_KEY,
+            private=True,
+            atomic_writes=True,
+        )
+        self._version = _bytecode_environment_version()
+        self._loaded: dict[str, str] = {}
+        self._used: dict[str, str] = {}
+
+    async def async_load(self) -> None:
+        """Load the cache from disk."""
+        data = await self._store.async_load()
+        if data is not None and data.get("environment") == self._version:
+            self._loaded = data["code"]
+
+    async def async_save(self) -> None:
+        """Save the cache to disk now."""
+        await self._store.async_save(self._data_to_save())
+
+    def get(self, source: str) -> CodeType | None:
+        """Return the cached compiled code for a template source."""
+        key = self._key(source)
+        if (encoded := self._used.get(key)) is None:
+            if (encoded := self._loaded.pop(key, None)) is None:
+                return None
+            self._used[key] = encoded
+        try:
+            return cast(CodeType, marshal.loads(base64.b64decode(encoded)))
+        except (EOFError, TypeError, ValueError):
+            _LOGGER.debug("Discarding invalid cached bytecode for %s", source)
+            del self._used[key]
+            return None
+
+    def set(self, source: str, code: CodeType) -> None:
+        """Store the compiled code for a template source."""
+        self._used[self._key(source)] = base64.b64encode(marshal.dumps(code)).decode()
+        hass = self._hass
+        if hass.loop_thread_id == threading.get_ident():
+            self._async_schedule_save()
+        else:
+            hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    @staticmethod
+    def _key(source: str) -> str:
+        """Return the cache key for a template source."""
+        return hashlib.sha256(source.encode()).hexdigest()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the cache."""
+        self._store.async_delay_save(self._data_to_save, BYTECODE_CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to save."""
+        return {"environment": self._version, "code": dict(self._used)}
+
+
 @singleton(_HASS_LOADER)
 def _get_hass_loader(hass: HomeAssistant) -> HassLoader:
     return HassLoader({})
@@ -3207,7 +3588,20 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        bytecode_cache: TemplateBytecodeCache | None = None
+        compiled: CodeType | None = None
+        if (
+            self.hass is not None
+            and isinstance(source, str)
+            and (bytecode_cache := self.hass.data.get(_BYTECODE_CACHE)) is not None
+        ):
+            compiled = bytecode_cache.get(source)
+
+        if compiled is None:
+            compiled = super().compile(source)
+            if bytecode_cache is not None:
+                bytecode_cache.set(cast(str, source), compiled)
+
         self.template_cache[source] = compiled
         return compiled
 
@@ -6,17 +6,40 @@ import argparse
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
+from functools import partial
+import itertools
 import logging
+from pathlib import Path
+import platform
+import sys
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
+from types import MappingProxyType
 
-from homeassistant import core
-from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant import bootstrap, config as conf_util, config_entries, core, loader
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    EVENT_STATE_CHANGED,
+    __version__ as HA_VERSION,
+)
+from homeassistant.helpers import (
+    entity_registry as er,
+    recorder as recorder_helper,
+    template,
+)
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
+    TrackTemplate,
     async_track_state_change,
     async_track_state_change_event,
+    async_track_template_result,
 )
-from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.helpers.json import JSON_DUMP, json_dumps
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -30,25 +53,60 @@ def run(args):
     logging.getLogger("homeassistant.core").setLevel(logging.CRITICAL)
 
     parser = argparse.ArgumentParser(description="Run a Home Assistant benchmark.")
-    parser.add_argument("name", choices=BENCHMARKS)
+    parser.add_argument("name", choices=["all", *BENCHMARKS])
     parser.add_argument("--script", choices=["benchmark"])
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=0,
+        help="Number of times to run the benchmarks, runs until interrupted if 0",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print one JSON object per benchmark run to compare versions",
+    )
 
     args = parser.parse_args()
 
-    bench = BENCHMARKS[args.name]
-    print("Using event loop:", asyncio.get_event_loop_policy().loop_name)
+    if args.name == "all":
+        benches = list(BENCHMARKS.values())
+    else:
+        benches = [BENCHMARKS[args.name]]
+    loop_name = asyncio.get_event_loop_policy().loop_name
+    if not args.json:
+        print("Using event loop:", loop_name)
 
     with suppress(KeyboardInterrupt):
-        while True:
-            asyncio.run(run_benchmark(bench))
+        run_numbers = range(1, args.runs + 1) if args.runs else itertools.count(1)
+        for run_number in run_numbers:
+            for bench in benches:
+                runtime = asyncio.run(run_benchmark(bench))
+                if not args.json:
+                    print(f"Benchmark {bench.__name__} done in {runtime}s")
+                    continue
+                print(
+                    json_dumps(
+                        {
+                            "benchmark": bench.__name__,
+                            "run": run_number,
+                            "runtime": runtime,
+                            "version": HA_VERSION,
+                            "python": platform.python_version(),
+                            "event_loop": loop_name,
+                        }
+                    ),
+                    flush=True,
+                )
 
 
 async def run_benchmark(bench):
-    """Run a benchmark."""
-    hass = core.HomeAssistant("")
-    runtime = await bench(hass)
-    print(f"Benchmark {bench.__name__} done in {runtime}s")
-    await hass.async_stop()
+    """Run a benchmark with an empty config dir."""
+    with TemporaryDirectory() as config_dir:
+        hass = core.HomeAssistant(config_dir)
+        runtime = await bench(hass)
+        await hass.async_stop()
+    return runtime
 
 
 def benchmark[_CallableT: Callable](func: _CallableT) -> _CallableT:
@@ -308,3 +366,415 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def template_compile(hass):
+    """Compile 1000 templates cold and again from the bytecode cache."""
+    sources = [
+        f"{{% if is_state('light.kitchen_{idx}', 'on') %}}"
+        f"{{{{ states('sensor.power_{idx}') | float(0) * {idx} | round(2) }}}}"
+        "{% else %}{{ states.sensor | selectattr('state', 'eq', 'on') | list }}"
+        "{% endif %}"
+        for idx in range(1000)
+    ]
+
+    bytecode_cache = await template.async_load_bytecode_cache(hass)
+    start = timer()
+    for source in sources:
+        template.Template(source, hass).ensure_valid()
+    cold = timer() - start
+    await bytecode_cache.async_save()
+
+    # Simulate a restart by dropping the template environments
+    # and loading the bytecode cache from disk again
+    for env in list(hass.data):
+        if str(env).startswith("template.environment"):
+            hass.data.pop(env)
+    start = timer()
+    await template.async_load_bytecode_cache(hass)
+    for source in sources:
+        template.Template(source, hass).ensure_valid()
+    warm = timer() - start
+
+    print(f"Cold compile {cold}s, warm compile {warm}s", file=sys.stderr)
+    return warm
+
+
+async def _async_load_base_functionality(hass: core.HomeAssistant) -> None:
+    """Load the registries and config entries like a started instance does."""
+    hass.config.skip_pip = True
+    loader.async_setup(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await bootstrap.async_load_base_functionality(hass)
+
+
+async def _async_setup_recorder(hass: core.HomeAssistant):
+    """Set up the recorder with a SQLite database in the config dir."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import recorder
+
+    await _async_load_base_functionality(hass)
+    recorder_helper.async_initialize_recorder(hass)
+    db_url = f"sqlite:///{hass.config.path(recorder.DEFAULT_DB_FILE)}"
+    assert await async_setup_component(
+        hass, recorder.DOMAIN, {recorder.DOMAIN: {recorder.CONF_DB_URL: db_url}}
+    )
+    await hass.async_start()
+    instance = recorder.get_instance(hass)
+    assert await instance.async_db_ready
+    return instance
+
+
+def _set_power_states(hass: core.HomeAssistant, changes: int) -> None:
+    """Change the state of 100 power sensors."""
+    attributes = {"unit_of_measurement": "W", "device_class": "power"}
+    for idx in range(changes):
+        hass.states.async_set(f"sensor.power_{idx % 100}", str(idx), attributes)
+
+
+@benchmark
+async def recorder_commit(hass):
+    """Record 10k state changes in a SQLite database."""
+    instance = await _async_setup_recorder(hass)
+
+    start = timer()
+    _set_power_states(hass, 10**4)
+    await instance.async_block_till_done()
+    return timer() - start
+
+
+@benchmark
+async def recorder_history(hass):
+    """Query the history of 100 entities with 10k recorded state changes."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder import history
+
+    instance = await _async_setup_recorder(hass)
+    query_start = dt_util.utcnow() - timedelta(minutes=1)
+    _set_power_states(hass, 10**4)
+    await instance.async_block_till_done()
+
+    entity_ids = [f"sensor.power_{idx}" for idx in range(100)]
+    start = timer()
+    for _ in range(10):
+        states = await instance.async_add_executor_job(
+            partial(history.get_significant_states, hass, query_start, None, entity_ids)
+        )
+        assert len(states) == 100
+    return timer() - start
+
+
+@benchmark
+async def recorder_statistics(hass):
+    """Query a year of hourly statistics for 10 statistics."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder import statistics
+
+    instance = await _async_setup_recorder(hass)
+    hours = 365 * 24
+    first_hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    first_hour -= timedelta(hours=hours)
+    statistic_ids = {f"benchmark:energy_{idx}" for idx in range(10)}
+    for statistic_id in statistic_ids:
+        statistics.async_add_external_statistics(
+            hass,
+            {
+                "has_mean": True,
+                "has_sum": False,
+                "name": statistic_id,
+                "source": "benchmark",
+                "statistic_id": statistic_id,
+                "unit_of_measurement": "kWh",
+            },
+            [
+                {
+                    "start": first_hour + timedelta(hours=hour),
+                    "mean": hour % 24,
+                    "min": 0,
+                    "max": 24,
+                }
+                for hour in range(hours)
+            ],
+        )
+    await instance.async_block_till_done()
+
+    start = timer()
+    for period in ("hour", "day", "week", "month"):
+        result = await instance.async_add_executor_job(
+            statistics.statistics_during_period,
+            hass,
+            first_hour,
+            None,
+            statistic_ids,
+            period,
+            None,
+            {"mean", "min", "max"},
+        )
+        assert len(result) == 10
+    return timer() - start
+
+
+@benchmark
+async def template_render(hass):
+    """Render 1000 templates reading 1000 states 10 times."""
+    for idx in range(1000):
+        hass.states.async_set(f"sensor.power_{idx}", str(idx), {"unit": "W"})
+    templates = [
+        template.Template(
+            f"{{{{ states('sensor.power_{idx}') | float(0) * 2 }}}}"
+            f" {{{{ state_attr('sensor.power_{idx}', 'unit') }}}}",
+            hass,
+        )
+        for idx in range(1000)
+    ]
+
+    start = timer()
+    for _ in range(10):
+        for tpl in templates:
+            tpl.async_render()
+    return timer() - start
+
+
+@benchmark
+async def template_track(hass):
+    """Track 1000 templates through 10k state changes."""
+    count_updates = 0
+
+    @core.callback
+    def listener(*args):
+        """Handle template result."""
+        nonlocal count_updates
+        count_updates += 1
+
+    for idx in range(1000):
+        async_track_template_result(
+            hass,
+            [
+                TrackTemplate(
+                    template.Template(
+                        f"{{{{ states('sensor.power_{idx}') | float(0) > 500 }}}}",
+                        hass,
+                    ),
+                    None,
+                )
+            ],
+            listener,
+        )
+
+    start = timer()
+    for change in range(10**4):
+        hass.states.async_set(f"sensor.power_{change % 1000}", str(change))
+    await hass.async_block_till_done()
+    return timer() - start
+
+
+@benchmark
+async def subscribe_entities_fanout(hass):
+    """Fan out 10k state changes to 100 subscribe_entities connections."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.auth.models import RefreshToken, User
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import websocket_api
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api.http import WebSocketAdapter
+
+    websocket_api.commands.async_register_commands(
+        hass, websocket_api.async_register_command
+    )
+    for idx in range(1000):
+        hass.states.async_set(f"sensor.power_{idx}", str(idx))
+
+    sent_bytes = 0
+
+    def send_message(message):
+        """Count the size of the sent messages."""
+        nonlocal sent_bytes
+        sent_bytes += len(message)
+
+    user = User(name="Benchmark", perm_lookup=None, is_owner=True, is_active=True)
+    refresh_token = RefreshToken(user, None, timedelta(minutes=30))
+    for connection_id in range(100):
+        connection = websocket_api.ActiveConnection(
+            WebSocketAdapter(logging.getLogger(__name__), {"connid": connection_id}),
+            hass,
+            send_message,
+            user,
+            refresh_token,
+        )
+        connection.async_handle({"id": 1, "type": "subscribe_entities"})
+
+    start = timer()
+    for change in range(10**4):
+        hass.states.async_set(f"sensor.power_{change % 1000}", f"changed_{change}")
+    await hass.async_block_till_done()
+    assert sent_bytes
+    return timer() - start
+
+
+@benchmark
+async def entity_registry_load_save(hass):
+    """Save and load an entity registry with 10k entities."""
+    await _async_load_base_functionality(hass)
+    registry = er.async_get(hass)
+    for idx in range(10**4):
+        registry.async_get_or_create(
+            "sensor",
+            "benchmark",
+            f"power_{idx}",
+            original_name=f"Power {idx}",
+            unit_of_measurement="W",
+        )
+
+    start = timer()
+    # Flush the delayed save
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    saved = timer()
+
+    loaded_registry = er.EntityRegistry(hass)
+    await loaded_registry.async_load()
+    assert len(loaded_registry.entities) == 10**4
+    loaded = timer()
+
+    print(f"Save {saved - start}s, load {loaded - saved}s", file=sys.stderr)
+    return loaded - start
+
+
+@benchmark
+async def add_entities(hass):
+    """Add 5000 entities with a unique id to a platform."""
+
+    class BenchmarkEntity(Entity):
+        """Entity to add."""
+
+        _attr_should_poll = False
+
+        def __init__(self, idx: int) -> None:
+            """Initialize the entity."""
+            self._attr_unique_id = f"power_{idx}"
+            self._attr_name = f"Power {idx}"
+
+    await _async_load_base_functionality(hass)
+    component = EntityComponent(logging.getLogger(__name__), "sensor", hass)
+    entities = [BenchmarkEntity(idx) for idx in range(5000)]
+
+    start = timer()
+    await component.async_add_entities(entities)
+    await hass.async_block_till_done()
+    assert hass.states.async_entity_ids_count("sensor") == 5000
+    return timer() - start
+
+
+@benchmark
+async def load_yaml_config(hass):
+    """Load a configuration.yaml with includes, secrets and 2000 automations."""
+    config_dir = Path(hass.config.config_dir)
+    config_dir.joinpath("secrets.yaml").write_text(
+        "".join(f"db_url_{idx}: sqlite:///db_{idx}.db\n" for idx in range(100)),
+        encoding="utf-8",
+    )
+    config_dir.joinpath("automations.yaml").write_text(
+        "".join(
+            f"- id: automation_{idx}\n"
+            f"  alias: Automation {idx}\n"
+            "  triggers:\n"
+            "    - trigger: state\n"
+            f"      entity_id: binary_sensor.motion_{idx}\n"
+            "      to: 'on'\n"
+            "  actions:\n"
+            "    - action: light.turn_on\n"
+            "      target:\n"
+            f"        entity_id: light.room_{idx}\n"
+            "      data:\n"
+            "        brightness_pct: 50\n"
+            for idx in range(2000)
+        ),
+        encoding="utf-8",
+    )
+    config_dir.joinpath("configuration.yaml").write_text(
+        "homeassistant:\n"
+        "  name: Benchmark\n"
+        "automation: !include automations.yaml\n"
+        "recorder:\n"
+        "  db_url: !secret db_url_1\n",
+        encoding="utf-8",
+    )
+
+    start = timer()
+    for _ in range(10):
+        config = await conf_util.async_hass_config_yaml(hass)
+        assert len(config["automation"]) == 2000
+    return timer() - start
+
+
+@benchmark
+async def mqtt_dispatch(hass):
+    """Dispatch 100k MQTT messages through the MQTT client.
+
+    Every message matches a simple, a wildcard and a coalescing subscription.
+    """
+    # pylint: disable=import-outside-toplevel
+    from unittest.mock import patch
+
+    from paho.mqtt.client import MQTTMessage
+
+    from homeassistant.components.mqtt.client import MQTT
+    from homeassistant.components.mqtt.models import MqttData
+
+    count_messages = 0
+    count_coalesced = 0
+
+    @core.callback
+    def message_received(msg):
+        """Handle a message."""
+        nonlocal count_messages
+        count_messages += 1
+
+    @core.callback
+    def coalesced_message_received(msg):
+        """Handle a coalesced message."""
+        nonlocal count_coalesced
+        count_coalesced += 1
+
+    entry = config_entries.ConfigEntry(
+        data={},
+        discovery_keys=MappingProxyType({}),
+        domain="mqtt",
+        minor_version=1,
+        options={},
+        source=config_entries.SOURCE_USER,
+        title="Benchmark",
+        unique_id=None,
+        version=1,
+    )
+    client = MQTT(hass, entry, {})
+    # Mock the paho client, the client stays disconnected and the messages
+    # are passed to its message handler like paho does
+    with patch("homeassistant.components.mqtt.async_client.AsyncMQTTClient"):
+        await client.async_start(MqttData(client=client, config=[]))
+
+    topics = [f"home/room_{idx}/sensor/state" for idx in range(1000)]
+    for idx, topic in enumerate(topics):
+        client.async_subscribe(topic, message_received, 0)
+        client.async_subscribe(f"home/room_{idx}/+/state", message_received, 0)
+        client.async_subscribe(topic, coalesced_message_received, 0, coalesce_time=0.1)
+
+    messages = []
+    for message in range(10**5):
+        msg = MQTTMessage(topic=topics[message % 1000].encode())
+        msg.payload = b"on"
+        messages.append(msg)
+
+    start = timer()
+    for msg in messages:
+        client._async_mqtt_on_message(client._mqttc, None, msg)  # noqa: SLF001
+    elapsed = timer() - start
+
+    await asyncio.sleep(0.2)
+    client.cleanup()
+    assert count_messages == 2 * 10**5
+    assert count_coalesced == 1000
+    return elapsed
@@ -173,6 +173,77 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_buckets(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period downsampled into buckets."""
+    start = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    with freeze_time(start + timedelta(seconds=5)):
+        hass.states.async_set("sensor.test", "1")
+    with freeze_time(start + timedelta(seconds=15)):
+        hass.states.async_set("sensor.test", "3")
+    with freeze_time(start + timedelta(seconds=25)):
+        hass.states.async_set("sensor.test", "unavailable")
+    with freeze_time(start + timedelta(seconds=65)):
+        hass.states.async_set("sensor.test", "7")
+    with freeze_time(start + timedelta(seconds=70)):
+        hass.states.async_set("sensor.test", "5")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "end_time": (start + timedelta(seconds=120)).isoformat(),
+            "entity_ids": ["sensor.test"],
+            "buckets": 2,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "sensor.test": [
+            {
+                "start": pytest.approx(start.timestamp()),
+                "last": "unavailable",
+                "min": 1.0,
+                "max": 3.0,
+                "mean": 2.0,
+            },
+            {
+                "start": pytest.approx(start.timestamp() + 60),
+                "last": "5",
+                "min": 5.0,
+                "max": 7.0,
+                "mean": 6.0,
+            },
+        ]
+    }
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "end_time": (start + timedelta(seconds=120)).isoformat(),
+            "entity_ids": ["sensor.test"],
+            "bucket_width": 20,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert [bucket["last"] for bucket in response["result"]["sensor.test"]] == [
+        "3",
+        "unavailable",
+        "5",
+    ]
+
+
 async def test_history_during_period_impossible_conditions(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -2154,3 +2225,64 @@ async def test_history_stream_live_chained_events(
         "id": 1,
         "type": "event",
     }
+
+
+async def test_history_stream_historical_chunks(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream sends long historical windows in time-ordered chunks."""
+    start = dt_util.utcnow() - timedelta(days=3)
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    with freeze_time(start + timedelta(seconds=5)):
+        hass.states.async_set("sensor.one", "on")
+    with freeze_time(start + timedelta(days=2, seconds=5)):
+        hass.states.async_set("sensor.one", "off")
+    await async_wait_recording_done(hass)
+    first_timestamp = (start + timedelta(seconds=5)).timestamp()
+    second_timestamp = (start + timedelta(days=2, seconds=5)).timestamp()
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "entity_ids": ["sensor.one"],
+            "start_time": start.isoformat(),
+            "end_time": (start + timedelta(days=2, seconds=60)).isoformat(),
+            "include_start_time_state": False,
+            "significant_changes_only": False,
+            "no_attributes": True,
+            "minimal_response": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 1
+    assert response["type"] == "result"
+
+    # The second day has no states so only two chunks are sent
+    response = await client.receive_json()
+    assert response == {
+        "event": {
+            "end_time": pytest.approx(first_timestamp),
+            "start_time": pytest.approx(start.timestamp()),
+            "states": {
+                "sensor.one": [{"lu": pytest.approx(first_timestamp), "s": "on"}],
+            },
+        },
+        "id": 1,
+        "type": "event",
+    }
+    response = await client.receive_json()
+    assert response == {
+        "event": {
+            "end_time": pytest.approx(second_timestamp),
+            "start_time": pytest.approx((start + timedelta(days=2)).timestamp()),
+            "states": {
+                "sensor.one": [{"lu": pytest.approx(second_timestamp), "s": "off"}],
+            },
+        },
+        "id": 1,
+        "type": "event",
+    }
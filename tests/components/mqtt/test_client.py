@@ -12,7 +12,11 @@ import paho.mqtt.client as paho_mqtt
 import pytest
 
 from homeassistant.components import mqtt
-from homeassistant.components.mqtt.client import RECONNECT_INTERVAL_SECONDS
+from homeassistant.components.mqtt.client import (
+    RECONNECT_INTERVAL_SECONDS,
+    Subscription,
+    _WildcardSubscriptionTrie,
+)
 from homeassistant.components.mqtt.const import SUPPORTED_COMPONENTS
 from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
@@ -22,7 +26,13 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
     UnitOfTemperature,
 )
-from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    CoreState,
+    HassJob,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util.dt import utcnow
 
@@ -423,6 +433,42 @@ async def test_subscribe_topic_level_wildcard(
     assert recorded_calls[0].payload == "test-payload"
 
 
+async def test_subscribe_coalesce_time(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    recorded_calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test only the latest message per topic is delivered with a coalesce time."""
+    await mqtt_mock_entry()
+    unsub = mqtt.async_subscribe_internal(
+        hass, "test-topic/+/power", record_calls, coalesce_time=1
+    )
+
+    async_fire_mqtt_message(hass, "test-topic/meter1/power", "100")
+    async_fire_mqtt_message(hass, "test-topic/meter1/power", "110")
+    async_fire_mqtt_message(hass, "test-topic/meter2/power", "200")
+    async_fire_mqtt_message(hass, "test-topic/meter1/power", "120")
+    await hass.async_block_till_done()
+    assert len(recorded_calls) == 0
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert sorted((msg.topic, msg.payload) for msg in recorded_calls) == [
+        ("test-topic/meter1/power", "120"),
+        ("test-topic/meter2/power", "200"),
+    ]
+
+    # Pending messages are dropped when unsubscribing
+    recorded_calls.clear()
+    async_fire_mqtt_message(hass, "test-topic/meter1/power", "130")
+    await hass.async_block_till_done()
+    unsub()
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=4))
+    await hass.async_block_till_done()
+    assert len(recorded_calls) == 0
+
+
 async def test_subscribe_topic_level_wildcard_no_subtree_match(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -649,6 +695,45 @@ async def test_subscribe_special_characters(
     assert recorded_calls[0].payload == payload
 
 
+@pytest.mark.parametrize(
+    ("topic", "expected"),
+    [
+        ("home/kitchen/temp", {"home/+/temp", "home/#", "+/kitchen/#", "#"}),
+        ("home/kitchen", {"home/+", "home/#", "+/kitchen/#", "#"}),
+        ("home", {"home/#", "#"}),
+        ("home/kitchen/temp/raw", {"home/#", "+/kitchen/#", "#"}),
+        ("$SYS/broker/load", {"$SYS/#"}),
+    ],
+)
+async def test_wildcard_subscription_trie(topic: str, expected: set[str]) -> None:
+    """Test matching and removing subscriptions in the wildcard subscription trie."""
+    trie = _WildcardSubscriptionTrie()
+    job = HassJob(callback(lambda msg: None))
+    subscriptions = [
+        Subscription(sub_topic, False, job)
+        for sub_topic in (
+            "home/+/temp",
+            "home/+",
+            "home/#",
+            "+/kitchen/#",
+            "#",
+            "$SYS/#",
+            "other/+/temp",
+        )
+    ]
+    for subscription in subscriptions:
+        trie.add(subscription)
+
+    assert {subscription.topic for subscription in trie.match(topic)} == expected
+
+    for subscription in subscriptions:
+        trie.remove(subscription)
+    assert trie.match(topic) == []
+    assert getattr(trie, "_root").children == {}
+    with pytest.raises(KeyError):
+        trie.remove(subscriptions[0])
+
+
 async def test_subscribe_same_topic(
     hass: HomeAssistant,
     mock_debouncer: asyncio.Event,
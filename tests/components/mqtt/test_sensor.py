@@ -111,6 +111,46 @@ async def test_setting_sensor_value_via_mqtt_message(
     assert state.attributes.get("unit_of_measurement") == "fav unit"
 
 
+@pytest.mark.parametrize(
+    "hass_config",
+    [
+        {
+            mqtt.DOMAIN: {
+                sensor.DOMAIN: {
+                    "name": "test",
+                    "state_topic": "test-topic",
+                    "coalesce_time": 1,
+                }
+            }
+        }
+    ],
+)
+async def test_setting_sensor_value_with_coalesce_time(
+    hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
+) -> None:
+    """Test only the latest value within the coalesce time is written."""
+    await mqtt_mock_entry()
+    states: list[str] = []
+
+    @callback
+    def _state_changed(event: Event) -> None:
+        states.append(event.data["new_state"].state)
+
+    hass.bus.async_listen("state_changed", _state_changed)
+
+    async_fire_mqtt_message(hass, "test-topic", "100")
+    async_fire_mqtt_message(hass, "test-topic", "110")
+    async_fire_mqtt_message(hass, "test-topic", "120")
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.test").state == STATE_UNKNOWN
+    assert states == []
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.test").state == "120"
+    assert states == ["120"]
+
+
 @pytest.mark.parametrize(
     "hass_config",
     [
@@ -0,0 +1,43 @@
+"""Test the profiler diagnostics."""
+
+from homeassistant.components.profiler import SERVICE_START_JOB_TIMING
+from homeassistant.components.profiler.const import DOMAIN
+from homeassistant.components.profiler.loop_monitor import HISTOGRAM_WINDOW
+from homeassistant.core import Event, HomeAssistant, callback
+
+from tests.common import MockConfigEntry
+from tests.components.diagnostics import get_diagnostics_for_config_entry
+from tests.typing import ClientSessionGenerator
+
+
+async def test_entry_diagnostics(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test the job run time histograms are in the diagnostics."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    await hass.services.async_call(DOMAIN, SERVICE_START_JOB_TIMING, {}, blocking=True)
+
+    @callback
+    def _listener(event: Event) -> None:
+        """Listen for the test event."""
+
+    hass.bus.async_listen("profiler_test_event", _listener)
+    hass.bus.async_fire("profiler_test_event")
+    hass.bus.async_fire("profiler_test_event")
+    await hass.async_block_till_done()
+
+    result = await get_diagnostics_for_config_entry(hass, hass_client, entry)
+
+    histograms = result["histograms"]
+    assert histograms["window"] == HISTOGRAM_WINDOW
+    event_histogram = histograms["event_types"]["profiler_test_event"]["histogram"]
+    assert sum(event_histogram.values()) >= 2
+    assert "homeassistant" in histograms["integrations"]
+    assert "slowest_jobs" in result["loop"]
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
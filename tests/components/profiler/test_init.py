@@ -1,11 +1,12 @@
 """Test the Profiler config flow."""
 
+import asyncio
 from datetime import timedelta
 from functools import lru_cache
 import logging
 import os
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from freezegun.api import FrozenDateTimeFactory
 from lru import LRU
@@ -25,18 +26,29 @@ from homeassistant.components.profiler import (
     SERVICE_MEMORY,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_START,
+    SERVICE_START_JOB_TIMING,
     SERVICE_START_LOG_OBJECT_SOURCES,
     SERVICE_START_LOG_OBJECTS,
+    SERVICE_START_TEMPLATE_PROFILING,
+    SERVICE_STOP_JOB_TIMING,
     SERVICE_STOP_LOG_OBJECT_SOURCES,
     SERVICE_STOP_LOG_OBJECTS,
+    SERVICE_STOP_TEMPLATE_PROFILING,
 )
 from homeassistant.components.profiler.const import DOMAIN
+from homeassistant.components.profiler.loop_monitor import (
+    COROUTINE_JOB_NOTE,
+    LAG_SAMPLE_INTERVAL,
+)
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HassJob, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.entity_component import async_update_entity
+from homeassistant.helpers.template import Template
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.typing import WebSocketGenerator
 
 
 async def test_basic_usage(hass: HomeAssistant, tmp_path: Path) -> None:
@@ -446,3 +458,152 @@ async def test_set_asyncio_debug(
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_template_profiling(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test profiling template renders."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id({"type": "profiler/template_render_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {"running": False, "templates": []}
+
+    with pytest.raises(HomeAssistantError, match="Template profiling not running"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_STOP_TEMPLATE_PROFILING, {}, blocking=True
+        )
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_START_TEMPLATE_PROFILING, {}, blocking=True
+    )
+    with pytest.raises(HomeAssistantError, match="Template profiling already started"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_START_TEMPLATE_PROFILING, {}, blocking=True
+        )
+
+    hass.states.async_set("sensor.test", "1")
+    template = Template("{{ states('sensor.test') }}", hass)
+    template.async_render_to_info()
+    template.async_render_to_info()
+
+    await client.send_json_auto_id({"type": "profiler/template_render_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["running"] is True
+    assert response["result"]["templates"] == [
+        {
+            "template": "{{ states('sensor.test') }}",
+            "renders": 2,
+            "total_time": ANY,
+            "max_time": ANY,
+            "entities": 1,
+            "domains": 0,
+            "all_states": False,
+            "triggers": {},
+        }
+    ]
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_STOP_TEMPLATE_PROFILING, {}, blocking=True
+    )
+    assert "Template render stats for {{ states('sensor.test') }}" in caplog.text
+
+    await client.send_json_auto_id({"type": "profiler/template_render_stats"})
+    response = await client.receive_json()
+    assert response["result"] == {"running": False, "templates": []}
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_loop_monitor(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test measuring the event loop lag and the time spent in jobs."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    calls = []
+
+    @callback
+    def _job_target() -> None:
+        calls.append(None)
+
+    # Jobs are not timed until job timing is started
+    hass.async_run_hass_job(HassJob(_job_target))
+    with pytest.raises(HomeAssistantError, match="Job timing not running"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_STOP_JOB_TIMING, {}, blocking=True
+        )
+
+    await hass.services.async_call(DOMAIN, SERVICE_START_JOB_TIMING, {}, blocking=True)
+    with pytest.raises(HomeAssistantError, match="Job timing already started"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_START_JOB_TIMING, {}, blocking=True
+        )
+
+    hass.async_run_hass_job(HassJob(_job_target))
+    assert calls == [None, None]
+
+    await asyncio.sleep(LAG_SAMPLE_INTERVAL * 2)
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id({"type": "profiler/loop_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert result["samples"] >= 1
+    assert result["lag"]["max"] >= result["lag"]["p50"] >= 0
+    assert result["job_timing"] == {"running": True, "note": COROUTINE_JOB_NOTE}
+    assert {
+        "target": f"{__name__}.test_loop_monitor.<locals>._job_target",
+        "calls": 1,
+        "total_time": ANY,
+        "max_time": ANY,
+    } in result["slowest_jobs"]
+    assert result["integrations"]["homeassistant"] > 0
+
+    await async_update_entity(hass, "sensor.event_loop_lag_maximum")
+    state = hass.states.get("sensor.event_loop_lag_maximum")
+    assert state is not None
+    assert float(state.state) >= 0
+
+    await hass.services.async_call(DOMAIN, SERVICE_STOP_JOB_TIMING, {}, blocking=True)
+    assert (
+        f"Job run time stats for {__name__}.test_loop_monitor.<locals>._job_target"
+        in caplog.text
+    )
+    hass.async_run_hass_job(HassJob(_job_target))
+
+    await client.send_json_auto_id({"type": "profiler/loop_stats"})
+    response = await client.receive_json()
+    result = response["result"]
+    assert result["job_timing"]["running"] is False
+    assert {
+        "target": f"{__name__}.test_loop_monitor.<locals>._job_target",
+        "calls": 1,
+        "total_time": ANY,
+        "max_time": ANY,
+    } in result["slowest_jobs"]
+
+    await hass.services.async_call(DOMAIN, SERVICE_START_JOB_TIMING, {}, blocking=True)
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass._job_timer is None
@@ -360,6 +360,61 @@ async def test_saving_many_states(
         assert db_states[0].event_id is None
 
 
+async def test_saving_states_backlog_batch(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test a backlog of events is pre processed as a batch."""
+    instance = recorder.get_instance(hass)
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+
+    with (
+        patch.object(
+            instance, "_pre_process_events", wraps=instance._pre_process_events
+        ) as pre_process_events,
+        patch.object(
+            StateAttributes,
+            "shared_attrs_bytes_from_event",
+            wraps=StateAttributes.shared_attrs_bytes_from_event,
+        ) as shared_attrs_bytes_from_event,
+    ):
+        await async_block_recorder(hass, 0.1)
+        for idx in range(10):
+            hass.states.async_set(f"test.recorder_{idx}", "on", attributes)
+        await async_wait_recording_done(hass)
+
+    assert pre_process_events.call_count == 1
+    assert len(pre_process_events.call_args[0][0]) >= 10
+    # The attributes are only serialized once for each event
+    assert shared_attrs_bytes_from_event.call_count == 10
+    assert not instance.state_attributes_manager._serialized
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = list(session.query(States))
+        assert len(db_states) == 10
+        assert len({db_state.attributes_id for db_state in db_states}) == 1
+
+
+async def test_saving_states_backlog_batch_pre_process_error(
+    hass: HomeAssistant, setup_recorder: None, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a backlog is still recorded when pre processing the batch fails."""
+    instance = recorder.get_instance(hass)
+
+    with patch.object(
+        instance.state_attributes_manager, "load", side_effect=ValueError("boom")
+    ):
+        await async_block_recorder(hass, 0.1)
+        for idx in range(10):
+            hass.states.async_set(f"test.recorder_{idx}", "on", {"test_attr": 5})
+        await async_wait_recording_done(hass)
+
+    assert "Error while pre processing a batch of events" in caplog.text
+    assert not instance.state_attributes_manager._serialized
+
+    with session_scope(hass=hass, read_only=True) as session:
+        assert len(list(session.query(States))) == 10
+
+
 async def test_saving_state_with_intermixed_time_changes(
     hass: HomeAssistant, setup_recorder: None
 ) -> None:
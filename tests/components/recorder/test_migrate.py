@@ -619,7 +619,7 @@ async def test_schema_migrate(
             "homeassistant.components.recorder.Recorder._process_non_state_changed_event_into_session",
         ),
         patch(
-            "homeassistant.components.recorder.Recorder._pre_process_startup_events",
+            "homeassistant.components.recorder.Recorder._pre_process_events",
         ),
     ):
         await async_setup_recorder_instance(
@@ -206,6 +206,31 @@ async def test_purge_old_states(hass: HomeAssistant, recorder_mock: Recorder) ->
         assert state_attributes.count() == 3
 
 
+async def test_purge_old_states_time_budget(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test a purge cycle stops early when its time budget is exhausted."""
+    await _add_test_states(hass)
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+
+    with (
+        patch.object(recorder_mock, "max_bind_vars", 1),
+        patch("homeassistant.components.recorder.purge.PURGE_CYCLE_TIME_BUDGET", -1),
+    ):
+        finished = purge_old_data(recorder_mock, purge_before, repack=False)
+    assert not finished
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 5
+
+    finished = purge_old_data(recorder_mock, purge_before, repack=False)
+    assert finished
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 2
+
+
 @pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
 @pytest.mark.usefixtures("recorder_mock", "skip_by_db_engine")
 async def test_purge_old_states_encouters_database_corruption(
@@ -1844,6 +1844,61 @@ async def test_monthly_statistics_sum(
     assert stats == {}
 
 
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.parametrize("period", ["day", "week", "month"])
+@pytest.mark.freeze_time("2022-12-01 00:00:00+00:00")
+async def test_statistics_reduced_in_database(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    timezone: str,
+    period: str,
+) -> None:
+    """Test reducing statistics in the database matches reducing them in Python."""
+    await hass.config.async_set_time_zone(timezone)
+    await async_wait_recording_done(hass)
+
+    start = dt_util.as_utc(dt_util.parse_datetime("2022-09-01 00:00:00"))
+    external_statistics = [
+        {
+            "start": start + timedelta(hours=hour),
+            "last_reset": None,
+            "state": hour,
+            "sum": hour * 2,
+            "max": hour % 7,
+            "mean": hour % 5,
+            "min": -(hour % 3),
+        }
+        for hour in range(0, 24 * 80, 5)
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    await async_wait_recording_done(hass)
+
+    start_time = start + timedelta(days=3)
+    end_time = start + timedelta(days=70)
+    for types in (
+        {"last_reset", "max", "mean", "min", "state", "sum"},
+        {"max", "mean", "min"},
+        {"sum"},
+    ):
+        stats = statistics_during_period(
+            hass, start_time, end_time, None, period, None, types
+        )
+        with patch.object(statistics, "MAX_DATABASE_REDUCED_PERIODS", 0):
+            expected_stats = statistics_during_period(
+                hass, start_time, end_time, None, period, None, types
+            )
+        assert stats["test:total_energy_import"]
+        assert stats == expected_stats
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
@@ -19,7 +19,7 @@ from homeassistant.components.websocket_api.auth import (
 )
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.const import EVENT_STATE_CHANGED, SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
@@ -2914,3 +2914,45 @@ async def test_subscribe_entities_chained_state_change(
 
     await websocket_client.close()
     await hass.async_block_till_done()
+
+
+async def test_subscribe_entities_shares_listener(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+) -> None:
+    """Test all subscribe_entities subscriptions share one state_changed listener."""
+    init_count = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+    await websocket_client.send_json(
+        {"id": 8, "type": "subscribe_entities", "entity_ids": ["light.permitted"]}
+    )
+    await websocket_client.send_json(
+        {"id": 9, "type": "subscribe_entities", "entity_ids": ["light.other"]}
+    )
+    for _ in range(6):
+        msg = await websocket_client.receive_json()
+        assert msg["id"] in (7, 8, 9)
+
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == init_count + 1
+
+    hass.states.async_set("light.permitted", "on")
+    received = []
+    for _ in range(2):
+        msg = await websocket_client.receive_json()
+        assert msg["type"] == "event"
+        assert msg["event"] == {
+            "a": {"light.permitted": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}}
+        }
+        received.append(msg["id"])
+    assert sorted(received) == [7, 8]
+
+    for msg_id, subscription in ((10, 7), (11, 8), (12, 9)):
+        await websocket_client.send_json(
+            {"id": msg_id, "type": "unsubscribe_events", "subscription": subscription}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["success"]
+
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == init_count
@@ -11,9 +11,16 @@ import pytest
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, PERCENTAGE, EntityCategory
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_STARTED,
+    EVENT_STATE_CHANGED,
+    PERCENTAGE,
+    EntityCategory,
+)
 from homeassistant.core import (
     CoreState,
+    Event,
+    EventStateChangedData,
     HomeAssistant,
     ServiceCall,
     ServiceResponse,
@@ -263,6 +270,110 @@ async def test_adding_entities_with_generator_and_thread_callback(
     await component.async_add_entities(create_entity(i) for i in range(2))
 
 
+async def test_adding_entities_writes_states_in_one_batch(
+    hass: HomeAssistant,
+) -> None:
+    """Test the initial states of added entities are written in one batch."""
+    batches: list[list[Event[EventStateChangedData]]] = []
+
+    @callback
+    def _capture_batch(events: list[Event[EventStateChangedData]]) -> None:
+        batches.append(events)
+
+    hass.bus.async_listen_batch(EVENT_STATE_CHANGED, _capture_batch)
+    platform = MockEntityPlatform(hass)
+
+    entities = [MockEntity(name=f"Entity {idx}") for idx in range(3)]
+    for idx, entity in enumerate(entities):
+        entity._attr_state = str(idx)
+    await platform.async_add_entities(entities)
+    await hass.async_block_till_done()
+
+    assert len(batches) == 1
+    assert [event.data["entity_id"] for event in batches[0]] == [
+        "test_domain.entity_0",
+        "test_domain.entity_1",
+        "test_domain.entity_2",
+    ]
+    assert hass.states.get("test_domain.entity_2").state == "2"
+
+    # States written after the entities were added are not deferred
+    entity = platform.entities["test_domain.entity_0"]
+    entity._attr_state = "changed"
+    entity.async_write_ha_state()
+    assert hass.states.get("test_domain.entity_0").state == "changed"
+    await hass.async_block_till_done()
+    assert len(batches) == 2
+
+
+async def test_adding_entities_writes_newer_states_directly(
+    hass: HomeAssistant,
+) -> None:
+    """Test only the initial state write is deferred when adding entities."""
+
+    class WritingEntity(MockEntity):
+        """Entity that writes its state while it is added."""
+
+        async def async_added_to_hass(self) -> None:
+            """Write the state before the initial state is written."""
+            self._attr_state = "added"
+            self.async_write_ha_state()
+            assert self.hass.states.get(self.entity_id).state == "added"
+            self._attr_state = "initial"
+
+    class SiblingEntity(MockEntity):
+        """Entity that writes the state of an entity added before it."""
+
+        async def async_added_to_hass(self) -> None:
+            """Write a newer state while the initial state is deferred."""
+            writing_entity._attr_state = "newer"
+            writing_entity.async_write_ha_state()
+
+    states: list[tuple[str, str]] = []
+
+    @callback
+    def _state_changed(event: Event[EventStateChangedData]) -> None:
+        states.append((event.data["entity_id"], event.data["new_state"].state))
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _state_changed)
+    platform = MockEntityPlatform(hass)
+    writing_entity = WritingEntity(name="Writing")
+    sibling_entity = SiblingEntity(name="Sibling")
+    sibling_entity._attr_state = "sibling"
+    await platform.async_add_entities([writing_entity, sibling_entity])
+    await hass.async_block_till_done()
+
+    assert hass.states.get("test_domain.writing").state == "newer"
+    assert hass.states.get("test_domain.sibling").state == "sibling"
+    # The deferred initial state is written before the newer state
+    assert states == [
+        ("test_domain.writing", "added"),
+        ("test_domain.writing", "initial"),
+        ("test_domain.writing", "newer"),
+        ("test_domain.sibling", "sibling"),
+    ]
+
+
+async def test_adding_entities_batch_write_failure(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test states are written one by one if the batch write fails."""
+    platform = MockEntityPlatform(hass)
+    entities = [MockEntity(name=f"Entity {idx}") for idx in range(2)]
+    for idx, entity in enumerate(entities):
+        entity._attr_state = str(idx)
+
+    with patch(
+        "homeassistant.core.StateMachine.async_set_many_internal",
+        side_effect=ValueError("boom"),
+    ):
+        await platform.async_add_entities(entities)
+
+    assert "Error writing the initial states of added entities" in caplog.text
+    assert hass.states.get("test_domain.entity_0").state == "0"
+    assert hass.states.get("test_domain.entity_1").state == "1"
+
+
 @pytest.mark.usefixtures("disable_translations_once")
 async def test_platform_warn_slow_setup(hass: HomeAssistant) -> None:
     """Warn we log when platform setup takes a long time."""
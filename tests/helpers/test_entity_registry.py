@@ -2004,6 +2004,24 @@ async def test_removing_categories(entity_registry: er.EntityRegistry) -> None:
     assert not entry_cleared_scope2.categories
 
 
+async def test_entries_for_platform(entity_registry: er.EntityRegistry) -> None:
+    """Test getting entity entries by platform."""
+    hue_1 = entity_registry.async_get_or_create("light", "hue", "123")
+    hue_2 = entity_registry.async_get_or_create("light", "hue", "456")
+    zha = entity_registry.async_get_or_create("light", "zha", "789")
+
+    assert er.async_entries_for_platform(entity_registry, "hue") == [hue_1, hue_2]
+    assert er.async_entries_for_platform(entity_registry, "zha") == [zha]
+    assert er.async_entries_for_platform(entity_registry, "unknown") == []
+
+    hue_2 = entity_registry.async_update_entity_platform(hue_2.entity_id, "zha")
+    assert er.async_entries_for_platform(entity_registry, "hue") == [hue_1]
+    assert er.async_entries_for_platform(entity_registry, "zha") == [zha, hue_2]
+
+    entity_registry.async_remove(hue_1.entity_id)
+    assert er.async_entries_for_platform(entity_registry, "hue") == []
+
+
 async def test_entries_for_category(entity_registry: er.EntityRegistry) -> None:
     """Test getting entity entries by category."""
     entity_registry.async_get_or_create(
@@ -16,6 +16,7 @@ import pytest
 from homeassistant.const import MATCH_ALL
 import homeassistant.core as ha
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Event,
     EventStateChangedData,
     EventStateReportedData,
@@ -26,6 +27,8 @@ from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    _TRACK_STATE_CHANGE_DATA,
+    TEMPLATE_OFFLOAD_SLOW_RENDERS,
     TrackStates,
     TrackTemplate,
     TrackTemplateResult,
@@ -50,7 +53,12 @@ from homeassistant.helpers.event import (
     async_track_utc_time_change,
     track_point_in_utc_time,
 )
-from homeassistant.helpers.template import Template, result_as_boolean
+from homeassistant.helpers.template import (
+    Template,
+    async_start_render_profiling,
+    async_stop_render_profiling,
+    result_as_boolean,
+)
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
@@ -552,6 +560,52 @@ async def test_async_track_state_change_event_with_empty_list(
     unsub_single()
 
 
+async def test_async_track_state_change_event_unsub_during_dispatch(
+    hass: HomeAssistant,
+) -> None:
+    """Test listeners removed or added while dispatching an event."""
+    calls: list[str] = []
+    unsubs: dict[str, CALLBACK_TYPE] = {}
+
+    @ha.callback
+    def first_listener(event: Event[EventStateChangedData]) -> None:
+        calls.append("first")
+        if "second" in unsubs:
+            unsubs.pop("second")()
+            unsubs["third"] = async_track_state_change_event(
+                hass, "light.bowl", third_listener
+            )
+
+    @ha.callback
+    def second_listener(event: Event[EventStateChangedData]) -> None:
+        calls.append("second")
+
+    @ha.callback
+    def third_listener(event: Event[EventStateChangedData]) -> None:
+        calls.append("third")
+
+    unsubs["first"] = async_track_state_change_event(
+        hass, ["light.bowl", "light.bowl"], first_listener
+    )
+    unsubs["second"] = async_track_state_change_event(
+        hass, "light.bowl", second_listener
+    )
+
+    hass.states.async_set("light.bowl", "on")
+    await hass.async_block_till_done()
+    # The dispatch in progress keeps the listeners it started with
+    assert calls == ["first", "first", "second"]
+
+    calls.clear()
+    hass.states.async_set("light.bowl", "off")
+    await hass.async_block_till_done()
+    assert calls == ["first", "first", "third"]
+
+    unsubs.pop("first")()
+    unsubs.pop("third")()
+    assert _TRACK_STATE_CHANGE_DATA not in hass.data
+
+
 async def test_async_track_state_added_domain(hass: HomeAssistant) -> None:
     """Test async_track_state_added_domain."""
     single_entity_id_tracker = []
@@ -1756,6 +1810,56 @@ async def test_track_template_result_super_template_2_initially_false(
     info3.async_remove()
 
 
+async def test_track_template_result_skips_attribute_only_changes(
+    hass: HomeAssistant,
+) -> None:
+    """Test templates that only read state values skip attribute changes."""
+    hass.states.async_set("sensor.test", "5", {"unit": "W"})
+    template_state = Template("{{ states('sensor.test') }}", hass)
+    template_attr = Template("{{ states.sensor.test.attributes.unit }}", hass)
+    runs = []
+
+    @ha.callback
+    def run_callback(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.extend(updates)
+
+    with patch.object(
+        Template,
+        "async_render_to_info",
+        autospec=True,
+        side_effect=Template.async_render_to_info,
+    ) as mock_render:
+        async_track_template_result(
+            hass,
+            [TrackTemplate(template_state, None), TrackTemplate(template_attr, None)],
+            run_callback,
+        )
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 2
+
+        # Only the attributes change, the state values template is not rendered
+        hass.states.async_set("sensor.test", "5", {"unit": "kW"})
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 3
+        assert [update.template for update in runs] == [template_attr]
+        assert runs[0].result == "kW"
+
+        # The state changes, both templates are rendered
+        hass.states.async_set("sensor.test", "6", {"unit": "kW"})
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 5
+        assert runs[-1].template is template_state
+        assert runs[-1].result == 6
+
+        # A forced update keeps the state but moves last_changed
+        hass.states.async_set("sensor.test", "6", {"unit": "kW"}, force_update=True)
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 7
+
+
 async def test_track_template_result_complex(hass: HomeAssistant) -> None:
     """Test tracking template."""
     specific_runs = []
@@ -1915,6 +2019,99 @@ async def test_track_template_result_complex(hass: HomeAssistant) -> None:
     }
 
 
+async def test_track_template_result_offloaded(hass: HomeAssistant) -> None:
+    """Test slow templates that only read states are rendered in the executor."""
+    template_offload = Template(
+        "{{ states.light | selectattr('state', 'eq', 'on') | list | count }}", hass
+    )
+    template_area = Template(
+        "{{ area_name('light.one') }} {{ states.light | count }}", hass
+    )
+    assert template_offload.offload_safe is True
+    assert template_area.offload_safe is False
+
+    runs = []
+
+    @ha.callback
+    def refresh_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.extend((update.template, update.result) for update in updates)
+
+    hass.states.async_set("light.one", "on")
+    info = async_track_template_result(
+        hass,
+        [
+            TrackTemplate(template_offload, None, 0),
+            TrackTemplate(template_area, None, 0),
+        ],
+        refresh_listener,
+    )
+    await hass.async_block_till_done()
+
+    with patch.object(
+        Template,
+        "render_to_info_with_snapshot",
+        autospec=True,
+        side_effect=Template.render_to_info_with_snapshot,
+    ) as mock_render:
+        # A single slow render does not move the template to the executor
+        with patch("homeassistant.helpers.event.TEMPLATE_OFFLOAD_RENDER_TIME", -1):
+            hass.states.async_set("light.two", "on")
+            await hass.async_block_till_done()
+        hass.states.async_set("light.two", "off")
+        await hass.async_block_till_done()
+        assert runs == [
+            (template_offload, 2),
+            (template_area, "None 2"),
+            (template_offload, 1),
+        ]
+        runs.clear()
+
+        # Slow renders in a row do
+        with patch("homeassistant.helpers.event.TEMPLATE_OFFLOAD_RENDER_TIME", -1):
+            for _ in range(TEMPLATE_OFFLOAD_SLOW_RENDERS):
+                hass.states.async_set(
+                    "light.two",
+                    "off" if hass.states.is_state("light.two", "on") else "on",
+                )
+                await hass.async_block_till_done()
+        assert not mock_render.mock_calls
+        runs.clear()
+
+        hass.states.async_set("light.three", "on")
+        await hass.async_block_till_done()
+
+    assert runs == [(template_area, "None 3"), (template_offload, 3)]
+    assert len(mock_render.mock_calls) == 1
+    assert mock_render.mock_calls[0].args[0] is template_offload
+    assert info.listeners["domains"] == {"light"}
+
+    info.async_remove()
+
+
+async def test_track_template_result_profiled(hass: HomeAssistant) -> None:
+    """Test the source of re-renders is recorded when profiling templates."""
+    template = Template("{{ states('sensor.test') }}", hass)
+    info = async_track_template_result(
+        hass, [TrackTemplate(template, None)], ha.callback(lambda *_: None)
+    )
+    await hass.async_block_till_done()
+
+    async_start_render_profiling(hass)
+    hass.states.async_set("sensor.test", "1")
+    await hass.async_block_till_done()
+    info.async_refresh()
+
+    stats = async_stop_render_profiling(hass)[template.template]
+    assert stats.renders == 2
+    assert stats.entities == 1
+    assert stats.triggers == {"sensor.test": 1, "refresh": 1}
+
+    info.async_remove()
+
+
 async def test_track_template_result_with_wildcard(hass: HomeAssistant) -> None:
     """Test tracking template with a wildcard."""
     specific_runs = []
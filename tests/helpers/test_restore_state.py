@@ -3,9 +3,11 @@
 from collections.abc import Coroutine
 from datetime import datetime, timedelta
 import logging
+from pathlib import Path
 from typing import Any
 from unittest.mock import Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
@@ -32,6 +34,7 @@ from tests.common import (
     MockModule,
     MockPlatform,
     async_fire_time_changed,
+    async_test_home_assistant,
     json_round_trip,
     mock_integration,
     mock_platform,
@@ -358,6 +361,83 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert state1["state"]["state"] == "off"
 
 
+async def test_dump_reuses_unchanged_states(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test unchanged states are dumped with the encoding of the last dump."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b1"
+    await platform.async_add_entities([entity])
+
+    data = async_get(hass)
+    now = dt_util.utcnow()
+    data.last_states = {
+        "input_boolean.b2": StoredState(State("input_boolean.b2", "off"), None, now),
+    }
+
+    async def _async_dump_states() -> list[Any]:
+        with patch(
+            "homeassistant.helpers.restore_state.Store.async_save"
+        ) as mock_write_data:
+            await data.async_dump_states()
+        return mock_write_data.mock_calls[0][1][0]
+
+    hass.states.async_set("input_boolean.b1", "on")
+    first_states = await _async_dump_states()
+    assert len(first_states) == 2
+
+    freezer.tick(timedelta(hours=1))
+    second_states = await _async_dump_states()
+    assert second_states[0] is first_states[0]
+    assert second_states[1] is first_states[1]
+    assert json_round_trip(second_states[0])["last_seen"] == now.isoformat()
+
+    hass.states.async_set("input_boolean.b1", "off")
+    third_states = await _async_dump_states()
+    assert third_states[0] is not first_states[0]
+    assert third_states[1] is first_states[1]
+    assert json_round_trip(third_states[0])["state"]["state"] == "off"
+
+    # The last seen time is refreshed once it lags behind too far
+    freezer.tick(timedelta(days=1))
+    fourth_states = await _async_dump_states()
+    assert fourth_states[0] is not third_states[0]
+    assert fourth_states[1] is first_states[1]
+    last_seen = json_round_trip(fourth_states[0])["last_seen"]
+    assert last_seen == dt_util.utcnow().isoformat()
+
+
+async def test_dump_appends_changed_states(tmp_path: Path) -> None:
+    """Test a dump only appends the changed states to the store log."""
+    async with async_test_home_assistant(config_dir=str(tmp_path)) as hass:
+        data = RestoreStateData(hass)
+        now = dt_util.utcnow()
+        data.last_states = {
+            f"input_boolean.b{idx}": StoredState(
+                State(f"input_boolean.b{idx}", "off"), None, now
+            )
+            for idx in range(3)
+        }
+        await data.async_dump_states()
+
+        data.last_states["input_boolean.b1"] = StoredState(
+            State("input_boolean.b1", "on"), None, now
+        )
+        await data.async_dump_states()
+
+        log = await hass.async_add_executor_job(Path(data.store.log_path).read_bytes)
+        # The log header and a single record replacing the changed state
+        assert log.count(b"\n") == 2
+        assert b'"s":1,"e":2' in log
+
+        stored = await RestoreStateData(hass).store.async_load()
+        assert [item["state"]["state"] for item in stored] == ["off", "on", "off"]
+
+        await hass.async_stop(force=True)
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
@@ -741,6 +741,43 @@ async def test_extract_entity_ids_from_floor(hass: HomeAssistant) -> None:
     )
 
 
+@pytest.mark.usefixtures("floor_area_mock")
+async def test_extract_referenced_entity_ids_cached(hass: HomeAssistant) -> None:
+    """Test resolved targets are cached until a registry is updated."""
+    call = ServiceCall("light", "turn_on", {"floor_id": ["test-floor", "floor-a"]})
+
+    with patch(
+        "homeassistant.helpers.service._async_resolve_registry_targets",
+        wraps=service._async_resolve_registry_targets,
+    ) as mock_resolve:
+        selected = service.async_extract_referenced_entity_ids(hass, call)
+        assert selected.indirectly_referenced == {
+            "light.in_area",
+            "light.assigned_to_area",
+            "light.in_area_a",
+        }
+        assert len(mock_resolve.mock_calls) == 1
+
+        # The result can be modified without affecting the cache
+        selected.indirectly_referenced.clear()
+        call = ServiceCall("light", "turn_on", {"floor_id": ["floor-a", "test-floor"]})
+        selected = service.async_extract_referenced_entity_ids(hass, call)
+        assert selected.indirectly_referenced == {
+            "light.in_area",
+            "light.assigned_to_area",
+            "light.in_area_a",
+        }
+        assert len(mock_resolve.mock_calls) == 1
+
+        hass.bus.async_fire(
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            {"action": "remove", "entity_id": "light.in_area"},
+        )
+        await hass.async_block_till_done()
+        service.async_extract_referenced_entity_ids(hass, call)
+        assert len(mock_resolve.mock_calls) == 2
+
+
 @pytest.mark.usefixtures("label_mock")
 async def test_extract_entity_ids_from_labels(hass: HomeAssistant) -> None:
     """Test extract_entity_ids method with labels."""
@@ -2,8 +2,10 @@
 
 import asyncio
 from datetime import timedelta
+from functools import partial
 import json
 import os
+from pathlib import Path
 from typing import Any, NamedTuple
 from unittest.mock import Mock, patch
 
@@ -20,7 +22,7 @@ from homeassistant.const import (
 from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
-from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
 
@@ -1180,3 +1182,193 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+async def test_append_log_store(tmpdir: py.path.local) -> None:
+    """Test the append log store appends changes and replays them on load."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.AppendLogStore(hass, MOCK_VERSION, MOCK_KEY)
+        load_json = partial(hass.async_add_executor_job, storage.json_util.load_json)
+        log_exists = partial(hass.async_add_executor_job, os.path.exists)
+
+        items = [{"id": str(idx)} for idx in range(5)]
+        await store.async_save({"items": items, "other": []})
+        snapshot = await load_json(store.path)
+        assert snapshot["data"] == {"items": items, "other": []}
+        assert not await log_exists(store.log_path)
+
+        # Changing list items appends to the log and keeps the snapshot
+        items[2] = {"id": "2", "name": "changed"}
+        await store.async_save({"items": items, "other": [1]})
+        items.append({"id": "5"})
+        await store.async_save({"items": items, "other": [1]})
+        assert await load_json(store.path) == snapshot
+        log = await hass.async_add_executor_job(Path(store.log_path).read_bytes)
+        assert log.count(b"\n") == 4
+        assert b'{"c":"items","s":2,"e":3,"i":[{"id":"2","name":"changed"}]}' in log
+
+        # A record that was not fully written is ignored
+        def _append_partial_record() -> None:
+            with open(store.log_path, "ab") as log_file:
+                log_file.write(b'{"c":"items","s":0')
+
+        await hass.async_add_executor_job(_append_partial_record)
+
+        # Loading replays the log into the snapshot
+        store2 = storage.AppendLogStore(hass, MOCK_VERSION, MOCK_KEY)
+        assert await store2.async_load() == {"items": items, "other": [1]}
+        assert (await load_json(store.path))["data"] == {"items": items, "other": [1]}
+        assert not await log_exists(store.log_path)
+
+        # Changing anything besides the lists rewrites the snapshot
+        await store2.async_save({"items": items, "other": [1]})
+        await store2.async_save({"items": items, "other": [2]})
+        assert await log_exists(store.log_path)
+        await store2.async_save({"items": items, "other": [2], "extra": True})
+        assert not await log_exists(store.log_path)
+
+        await hass.async_stop(force=True)
+
+
+async def test_append_log_store_reuses_fragment_digests(
+    tmpdir: py.path.local,
+) -> None:
+    """Test fragments that were already written are not serialized again."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.AppendLogStore(hass, MOCK_VERSION, MOCK_KEY)
+        items = [json_fragment(json_bytes({"id": str(idx)})) for idx in range(5)]
+        await store.async_save(list(items))
+
+        items[2] = json_fragment(json_bytes({"id": "2", "name": "changed"}))
+        with patch.object(
+            storage, "_item_digest", wraps=storage._item_digest
+        ) as item_digest:
+            await store.async_save(list(items))
+        assert item_digest.call_count == 1
+
+        log = await hass.async_add_executor_job(Path(store.log_path).read_bytes)
+        assert log.count(b"\n") == 2
+        assert b'{"c":null,"s":2,"e":3,"i":[{"id":"2","name":"changed"}]}' in log
+
+        store2 = storage.AppendLogStore(hass, MOCK_VERSION, MOCK_KEY)
+        assert await store2.async_load() == [
+            {"id": "0"},
+            {"id": "1"},
+            {"id": "2", "name": "changed"},
+            {"id": "3"},
+            {"id": "4"},
+        ]
+
+        await hass.async_stop(force=True)
+
+
+async def test_append_log_store_remove(tmpdir: py.path.local) -> None:
+    """Test removing the store removes the log."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.AppendLogStore(hass, MOCK_VERSION, MOCK_KEY)
+        path_exists = partial(hass.async_add_executor_job, os.path.exists)
+
+        await store.async_save([{"id": "1"}])
+        await store.async_save([{"id": "1"}, {"id": "2"}])
+        assert await path_exists(store.log_path)
+
+        await store.async_remove()
+        assert not await path_exists(store.path)
+        assert not await path_exists(store.log_path)
+
+        await hass.async_stop(force=True)
+
+
+async def test_append_log_store_compacts_on_shutdown(tmpdir: py.path.local) -> None:
+    """Test the log is folded into the snapshot when shutting down."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.AppendLogStore(hass, MOCK_VERSION, MOCK_KEY)
+        load_json = partial(hass.async_add_executor_job, storage.json_util.load_json)
+        log_exists = partial(hass.async_add_executor_job, os.path.exists)
+
+        await store.async_save([{"id": "1"}])
+        await store.async_save([{"id": "1"}, {"id": "2"}])
+        assert await log_exists(store.log_path)
+
+        # The log is compacted on the final write without any pending data
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        assert not await log_exists(store.log_path)
+        assert (await load_json(store.path))["data"] == [{"id": "1"}, {"id": "2"}]
+
+        # Saves while stopping rewrite the snapshot on the final write
+        await store.async_save([{"id": "1"}])
+        await store.async_save([{"id": "1"}, {"id": "3"}])
+        assert await log_exists(store.log_path)
+        hass.set_state(CoreState.stopping)
+        await store.async_save([{"id": "1"}, {"id": "4"}])
+        hass.set_state(CoreState.final_write)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        assert not await log_exists(store.log_path)
+        assert (await load_json(store.path))["data"] == [{"id": "1"}, {"id": "4"}]
+
+        hass.set_state(CoreState.running)
+        await hass.async_stop(force=True)
+
+
+async def test_append_log_store_replays_copied_log(tmpdir: py.path.local) -> None:
+    """Test a log is replayed after the snapshot and log are copied."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.AppendLogStore(hass, MOCK_VERSION, MOCK_KEY)
+        await store.async_save([{"id": "1"}])
+        await store.async_save([{"id": "1"}, {"id": "2"}])
+
+        # Copying gives the files a new inode and modification time
+        def _copy_files() -> None:
+            for path in (store.path, store.log_path):
+                content = Path(path).read_bytes()
+                os.unlink(path)
+                Path(path).write_bytes(content)
+
+        await hass.async_add_executor_job(_copy_files)
+
+        store2 = storage.AppendLogStore(hass, MOCK_VERSION, MOCK_KEY)
+        assert await store2.async_load() == [{"id": "1"}, {"id": "2"}]
+        assert not await hass.async_add_executor_job(os.path.exists, store.log_path)
+
+        await hass.async_stop(force=True)
+
+
+async def test_append_log_store_keeps_stale_log(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a log that was started for another snapshot is moved aside."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.AppendLogStore(hass, MOCK_VERSION, MOCK_KEY)
+        await store.async_save([{"id": "1"}])
+        await store.async_save([{"id": "1"}, {"id": "2"}])
+        log = await hass.async_add_executor_job(Path(store.log_path).read_bytes)
+
+        # The snapshot is replaced without the log being removed
+        await hass.async_add_executor_job(
+            storage.json_helper.save_json,
+            store.path,
+            {"version": MOCK_VERSION, "key": MOCK_KEY, "data": [{"id": "3"}]},
+        )
+
+        store2 = storage.AppendLogStore(hass, MOCK_VERSION, MOCK_KEY)
+        assert await store2.async_load() == [{"id": "3"}]
+        assert not await hass.async_add_executor_job(os.path.exists, store.log_path)
+        orphaned_path = f"{store.log_path}{storage.APPEND_LOG_ORPHANED_SUFFIX}"
+        assert await hass.async_add_executor_job(Path(orphaned_path).read_bytes) == log
+        assert "does not belong to the stored data" in caplog.text
+
+        await hass.async_stop(force=True)
@@ -13,6 +13,7 @@ from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+from jinja2.sandbox import ImmutableSandboxedEnvironment
 import orjson
 import pytest
 from syrupy import SnapshotAssertion
@@ -5366,6 +5367,35 @@ async def test_template_errors(hass: HomeAssistant) -> None:
         template.Template("{{ utcnow() | random }}", hass).async_render()
 
 
+async def test_render_info_state_values_only(hass: HomeAssistant) -> None:
+    """Test render info tracks if only state values were read."""
+    hass.states.async_set("sensor.test", "23", {"unit_of_measurement": "°C"})
+    hass.states.async_set("sensor.other", "10")
+
+    for template_str in (
+        "{{ states('sensor.test') }}",
+        "{{ states.sensor.test.state }}",
+        "{{ states.sensor.test.last_changed }}",
+        "{{ states.sensor | map(attribute='state') | list }}",
+        "{{ states | count }}",
+        "{{ is_state('sensor.test', '23') }}",
+    ):
+        info = render_to_info(hass, template_str)
+        assert info.state_values_only is True, template_str
+
+    for template_str in (
+        "{{ state_attr('sensor.test', 'unit_of_measurement') }}",
+        "{{ states.sensor.test.attributes }}",
+        "{{ states.sensor.test.last_updated }}",
+        "{{ states.sensor.test.name }}",
+        "{{ states.sensor.test }}",
+        "{{ states.sensor | map(attribute='context') | list }}",
+        "{{ states.sensor.test.state_with_unit }}",
+    ):
+        info = render_to_info(hass, template_str)
+        assert info.state_values_only is False, template_str
+
+
 async def test_state_attributes(hass: HomeAssistant) -> None:
     """Test state attributes."""
     hass.states.async_set("sensor.test", "23")
@@ -6564,3 +6594,48 @@ def test_warn_no_hass(hass: HomeAssistant, caplog: pytest.LogCaptureFixture) ->
     template.Template("blah", hass)
     assert message not in caplog.text
     caplog.clear()
+
+
+async def test_bytecode_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test compiled templates are persisted and reused after a restart."""
+    bytecode_cache = await template.async_load_bytecode_cache(hass)
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+    await bytecode_cache.async_save()
+
+    data = hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]["data"]
+    assert len(data["code"]) == 1
+
+    # Simulate a restart with fresh template environments
+    hass.data.pop(template._ENVIRONMENT)
+    await template.async_load_bytecode_cache(hass)
+    with patch.object(
+        ImmutableSandboxedEnvironment,
+        "compile",
+        autospec=True,
+        side_effect=ImmutableSandboxedEnvironment.compile,
+    ) as mock_compile:
+        assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+    mock_compile.assert_not_called()
+
+
+async def test_bytecode_cache_version_mismatch(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the bytecode cache is discarded when the environment changes."""
+    bytecode_cache = await template.async_load_bytecode_cache(hass)
+    assert template.Template("{{ 2 + 2 }}", hass).async_render() == 4
+    await bytecode_cache.async_save()
+
+    hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]["data"]["environment"] = "old"
+    hass.data.pop(template._ENVIRONMENT)
+    await template.async_load_bytecode_cache(hass)
+    with patch.object(
+        ImmutableSandboxedEnvironment,
+        "compile",
+        autospec=True,
+        side_effect=ImmutableSandboxedEnvironment.compile,
+    ) as mock_compile:
+        assert template.Template("{{ 2 + 2 }}", hass).async_render() == 4
+    assert mock_compile.call_count == 1
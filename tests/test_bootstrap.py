@@ -3,6 +3,7 @@
 import asyncio
 from collections.abc import Generator, Iterable
 import contextlib
+from datetime import timedelta
 import glob
 import logging
 import os
@@ -26,11 +27,13 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.translation import async_translations_loaded
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import Integration
+import homeassistant.util.dt as dt_util
 
 from .common import (
     MockConfigEntry,
     MockModule,
     MockPlatform,
+    async_fire_time_changed,
     get_test_config_dir,
     mock_config_flow,
     mock_integration,
@@ -1373,6 +1376,46 @@ async def test_pre_import_no_requirements(hass: HomeAssistant) -> None:
         assert not integration.requirements
 
 
+@pytest.mark.parametrize("load_registries", [False])
+@patch("homeassistant.bootstrap.DEFAULT_INTEGRATIONS", set())
+async def test_setup_profile_preimports_slowest_integrations(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the integrations that were slowest to set up are imported first."""
+    hass_storage[bootstrap.SETUP_PROFILE_STORAGE_KEY] = {
+        "version": bootstrap.SETUP_PROFILE_STORAGE_VERSION,
+        "minor_version": 1,
+        "key": bootstrap.SETUP_PROFILE_STORAGE_KEY,
+        "data": {"fast": 0.1, "slow": 10.0, "slower": 20.0, "not_setup": 30.0},
+    }
+    for domain in ("fast", "slow", "slower"):
+        mock_integration(hass, MockModule(domain=domain))
+    # Setup timings are only recorded while Home Assistant is starting
+    hass.set_state(CoreState.not_running)
+
+    with patch.object(
+        bootstrap, "_async_preimport_integrations", AsyncMock()
+    ) as mock_preimport:
+        await bootstrap._async_set_up_integrations(
+            hass, {"fast": {}, "slow": {}, "slower": {}}
+        )
+
+    preimported = mock_preimport.call_args[0][0]
+    assert [integration.domain for integration in preimported] == [
+        "slower",
+        "slow",
+        "fast",
+    ]
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=bootstrap.SETUP_PROFILE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    setup_profile = hass_storage[bootstrap.SETUP_PROFILE_STORAGE_KEY]["data"]
+    assert "not_setup" not in setup_profile
+    assert {"fast", "slow", "slower"}.issubset(setup_profile)
+
+
 @pytest.mark.timeout(20)
 async def test_bootstrap_does_not_preload_stage_1_integrations() -> None:
     """Test that the bootstrap does not preload stage 1 integrations.
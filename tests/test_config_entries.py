@@ -1036,6 +1036,59 @@ async def test_forward_entry_sets_up_component(hass: HomeAssistant) -> None:
     assert len(mock_forwarded_setup_entry.mock_calls) == 1
 
 
+async def test_forward_entry_setups_on_demand(
+    hass: HomeAssistant, manager: config_entries.ConfigEntries
+) -> None:
+    """Test platforms are only forwarded on demand once."""
+    light_setup_entry = AsyncMock(return_value=True)
+    switch_setup_entry = AsyncMock(return_value=True)
+
+    async def mock_unload_entry(
+        hass: HomeAssistant, entry: config_entries.ConfigEntry
+    ) -> bool:
+        """Mock unloading an entry."""
+        return await hass.config_entries.async_unload_platforms(
+            entry, entry.forwarded_platforms
+        )
+
+    mock_integration(
+        hass,
+        MockModule(
+            "test",
+            async_setup_entry=AsyncMock(return_value=True),
+            async_unload_entry=mock_unload_entry,
+        ),
+    )
+    mock_platform(hass, "test.light", MockPlatform(async_setup_entry=light_setup_entry))
+    mock_platform(
+        hass, "test.switch", MockPlatform(async_setup_entry=switch_setup_entry)
+    )
+    mock_platform(hass, "test.config_flow", None)
+
+    entry = MockConfigEntry(domain="test")
+    entry.add_to_manager(manager)
+    await manager.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.forwarded_platforms == set()
+
+    await asyncio.gather(
+        manager.async_forward_entry_setups_on_demand(entry, ["light"]),
+        manager.async_forward_entry_setups_on_demand(entry, ["light"]),
+    )
+    assert entry.forwarded_platforms == {"light"}
+    assert len(light_setup_entry.mock_calls) == 1
+    assert len(switch_setup_entry.mock_calls) == 0
+
+    await manager.async_forward_entry_setups_on_demand(entry, ["light", "switch"])
+    assert entry.forwarded_platforms == {"light", "switch"}
+    assert len(light_setup_entry.mock_calls) == 1
+    assert len(switch_setup_entry.mock_calls) == 1
+
+    assert await manager.async_unload(entry.entry_id)
+    assert entry.state is config_entries.ConfigEntryState.NOT_LOADED
+    assert entry.forwarded_platforms == set()
+
+
 async def test_forward_entry_does_not_setup_entry_if_setup_fails(
     hass: HomeAssistant,
 ) -> None:
@@ -225,6 +225,48 @@ async def test_async_run_hass_job_synchronous(hass: HomeAssistant) -> None:
     await task
 
 
+async def test_async_run_hass_job_job_timer(hass: HomeAssistant) -> None:
+    """Test the run time of jobs is reported to the job timer."""
+    timings: list[tuple[ha.HassJob, tuple[Any, ...], float]] = []
+
+    @ha.callback
+    def job_timer(hassjob: ha.HassJob, args: tuple[Any, ...], run_time: float) -> None:
+        timings.append((hassjob, args, run_time))
+
+    calls = []
+
+    @ha.callback
+    def inner(value: int) -> None:
+        calls.append(value)
+
+    inner_job = ha.HassJob(inner)
+
+    @ha.callback
+    def outer(value: int) -> None:
+        hass.async_run_hass_job(inner_job, value + 1)
+        calls.append(value)
+
+    async def coro_job() -> str:
+        return "done"
+
+    outer_job = ha.HassJob(outer)
+    coro_hassjob = ha.HassJob(coro_job)
+
+    hass.async_set_job_timer(job_timer)
+    hass.async_run_hass_job(outer_job, 1)
+    assert await hass.async_run_hass_job(coro_hassjob) == "done"
+    hass.async_set_job_timer(None)
+    hass.async_run_hass_job(outer_job, 3)
+
+    assert calls == [2, 1, 4, 3]
+    assert [(hassjob, args) for hassjob, args, _ in timings] == [
+        (inner_job, (2,)),
+        (outer_job, (1,)),
+        (coro_hassjob, ()),
+    ]
+    assert all(run_time >= 0 for _, _, run_time in timings)
+
+
 async def test_async_add_hass_job_coro_named(hass: HomeAssistant) -> None:
     """Test that we schedule coroutines and add jobs to the job pool with a name."""
 
@@ -359,6 +401,7 @@ async def test_async_create_task_schedule_coroutine_with_name() -> None:
 async def test_async_run_eager_hass_job_calls_callback() -> None:
     """Test that the callback annotation is respected."""
     hass = MagicMock()
+    hass._job_timer = None
     calls = []
 
     def job():
@@ -372,6 +415,7 @@ async def test_async_run_eager_hass_job_calls_callback() -> None:
 async def test_async_run_eager_hass_job_calls_coro_function() -> None:
     """Test running coros from async_run_hass_job with eager_start."""
     hass = MagicMock()
+    hass._job_timer = None
 
     async def job():
         pass
@@ -383,6 +427,7 @@ async def test_async_run_eager_hass_job_calls_coro_function() -> None:
 async def test_async_run_hass_job_calls_callback() -> None:
     """Test that the callback annotation is respected."""
     hass = MagicMock()
+    hass._job_timer = None
     calls = []
 
     def job():
@@ -396,6 +441,7 @@ async def test_async_run_hass_job_calls_callback() -> None:
 async def test_async_run_hass_job_delegates_non_async() -> None:
     """Test that the callback annotation is respected."""
     hass = MagicMock()
+    hass._job_timer = None
     calls = []
 
     def job():
@@ -1169,6 +1215,69 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_batch_listener(hass: HomeAssistant) -> None:
+    """Test batch listeners receive fired events as a list."""
+    batches: list[list[ha.Event]] = []
+    single: list[ha.Event] = []
+
+    @ha.callback
+    def batch_listener(events: list[ha.Event]) -> None:
+        """Mock batch listener."""
+        batches.append(events)
+
+    @ha.callback
+    def listener(event: ha.Event) -> None:
+        """Mock listener."""
+        single.append(event)
+
+    @ha.callback
+    def mock_filter(event_data):
+        """Mock filter."""
+        return not event_data["filtered"]
+
+    unsub_batch = hass.bus.async_listen_batch(
+        "test", batch_listener, event_filter=mock_filter
+    )
+    unsub = hass.bus.async_listen("test", listener)
+    assert hass.bus.async_listeners()["test"] == 2
+
+    hass.bus.async_fire("test", {"filtered": False})
+    await hass.async_block_till_done()
+    assert len(batches) == 1
+    assert len(batches[0]) == 1
+    assert batches[0][0] is single[0]
+
+    hass.bus.async_fire_batch_internal(
+        "test",
+        [
+            ({"filtered": False, "n": 1}, None, None),
+            ({"filtered": True, "n": 2}, None, None),
+            ({"filtered": False, "n": 3}, None, None),
+        ],
+    )
+    await hass.async_block_till_done()
+    assert len(single) == 4
+    assert len(batches) == 2
+    assert [event.data["n"] for event in batches[1]] == [1, 3]
+
+    hass.bus.async_fire_batch_internal("test", [({"filtered": True}, None, None)])
+    await hass.async_block_till_done()
+    assert len(batches) == 2
+
+    unsub_batch()
+    unsub()
+    assert "test" not in hass.bus.async_listeners()
+
+    # Should do nothing now
+    unsub_batch()
+
+
+async def test_eventbus_batch_listener_match_all(hass: HomeAssistant) -> None:
+    """Test batch listeners cannot listen to all events."""
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_batch(MATCH_ALL, ha.callback(lambda events: None))
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1544,6 +1653,74 @@ async def test_statemachine_force_update(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test setting many states fires state_changed as a batch."""
+    hass.states.async_set("light.bowl", "on", {})
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    batches: list[list[ha.Event]] = []
+
+    @ha.callback
+    def batch_listener(events: list[ha.Event]) -> None:
+        """Mock batch listener."""
+        # All states are written before the listener is called
+        assert hass.states.get("light.kitchen") is not None
+        batches.append(events)
+
+    hass.bus.async_listen_batch(EVENT_STATE_CHANGED, batch_listener)
+
+    now = time.time()
+    hass.states.async_set_many_internal(
+        [
+            ("light.bowl", "on", {}, False, None, None, now),
+            ("light.porch", "off", {"brightness": 0}, False, None, None, now),
+            ("light.kitchen", "on", None, False, None, None, now),
+        ]
+    )
+    await hass.async_block_till_done()
+
+    # light.bowl did not change, so only a state_reported event is fired
+    assert len(events) == 2
+    assert len(batches) == 1
+    assert [event.data["entity_id"] for event in batches[0]] == [
+        "light.porch",
+        "light.kitchen",
+    ]
+    assert batches[0][0].data["old_state"] is None
+    assert batches[0][0].data["new_state"].attributes == {"brightness": 0}
+    assert hass.states.get("light.porch").state == "off"
+
+
+async def test_statemachine_shares_string_list_attributes(
+    hass: HomeAssistant,
+) -> None:
+    """Test identical lists of strings are shared between states."""
+    hass.states.async_set("select.one", "a", {"options": ["a", "b"], "other": [1]})
+    hass.states.async_set("select.two", "b", {"options": ["a", "b"], "other": [1]})
+    hass.states.async_set("select.three", "c", {"options": ["a", "c"]})
+
+    one = hass.states.get("select.one")
+    two = hass.states.get("select.two")
+    three = hass.states.get("select.three")
+    assert one.attributes["options"] == ["a", "b"]
+    assert one.attributes["options"] is two.attributes["options"]
+    assert one.attributes["other"] is not two.attributes["other"]
+    assert three.attributes["options"] == ["a", "c"]
+
+    assert type(one.attributes["options"]) is list
+
+    # A shared list modified in place is no longer handed out
+    one.attributes["options"].append("c")
+    hass.states.async_set("select.four", "a", {"options": ["a", "b"]})
+    assert hass.states.get("select.four").attributes["options"] == ["a", "b"]
+
+    hass.states.async_set("sensor.one", "1", {"unit": ["a", "b"]})
+    hass.states.async_set("sensor.two", "2", {"unit": ["a", "b"]})
+    assert (
+        hass.states.get("sensor.one").attributes["unit"]
+        is not hass.states.get("sensor.two").attributes["unit"]
+    )
+
+
 async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> None:
     """Test async_set avoids recreating ReadOnly dicts when possible."""
     attrs = {"some_attr": "attr_value"}